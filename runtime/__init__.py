@@ -4,28 +4,90 @@ This package turns a validated `employee.md` contract from a piece of
 documentation into something an agent can actually execute against:
 
   - `Employee.from_file("employee.md")` loads + validates the contract.
-  - `.system_prompt()` returns an LLM-ready system prompt string.
+  - `.system_prompt()` returns an LLM-ready system prompt string
+    (rendered once; `.prompt_size()` estimates its token cost).
   - `.is_action_allowed(action)` checks the action against `guardrails`.
   - `.is_in_scope(text)` checks a task description against `scope`.
   - `.budget` is a `BudgetTracker` you call `.try_spend(amount)` on; it
     raises `BudgetExceeded` when `economy.budget_limit` is exhausted.
+    `ShardedBudgetTracker` / `AsyncBudgetTracker` are drop-in variants for
+    heavily threaded and asyncio agents, and a `BudgetLedger` shares one
+    limit across every local worker process.
+  - `.view` is the compact `ContractView` the accessors read; load with
+    `keep_data=False` to drop the raw YAML tree once it is built.
+  - `EmployeeRegistry(directory)` serves many contracts by agent id and
+    hot-reloads only the files that changed.
+  - `await Employee.aload(path)` / `await registry.areload()` keep loading
+    off the event loop (see `AsyncLoader`).
 
 It depends only on `tooling` (the existing validator) and PyYAML, so it
 ships with the same install as the validator itself.
 """
 
-from .employee import (
-    Employee,
-    BudgetTracker,
-    BudgetExceeded,
-    ContractError,
-    ScopeDecision,
-)
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    from .aio import AsyncLoader
+    from .budget import AsyncBudgetTracker, ShardedBudgetTracker
+    from .compact import ContractView
+    from .employee import (
+        BudgetExceeded,
+        BudgetTracker,
+        ContractError,
+        Employee,
+        PromptSize,
+        ScopeDecision,
+    )
+    from .ledger import BudgetLedger, LedgerError
+    from .registry import EmployeeRegistry, ReloadReport
+
+# Public name -> submodule that defines it, imported on first access (PEP
+# 562) so e.g. `from runtime import Employee` does not load asyncio or
+# sqlite3 for the registry and the ledger.
+_EXPORTS: Dict[str, str] = {
+    "Employee": "employee",
+    "BudgetTracker": "employee",
+    "BudgetExceeded": "employee",
+    "ContractError": "employee",
+    "PromptSize": "employee",
+    "ScopeDecision": "employee",
+    "ContractView": "compact",
+    "ShardedBudgetTracker": "budget",
+    "AsyncBudgetTracker": "budget",
+    "BudgetLedger": "ledger",
+    "LedgerError": "ledger",
+    "EmployeeRegistry": "registry",
+    "ReloadReport": "registry",
+    "AsyncLoader": "aio",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     "Employee",
     "BudgetTracker",
     "BudgetExceeded",
     "ContractError",
+    "PromptSize",
     "ScopeDecision",
+    "ContractView",
+    "ShardedBudgetTracker",
+    "AsyncBudgetTracker",
+    "BudgetLedger",
+    "LedgerError",
+    "EmployeeRegistry",
+    "ReloadReport",
+    "AsyncLoader",
 ]
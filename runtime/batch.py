@@ -0,0 +1,65 @@
+"""Fan a batch of guardrail / scope checks out over worker processes.
+
+The compiled matchers are pure Python, so threads would serialise on the
+GIL; large batches are split into chunks and decided in a process pool
+instead. Each worker receives the matcher once, through the pool
+initializer, and then only the chunks of text travel between processes.
+"""
+
+from __future__ import annotations
+
+import os
+from itertools import chain
+from typing import Any, Optional, Sequence
+
+# Below this many items the cost of starting a pool outweighs the work.
+MIN_PARALLEL_BATCH = 20_000
+CHUNKS_PER_WORKER = 4
+
+_worker_matcher: Any = None
+
+
+def _install(matcher: Any) -> None:
+    global _worker_matcher
+    _worker_matcher = matcher
+
+
+def _run_chunk(method: str, chunk: Sequence[str]) -> list:
+    return getattr(_worker_matcher, method)(chunk)
+
+
+def run_batch(
+    matcher: Any,
+    method: str,
+    items: Sequence[str],
+    workers: Optional[int] = None,
+) -> list:
+    """Call `matcher.<method>(items)`, across `workers` processes if worthwhile.
+
+    Args:
+        matcher: A compiled matcher (`GuardrailMatcher` / `ScopeMatcher`)
+        method: Its batch method name (`blocks_many` / `first_matches`)
+        items: Texts to decide
+        workers: Process count; None or 1 decides in the calling process,
+            0 uses one process per CPU
+
+    Returns:
+        One result per item, in input order
+    """
+    if workers == 0:
+        workers = os.cpu_count() or 1
+    if not workers or workers < 2 or len(items) < MIN_PARALLEL_BATCH:
+        return getattr(matcher, method)(items)
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    # Decide each distinct item once, then fan the answers back out.
+    distinct = list(dict.fromkeys(items))
+    size = -(-len(distinct) // (workers * CHUNKS_PER_WORKER))
+    chunks = [distinct[i : i + size] for i in range(0, len(distinct), size)]
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_install, initargs=(matcher,)
+    ) as pool:
+        results = pool.map(_run_chunk, [method] * len(chunks), chunks)
+        decided = dict(zip(distinct, chain.from_iterable(results)))
+    return [decided[item] for item in items]
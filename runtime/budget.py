@@ -0,0 +1,225 @@
+"""Budget trackers for high-contention spend accounting.
+
+`BudgetTracker` serialises every reservation through one lock. That is fine
+for a handful of threads but becomes a hotspot when hundreds of workers of
+one agent report micro-spends. `ShardedBudgetTracker` keeps the same
+contract — a spend is refused exactly when it would push the total past the
+limit — while letting threads spend from local shards:
+
+  - Each thread is assigned a shard. A shard spends from a *lease*, a slice
+    of the budget granted to it by the central pool, under its own lock.
+  - When a lease runs dry the shard tops it up from the pool (one global
+    lock acquisition per lease, not per spend).
+  - If the pool itself is exhausted, the unspent leases of all other shards
+    are reclaimed before refusing, so a spend is only denied when the
+    budget is really gone.
+
+The sum of all leases never exceeds the limit, so the ceiling holds at all
+times. `AsyncBudgetTracker` puts a coroutine API in front of either
+tracker for asyncio code.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import threading
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Union
+
+from .employee import BudgetExceeded, BudgetTracker
+
+if TYPE_CHECKING:
+    from .aio import AsyncLoader
+
+DEFAULT_SHARDS = 16
+# Default lease: this fraction of the limit per top-up.
+DEFAULT_LEASE_FRACTION = 1 / 64
+
+
+class _Shard:
+    __slots__ = ("lock", "balance", "used")
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.balance = 0.0  # leased from the pool, not yet spent
+        self.used = 0.0
+
+
+class ShardedBudgetTracker:
+    """Drop-in, low-contention alternative to `BudgetTracker`.
+
+    Swap it in for a contract whose budget is hammered by many threads:
+
+        >>> emp.budget = ShardedBudgetTracker(emp.budget.limit, emp.budget.currency)
+
+    `spent` and `remaining()` sum the shards without taking any lock, so
+    under concurrent spending they are a snapshot, not a linearizable read.
+    Totals are summed per shard and can differ from `BudgetTracker` by
+    floating-point rounding.
+    """
+
+    def __init__(
+        self,
+        limit: Optional[float],
+        currency: str = "USD",
+        *,
+        shards: int = DEFAULT_SHARDS,
+        lease: Optional[float] = None,
+    ) -> None:
+        if shards < 1:
+            raise ValueError("shards must be at least 1.")
+        self._limit: Optional[float] = (
+            float(limit) if isinstance(limit, (int, float)) and limit >= 0 else None
+        )
+        self.currency = currency
+        self._lease = (
+            float(lease)
+            if lease is not None
+            else (self._limit or 0.0) * DEFAULT_LEASE_FRACTION
+        )
+        self._shards: List[_Shard] = [_Shard() for _ in range(shards)]
+        self._lock = threading.Lock()  # guards _leased and lease changes
+        self._leased = 0.0  # sum of balance + used over all shards
+        self._local = threading.local()
+        self._next_shard = itertools.count()
+
+    @property
+    def limit(self) -> Optional[float]:
+        return self._limit
+
+    @property
+    def spent(self) -> float:
+        return sum(shard.used for shard in self._shards)
+
+    def remaining(self) -> Optional[float]:
+        if self._limit is None:
+            return None
+        return max(0.0, self._limit - self.spent)
+
+    def _assign_shard(self) -> _Shard:
+        shard = self._shards[next(self._next_shard) % len(self._shards)]
+        self._local.shard = shard
+        return shard
+
+    def try_spend(self, amount: float) -> bool:
+        """Atomically reserve `amount`. Raises BudgetExceeded if it would
+        push past the configured limit.
+
+        Returns True on success. If no limit is configured, always returns
+        True (the tracker is informational only).
+        """
+        if amount < 0:
+            raise ValueError("Cannot spend a negative amount.")
+        try:
+            shard = self._local.shard
+        except AttributeError:
+            shard = self._assign_shard()
+        limit = self._limit
+        with shard.lock:
+            if limit is None:
+                shard.used += amount
+                return True
+            if amount <= shard.balance:
+                shard.balance -= amount
+                shard.used += amount
+                return True
+        return self._spend_with_top_up(shard, amount, limit)
+
+    def _spend_with_top_up(self, shard: _Shard, amount: float, limit: float) -> bool:
+        with self._lock:
+            with shard.lock:
+                need = amount - shard.balance
+                if need > 0:
+                    available = limit - self._leased
+                    if available < need:
+                        self._reclaim(shard)
+                        available = limit - self._leased
+                    if available < need:
+                        raise BudgetExceeded(amount, self.spent, limit)
+                    grant = min(max(need, self._lease), available)
+                    shard.balance += grant
+                    self._leased += grant
+                shard.balance -= amount
+                shard.used += amount
+                return True
+
+    def _reclaim(self, keep: _Shard) -> None:
+        """Return every other shard's unspent lease to the pool.
+
+        Called with the pool lock and `keep`'s lock held; lock order is
+        always pool first, then shards.
+        """
+        for other in self._shards:
+            if other is keep:
+                continue
+            with other.lock:
+                self._leased -= other.balance
+                other.balance = 0.0
+
+    def reset(self) -> None:
+        with self._lock:
+            for shard in self._shards:
+                with shard.lock:
+                    shard.balance = 0.0
+                    shard.used = 0.0
+            self._leased = 0.0
+
+
+class AsyncBudgetTracker:
+    """Coroutine front end for a budget tracker.
+
+    All tasks of an event loop run on the loop's thread, so with a
+    `ShardedBudgetTracker` (the default) they share one shard and never
+    contend with each other; worker threads that spend from the same
+    tracker use their own shards. In-memory trackers only hold a lock for a
+    few arithmetic operations, so their calls run on the loop directly.
+
+    A ledger-backed `BudgetTracker` does SQLite I/O and may wait up to the
+    ledger's busy timeout for another process, so `try_spend` and `reset`
+    run on an executor instead: `loader.offload` when an `AsyncLoader` is
+    given, the loop's default executor otherwise. `spent` and `remaining()`
+    are plain reads and still query the ledger on the calling thread.
+    """
+
+    def __init__(
+        self,
+        tracker: Union[BudgetTracker, ShardedBudgetTracker, None] = None,
+        *,
+        limit: Optional[float] = None,
+        currency: str = "USD",
+        loader: Optional[AsyncLoader] = None,
+    ) -> None:
+        self.tracker = (
+            tracker if tracker is not None else ShardedBudgetTracker(limit, currency)
+        )
+        self.loader = loader
+        self._blocking = getattr(self.tracker, "ledger", None) is not None
+
+    @property
+    def limit(self) -> Optional[float]:
+        return self.tracker.limit
+
+    @property
+    def currency(self) -> str:
+        return self.tracker.currency
+
+    @property
+    def spent(self) -> float:
+        return self.tracker.spent
+
+    def remaining(self) -> Optional[float]:
+        return self.tracker.remaining()
+
+    async def _call(self, fn: Callable[..., Any], *args: Any) -> Any:
+        if not self._blocking:
+            return fn(*args)
+        if self.loader is not None:
+            return await self.loader.offload(fn, *args)
+        return await asyncio.get_running_loop().run_in_executor(None, fn, *args)
+
+    async def try_spend(self, amount: float) -> bool:
+        """Reserve `amount`; raises BudgetExceeded past the limit."""
+        return bool(await self._call(self.tracker.try_spend, amount))
+
+    async def reset(self) -> None:
+        await self._call(self.tracker.reset)
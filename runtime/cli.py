@@ -4,12 +4,14 @@ Usage:
     employee-runtime <file>                       # print system prompt
     employee-runtime <file> --check-action TEXT   # check a guardrail
     employee-runtime <file> --check-scope TEXT    # check a scope decision
+    employee-runtime <file> --check-scope-file F  # one task per line -> NDJSON
     employee-runtime <file> --json                # machine-readable summary
 
 Exit codes:
     0  success
     1  contract is invalid / file not found
-    2  guardrail / scope check denied (when used with --check-action / --check-scope)
+    2  guardrail / scope check denied (when used with --check-action / --check-scope;
+       with --check-scope-file, when any task is out of scope)
 """
 
 from __future__ import annotations
@@ -52,6 +54,15 @@ def _build_parser() -> argparse.ArgumentParser:
         metavar="TEXT",
         help="Check whether TEXT is in scope. Exits 2 on out-of-scope.",
     )
+    g.add_argument(
+        "--check-scope-file",
+        metavar="FILE",
+        type=Path,
+        help=(
+            "Check every non-blank line of FILE ('-' for stdin) as a task and "
+            "print one JSON object per line. Exits 2 if any task is out of scope."
+        ),
+    )
     g.add_argument(
         "--summary",
         action="store_true",
@@ -67,6 +78,15 @@ def _build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Skip schema validation (use only when the file is known-good).",
     )
+    p.add_argument(
+        "--workers",
+        type=int,
+        metavar="N",
+        help=(
+            "Worker processes for --check-scope-file on very large inputs "
+            "(0 = one per CPU; default: decide in-process)."
+        ),
+    )
     return p
 
 
@@ -122,6 +142,9 @@ def main(argv: Optional[List[str]] = None) -> int:
         )
         return 0 if decision.in_scope else 2
 
+    if args.check_scope_file:
+        return _check_scope_file(emp, args.check_scope_file, args.workers)
+
     if args.summary:
         _emit(
             {
@@ -158,5 +181,37 @@ def main(argv: Optional[List[str]] = None) -> int:
     return 0
 
 
+def _check_scope_file(emp: Employee, path: Path, workers: Optional[int]) -> int:
+    try:
+        if str(path) == "-":
+            lines = sys.stdin.read().splitlines()
+        else:
+            lines = path.read_text(encoding="utf-8").splitlines()
+    except OSError as exc:
+        msg = f"cannot read {path}: {exc.strerror or exc}"
+        sys.stdout.write(json.dumps({"ok": False, "error": msg}) + "\n")
+        return 1
+
+    numbered = [(n, line.strip()) for n, line in enumerate(lines, 1) if line.strip()]
+    decisions = emp.classify_many([task for _, task in numbered], workers=workers)
+    out = sys.stdout
+    denied = False
+    for (n, task), decision in zip(numbered, decisions):
+        denied = denied or not decision.in_scope
+        out.write(
+            json.dumps(
+                {
+                    "line": n,
+                    "task": task,
+                    "in_scope": decision.in_scope,
+                    "matched": decision.matched,
+                    "reason": decision.reason,
+                }
+            )
+            + "\n"
+        )
+    return 2 if denied else 0
+
+
 if __name__ == "__main__":  # pragma: no cover
     sys.exit(main())
@@ -0,0 +1,177 @@
+"""Compact, immutable view of the runtime-relevant parts of a contract.
+
+The parsed YAML tree of a contract carries everything — knowledge base,
+performance targets, free-text notes — while an agent runtime only ever
+reads a few dozen fields of it. `ContractView` extracts those fields once,
+at load time, into a `__slots__` object of strings and tuples:
+
+  - accessors become attribute reads instead of `.get(...) or {}` chains;
+  - strings are interned, so the status / currency / level / model values
+    and guardrail or scope phrases repeated across thousands of contracts
+    are stored once per process;
+  - the raw tree can then be dropped (`Employee.from_file(...,
+    keep_data=False)`) and is re-read from its source only when asked for.
+"""
+
+from __future__ import annotations
+
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+
+
+def _as_list(value: Any) -> List[str]:
+    """Coerce a YAML field that might be missing / scalar / list into a list of strings."""
+    if value is None:
+        return []
+    if isinstance(value, str):
+        return [value]
+    if isinstance(value, (list, tuple)):
+        return [str(v) for v in value if v is not None]
+    return [str(value)]
+
+
+def _intern(value: Any) -> Any:
+    return sys.intern(value) if type(value) is str else value
+
+
+def _strings(value: Any) -> Tuple[str, ...]:
+    return tuple(sys.intern(item) for item in _as_list(value))
+
+
+class ContractView:
+    """The fields `Employee` reads at execution time, extracted once.
+
+    Values keep the exact semantics of the accessors they replace (e.g.
+    `status` falls back to "unknown", `budget_limit` honours an explicit 0).
+    Instances are immutable; build a new one from the tree to change them.
+    """
+
+    __slots__ = (
+        "agent_id",
+        "display_name",
+        "title",
+        "level",
+        "status",
+        "purpose",
+        "objectives",
+        "success_criteria",
+        "in_scope",
+        "out_of_scope",
+        "prohibited_actions",
+        "escalation",
+        "has_economy",
+        "budget_limit",
+        "currency",
+        "model_preference",
+    )
+
+    agent_id: Optional[str]
+    display_name: str
+    title: str
+    level: Any
+    status: str
+    purpose: Optional[str]
+    objectives: Tuple[str, ...]
+    success_criteria: Tuple[str, ...]
+    in_scope: Tuple[str, ...]
+    out_of_scope: Tuple[str, ...]
+    prohibited_actions: Tuple[str, ...]
+    escalation: bool
+    has_economy: bool
+    budget_limit: Any
+    currency: str
+    model_preference: Any
+
+    def __init__(self, data: Dict[str, Any]) -> None:
+        identity = data.get("identity") or {}
+        role = data["role"]
+        lifecycle = data["lifecycle"]
+        mission = data.get("mission") or {}
+        scope = data.get("scope") or {}
+        guardrails = data.get("guardrails") or {}
+        economy = data.get("economy") or {}
+        ai = data.get("ai_settings") or {}
+
+        # Use `in` checks (not falsy `or`) so an explicit `budget_limit: 0`
+        # is honoured as a real cap rather than treated as "unlimited".
+        if "budget_limit" in economy:
+            limit = economy.get("budget_limit")
+        elif "max_spend_per_task" in economy:
+            limit = economy.get("max_spend_per_task")
+        else:
+            limit = None
+
+        fields = {
+            "agent_id": _intern(identity.get("agent_id")),
+            "display_name": sys.intern(
+                str(
+                    identity.get("display_name")
+                    or identity.get("agent_id")
+                    or role.get("title")
+                    or "agent"
+                )
+            ),
+            "title": sys.intern(str(role.get("title") or "agent")),
+            "level": _intern(role.get("level")),
+            "status": sys.intern(str(lifecycle.get("status") or "unknown")),
+            "purpose": str(mission["purpose"]).strip() if mission.get("purpose") else None,
+            "objectives": _strings(mission.get("objectives")),
+            "success_criteria": _strings(mission.get("success_criteria")),
+            "in_scope": _strings(scope.get("in_scope")),
+            "out_of_scope": _strings(scope.get("out_of_scope")),
+            "prohibited_actions": _strings(guardrails.get("prohibited_actions")),
+            "escalation": bool(
+                guardrails.get("escalation_required") or guardrails.get("human_review")
+            ),
+            "has_economy": bool(economy),
+            "budget_limit": limit,
+            "currency": sys.intern(str(economy.get("currency") or "USD")),
+            "model_preference": _intern(ai.get("model_preference")),
+        }
+        for name, value in fields.items():
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self) -> Any:
+        # Rebuilt slot by slot; __setattr__ is off limits after __init__.
+        return (_restore, (tuple(getattr(self, name) for name in self.__slots__),))
+
+
+def _restore(values: Tuple[Any, ...]) -> ContractView:
+    view = ContractView.__new__(ContractView)
+    for name, value in zip(ContractView.__slots__, values):
+        object.__setattr__(view, name, _intern(value))
+    return view
+
+
+def deep_sizeof(obj: Any) -> int:
+    """Approximate bytes held by `obj` and everything it references.
+
+    Follows dicts, lists, tuples, sets and `__slots__` objects; objects
+    reachable twice (or interned strings shared with others) count once
+    per call.
+    """
+    seen = set()
+    total = 0
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        total += sys.getsizeof(item)
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+        elif hasattr(type(item), "__slots__"):
+            stack.extend(
+                getattr(item, name) for name in type(item).__slots__ if hasattr(item, name)
+            )
+    return total
@@ -18,14 +18,55 @@ otherwise has to re-implement on top of the YAML schema.
 
 from __future__ import annotations
 
+import errno
+import os
 from dataclasses import dataclass
 from pathlib import Path
 from threading import Lock
-from typing import Any, Dict, List, Optional, Union
-
-import yaml
-
-from tooling import EmployeeValidationOrchestrator, ValidationResult
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from tooling import (
+    EmployeeValidationOrchestrator,
+    SecureYAMLParser,
+    ValidationResult,
+    YAMLErrorContext,
+)
+
+from .batch import run_batch
+from .compact import ContractView, deep_sizeof
+from .guardrails import GuardrailMatcher
+from .scope import ScopeMatcher
+
+if TYPE_CHECKING:
+    from .aio import AsyncLoader
+    from .ledger import BudgetLedger
+
+T = TypeVar("T")
+
+_parser = SecureYAMLParser()
+_orchestrator: Optional[EmployeeValidationOrchestrator] = None
+_orchestrator_lock = Lock()
+
+
+def _get_orchestrator() -> EmployeeValidationOrchestrator:
+    """One warm orchestrator shared by every load (validators are stateless)."""
+    global _orchestrator
+    with _orchestrator_lock:
+        if _orchestrator is None:
+            _orchestrator = EmployeeValidationOrchestrator(use_cache=False)
+        return _orchestrator
 
 
 class ContractError(ValueError):
@@ -45,6 +86,22 @@ class BudgetExceeded(RuntimeError):
         )
 
 
+@dataclass(frozen=True)
+class PromptSize:
+    """Size of the rendered system prompt, for context-window budgeting.
+
+    `tokens` is an estimate (about four characters per token for English
+    text with the common BPE tokenizers), not an exact count.
+    """
+
+    chars: int
+    bytes: int
+    tokens: int
+
+
+_CHARS_PER_TOKEN = 4
+
+
 @dataclass(frozen=True)
 class ScopeDecision:
     """The result of an `Employee.is_in_scope(text)` check."""
@@ -60,15 +117,26 @@ class BudgetTracker:
     The tracker is best-effort: it enforces the limit *if* one is declared in
     the contract. If `economy.budget_limit` is missing or non-numeric, every
     `try_spend` returns True and `remaining` returns `None`.
+
+    By default the running total lives in this process. Pass a
+    `runtime.ledger.BudgetLedger` to share it with every local process that
+    opens the same ledger, so a worker pool enforces one limit together.
     """
 
-    def __init__(self, limit: Optional[float], currency: str = "USD") -> None:
+    def __init__(
+        self,
+        limit: Optional[float],
+        currency: str = "USD",
+        *,
+        ledger: Optional[BudgetLedger] = None,
+    ) -> None:
         self._limit: Optional[float] = (
             float(limit) if isinstance(limit, (int, float)) and limit >= 0 else None
         )
         self._spent: float = 0.0
         self._lock = Lock()
         self.currency = currency
+        self.ledger = ledger
 
     @property
     def limit(self) -> Optional[float]:
@@ -76,14 +144,15 @@ class BudgetTracker:
 
     @property
     def spent(self) -> float:
+        if self.ledger is not None:
+            return self.ledger.spent()
         with self._lock:
             return self._spent
 
     def remaining(self) -> Optional[float]:
         if self._limit is None:
             return None
-        with self._lock:
-            return max(0.0, self._limit - self._spent)
+        return max(0.0, self._limit - self.spent)
 
     def try_spend(self, amount: float) -> bool:
         """Atomically reserve `amount`. Raises BudgetExceeded if it would
@@ -94,94 +163,151 @@ class BudgetTracker:
         """
         if amount < 0:
             raise ValueError("Cannot spend a negative amount.")
+        limit = self._limit
+        if self.ledger is not None:
+            reserved, spent = self.ledger.reserve(amount, limit)
+            if not reserved and limit is not None:
+                raise BudgetExceeded(amount, spent, limit)
+            return True
         with self._lock:
-            if self._limit is not None and self._spent + amount > self._limit:
-                raise BudgetExceeded(amount, self._spent, self._limit)
+            if limit is not None and self._spent + amount > limit:
+                raise BudgetExceeded(amount, self._spent, limit)
             self._spent += amount
             return True
 
     def reset(self) -> None:
+        if self.ledger is not None:
+            self.ledger.reset()
+            return
         with self._lock:
             self._spent = 0.0
 
 
-def _as_list(value: Any) -> List[str]:
-    """Coerce a YAML field that might be missing / scalar / list into a list of strings."""
-    if value is None:
-        return []
-    if isinstance(value, str):
-        return [value]
-    if isinstance(value, (list, tuple)):
-        return [str(v) for v in value if v is not None]
-    return [str(value)]
-
-
 class Employee:
     """A loaded, validated employee.md contract ready to drive an agent."""
 
-    def __init__(self, data: Dict[str, Any]) -> None:
+    def __init__(
+        self,
+        data: Dict[str, Any],
+        *,
+        keep_data: bool = True,
+        source: Union[Path, str, None] = None,
+    ) -> None:
+        """
+        Args:
+            data: The parsed contract
+            keep_data: Keep the parsed tree; False keeps only the compact
+                `ContractView` and re-reads the tree from `source` on demand
+            source: Contract file path (or YAML text) the tree came from
+        """
         if not isinstance(data, dict):
             raise ContractError("employee.md must be a YAML mapping at the top level.")
-        self._data: Dict[str, Any] = data
         # Required by the spec — surface clear errors before runtime use.
         if not isinstance(data.get("role"), dict):
             raise ContractError("Missing required `role` mapping.")
         if not isinstance(data.get("lifecycle"), dict):
             raise ContractError("Missing required `lifecycle` mapping.")
+        self._view = ContractView(data)
+        self._data: Optional[Dict[str, Any]] = data if keep_data else None
+        self._source = source
 
-        economy = data.get("economy") or {}
-        # Use `in` checks (not falsy `or`) so an explicit `budget_limit: 0`
-        # is honoured as a real cap rather than treated as "unlimited".
-        if "budget_limit" in economy:
-            limit = economy.get("budget_limit")
-        elif "max_spend_per_task" in economy:
-            limit = economy.get("max_spend_per_task")
-        else:
-            limit = None
         self.budget = BudgetTracker(
-            limit=limit,
-            currency=str(economy.get("currency") or "USD"),
+            limit=self._view.budget_limit,
+            currency=self._view.currency,
         )
+        # Compiled on first use; dropped by invalidate().
+        self._guardrails: Optional[GuardrailMatcher] = None
+        # (matcher, decision per phrase + fail-closed default), published
+        # as one value so readers never see one without the other.
+        self._scope: Optional[Tuple[ScopeMatcher, List[ScopeDecision]]] = None
+        # Rendered artifacts (system prompt, SKILL.md, ...) keyed by kind.
+        self._rendered: Dict[Any, Any] = {}
 
     # ---- constructors -------------------------------------------------
 
+    # Every constructor parses the YAML exactly once, with the hardened
+    # parser, and validates that same tree before handing it to __init__.
+
     @classmethod
-    def from_yaml(cls, text: str, *, validate: bool = True) -> "Employee":
+    def from_yaml(
+        cls, text: str, *, validate: bool = True, keep_data: bool = True
+    ) -> "Employee":
         try:
-            data = yaml.safe_load(text)
-        except yaml.YAMLError as exc:
+            data, _ = _parser.parse_string(text)
+        except YAMLErrorContext as exc:
             raise ContractError(f"YAML parse error: {exc}") from exc
         if validate:
-            cls._enforce_validation(text)
-        return cls(data)
+            cls._enforce_validation(data, text)
+        return cls(data, keep_data=keep_data, source=None if keep_data else text)
 
     @classmethod
-    def from_file(cls, path: Union[str, Path], *, validate: bool = True) -> "Employee":
+    def from_file(
+        cls, path: Union[str, Path], *, validate: bool = True, keep_data: bool = True
+    ) -> "Employee":
         path = Path(path)
-        text = path.read_text(encoding="utf-8")
-        if validate:
-            result = EmployeeValidationOrchestrator(use_cache=False).validate_file(str(path))
-            cls._raise_for_result(result)
-        return cls(yaml.safe_load(text))
+        return cls(cls._read_file(path, validate), keep_data=keep_data, source=path)
+
+    @classmethod
+    async def aload(
+        cls,
+        path: Union[str, Path],
+        *,
+        validate: bool = True,
+        keep_data: bool = True,
+        loader: Optional[AsyncLoader] = None,
+    ) -> "Employee":
+        """`from_file` for asyncio code.
+
+        Reading, parsing and validation run on the loader's executor, never
+        on the event loop, with at most `loader.max_concurrency` loads in
+        flight. Concurrent loads of the same path share one load and get
+        the same instance. Without `loader`, a process-wide default
+        (`runtime.aio.default_loader()`) is used.
+        """
+        from .aio import default_loader
+
+        return await (loader or default_loader()).load(
+            path, validate=validate, keep_data=keep_data
+        )
 
     @staticmethod
-    def _enforce_validation(text: str) -> None:
-        orch = EmployeeValidationOrchestrator(use_cache=False)
+    def _read_file(path: Path, validate: bool) -> Dict[str, Any]:
+        """Read, parse and (optionally) validate a contract file."""
+        if not validate:
+            try:
+                data, _ = _parser.parse_bytes(path.read_bytes(), name=str(path))
+            except YAMLErrorContext as exc:
+                raise ContractError(f"YAML parse error: {exc}") from exc
+            return data
+
         try:
-            data = yaml.safe_load(text)
-        except yaml.YAMLError as exc:
-            raise ContractError(f"YAML parse error: {exc}") from exc
+            loaded, result = _get_orchestrator().load_file(str(path))
+        except (TypeError, AttributeError, KeyError) as exc:
+            raise Employee._structural_error(exc) from exc
+        if loaded is None and not path.is_file():
+            raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), str(path))
+        Employee._raise_for_result(result)
+        if loaded is None:  # unreachable: parse failures are invalid results
+            raise ContractError("employee.md could not be parsed.")
+        return loaded
+
+    @staticmethod
+    def _enforce_validation(data: Dict[str, Any], source: str) -> None:
         try:
-            result = orch.validate_data(data)
+            result = _get_orchestrator().validate_data(data, source=source)
         except (TypeError, AttributeError, KeyError) as exc:
-            # The validator currently crashes when a required section has the
-            # wrong shape (e.g. `role: 5`). Surface that as a contract error
-            # so callers don't have to special-case the underlying validator.
-            raise ContractError(
-                f"employee.md is structurally invalid: {exc.__class__.__name__}: {exc}"
-            ) from exc
+            raise Employee._structural_error(exc) from exc
         Employee._raise_for_result(result)
 
+    @staticmethod
+    def _structural_error(exc: Exception) -> ContractError:
+        # The validator currently crashes when a required section has the
+        # wrong shape (e.g. `role: 5`). Surface that as a contract error
+        # so callers don't have to special-case the underlying validator.
+        return ContractError(
+            f"employee.md is structurally invalid: {exc.__class__.__name__}: {exc}"
+        )
+
     @staticmethod
     def _raise_for_result(result: ValidationResult) -> None:
         if not result.is_valid:
@@ -193,40 +319,93 @@ class Employee:
 
     @property
     def data(self) -> Dict[str, Any]:
-        return self._data
+        """The parsed contract.
+
+        Everything derived from it (system prompt, SKILL.md export, compiled
+        guardrail and scope matchers) is computed once and cached; call
+        `invalidate()` after changing this mapping in place.
+
+        If the contract was loaded with `keep_data=False`, the tree is
+        re-read from its source on every access and not kept; changes to
+        it are not seen by the runtime.
+        """
+        if self._data is not None:
+            return self._data
+        return self._read_source()
+
+    def _read_source(self) -> Dict[str, Any]:
+        source = self._source
+        if source is None:
+            raise ContractError("The parsed contract was dropped and has no source.")
+        try:
+            if isinstance(source, Path):
+                data, _ = _parser.parse_bytes(source.read_bytes(), name=str(source))
+            else:
+                data, _ = _parser.parse_string(source)
+        except YAMLErrorContext as exc:
+            raise ContractError(f"YAML parse error: {exc}") from exc
+        return data
+
+    @property
+    def view(self) -> ContractView:
+        """The compact, immutable view the runtime reads its fields from."""
+        return self._view
+
+    def memory_size(self) -> int:
+        """Approximate bytes held by this contract's parsed state."""
+        return deep_sizeof((self._view, self._data))
+
+    def invalidate(self) -> None:
+        """Drop everything cached from `data` so it is rebuilt on next use."""
+        if self._data is not None:
+            self._view = ContractView(self._data)
+        self._guardrails = None
+        self._scope = None
+        self._rendered = {}
+
+    def memo(self, key: Hashable, factory: Callable[[], T]) -> T:
+        """Cache an artifact rendered from this contract until `invalidate`.
+
+        Used by `system_prompt`, `prompt_size` and exporters such as
+        `runtime.skill_export.to_skill_md`.
+
+        Args:
+            key: Names the artifact and its options, e.g. ("skill_md", name)
+            factory: Builds the artifact on the first call for `key`
+
+        Returns:
+            The cached or freshly built artifact
+        """
+        rendered = self._rendered
+        value = rendered.get(key)
+        if value is None:
+            value = rendered[key] = factory()
+        return value  # type: ignore[no-any-return]
 
     @property
     def agent_id(self) -> Optional[str]:
-        ident = self._data.get("identity") or {}
-        return ident.get("agent_id")
+        return self._view.agent_id
 
     @property
     def display_name(self) -> str:
-        ident = self._data.get("identity") or {}
-        return str(
-            ident.get("display_name")
-            or ident.get("agent_id")
-            or self._data["role"].get("title")
-            or "agent"
-        )
+        return self._view.display_name
 
     @property
     def title(self) -> str:
-        return str(self._data["role"].get("title") or "agent")
+        return self._view.title
 
     @property
     def status(self) -> str:
-        return str(self._data["lifecycle"].get("status") or "unknown")
+        return self._view.status
 
     @property
     def is_active(self) -> bool:
-        return self.status == "active"
+        return self._view.status == "active"
 
     # ---- guardrails ---------------------------------------------------
 
     def prohibited_actions(self) -> List[str]:
-        guardrails = self._data.get("guardrails") or {}
-        return _as_list(guardrails.get("prohibited_actions"))
+        return list(self._view.prohibited_actions)
 
     def is_action_allowed(self, action: str) -> bool:
         """Case-insensitive substring check of `action` against the
@@ -236,60 +415,40 @@ class Employee:
         OR if `action` is a substring of a prohibited entry. This is a
         deliberately permissive check so phrases like "delete the prod
         database" still trip a guardrail of "delete production database".
+
+        The prohibited list is compiled once per contract (see
+        `runtime.guardrails`), so a check costs one pass over `action`
+        regardless of how many guardrails are configured.
         """
-        haystack = (action or "").strip().lower()
-        if not haystack:
-            return False
-        for forbidden in self.prohibited_actions():
-            needle = forbidden.strip().lower()
-            if not needle:
-                continue
-            if needle in haystack or haystack in needle:
-                return False
-        return True
+        return not self._guardrail_matcher().blocks(action)
 
-    # ---- scope --------------------------------------------------------
+    def check_actions(
+        self, actions: Sequence[str], *, workers: Optional[int] = None
+    ) -> List[bool]:
+        """`is_action_allowed` for a batch of actions.
 
-    def in_scope(self) -> List[str]:
-        scope = self._data.get("scope") or {}
-        return _as_list(scope.get("in_scope"))
+        Shares the compiled guardrail matcher and decides each distinct
+        action once. Pass `workers` to spread very large batches over a
+        process pool (see `runtime.batch`).
 
-    def out_of_scope(self) -> List[str]:
-        scope = self._data.get("scope") or {}
-        return _as_list(scope.get("out_of_scope"))
+        Returns one bool per action, in input order.
+        """
+        blocked = run_batch(self._guardrail_matcher(), "blocks_many", actions, workers)
+        return [not b for b in blocked]
 
-    @staticmethod
-    def _tokens(text: str) -> set:
-        """Tokenize a phrase into lowercase content words (≥3 chars).
-        Strips punctuation and ignores stopwords like 'and'/'the'/'for'."""
-        import re
+    def _guardrail_matcher(self) -> GuardrailMatcher:
+        matcher = self._guardrails
+        if matcher is None:
+            matcher = self._guardrails = GuardrailMatcher(self.prohibited_actions())
+        return matcher
 
-        STOP = {"and", "the", "for", "with", "that", "this", "from", "into", "your"}
-        return {
-            w
-            for w in re.findall(r"[a-zA-Z0-9_]{3,}", (text or "").lower())
-            if w not in STOP
-        }
+    # ---- scope --------------------------------------------------------
 
-    def _phrase_matches(self, phrase: str, haystack_tokens: set, haystack_lower: str) -> bool:
-        """A phrase matches if any of these are true:
-          1. its lowercase form is a substring of haystack
-          2. every one of its content tokens has a prefix-match (≥4 chars)
-             against some haystack token (so "writing"/"write"/"writes"
-             all match each other without needing a real stemmer)
-        """
-        if not phrase:
-            return False
-        if phrase.lower() in haystack_lower:
-            return True
-        phrase_tokens = self._tokens(phrase)
-        if not phrase_tokens:
-            return False
-        for pt in phrase_tokens:
-            stem = pt[:4]
-            if not any(ht.startswith(stem) or pt.startswith(ht[:4]) for ht in haystack_tokens):
-                return False
-        return True
+    def in_scope(self) -> List[str]:
+        return list(self._view.in_scope)
+
+    def out_of_scope(self) -> List[str]:
+        return list(self._view.out_of_scope)
 
     def is_in_scope(self, text: str) -> ScopeDecision:
         """Decide if `text` (a task description) is in scope.
@@ -301,17 +460,40 @@ class Employee:
           3. Same check for `in_scope` entries — match → allowed.
           4. Otherwise denied (fail-closed) so unknown work always escalates.
         """
-        haystack_lower = (text or "").lower()
-        haystack_tokens = self._tokens(text)
-        for needle in self.out_of_scope():
-            if self._phrase_matches(needle, haystack_tokens, haystack_lower):
-                return ScopeDecision(False, needle, "matched out_of_scope")
-        for needle in self.in_scope():
-            if self._phrase_matches(needle, haystack_tokens, haystack_lower):
-                return ScopeDecision(True, needle, "matched in_scope")
-        return ScopeDecision(
-            False, None, "no in_scope entry matched (fail-closed default)"
-        )
+        matcher, decisions = self._scope_index()
+        index = matcher.first_match(text)
+        return decisions[-1 if index is None else index]
+
+    def classify_many(
+        self, texts: Sequence[str], *, workers: Optional[int] = None
+    ) -> List[ScopeDecision]:
+        """`is_in_scope` for a batch of task descriptions.
+
+        Shares the compiled phrase index, tokenizes each distinct text once
+        and returns shared `ScopeDecision` instances (one per phrase plus
+        the fail-closed default), so the result list stays small. Pass
+        `workers` to spread very large batches over a process pool.
+        """
+        matcher, decisions = self._scope_index()
+        indexes = run_batch(matcher, "first_matches", texts, workers)
+        return [decisions[-1 if index is None else index] for index in indexes]
+
+    def _scope_index(self) -> Tuple[ScopeMatcher, List[ScopeDecision]]:
+        scope = self._scope
+        if scope is None:
+            out_of_scope = self.out_of_scope()
+            in_scope = self.in_scope()
+            decisions = [
+                ScopeDecision(False, needle, "matched out_of_scope")
+                for needle in out_of_scope
+            ] + [ScopeDecision(True, needle, "matched in_scope") for needle in in_scope]
+            decisions.append(
+                ScopeDecision(
+                    False, None, "no in_scope entry matched (fail-closed default)"
+                )
+            )
+            scope = self._scope = (ScopeMatcher(out_of_scope + in_scope), decisions)
+        return scope
 
     # ---- LLM-ready prompt --------------------------------------------
 
@@ -321,93 +503,85 @@ class Employee:
         The output is plain text, ~30 lines for a typical contract, and is
         designed to drop straight into the `system` slot of OpenAI /
         Anthropic / LangChain calls. It only emits sections that are
-        actually present in the contract.
+        actually present in the contract. Rendered once per contract (see
+        `invalidate`).
         """
-        d = self._data
-        identity = d.get("identity") or {}
-        role = d.get("role") or {}
-        mission = d.get("mission") or {}
-        scope = d.get("scope") or {}
-        guardrails = d.get("guardrails") or {}
-        ai = d.get("ai_settings") or {}
-        economy = d.get("economy") or {}
+        return self.memo("system_prompt", self._render_system_prompt)
+
+    def prompt_size(self) -> PromptSize:
+        """Character, UTF-8 byte and estimated token size of `system_prompt()`."""
+        return self.memo("prompt_size", self._measure_prompt)
+
+    def _measure_prompt(self) -> PromptSize:
+        prompt = self.system_prompt()
+        return PromptSize(
+            chars=len(prompt),
+            bytes=len(prompt.encode("utf-8")),
+            tokens=-(-len(prompt) // _CHARS_PER_TOKEN),
+        )
+
+    def _render_system_prompt(self) -> str:
+        v = self._view
 
         lines: List[str] = []
-        lines.append(f"You are {self.display_name}, a {role.get('title', 'agent')}.")
-        if role.get("level"):
-            lines.append(f"Level: {role['level']}.")
-        if identity.get("agent_id"):
-            lines.append(f"Agent ID: {identity['agent_id']}.")
-        if mission.get("purpose"):
+        lines.append(f"You are {v.display_name}, a {v.title}.")
+        if v.level:
+            lines.append(f"Level: {v.level}.")
+        if v.agent_id:
+            lines.append(f"Agent ID: {v.agent_id}.")
+        if v.purpose:
             lines.append("")
             lines.append("MISSION")
-            lines.append(str(mission["purpose"]).strip())
+            lines.append(v.purpose)
 
-        objectives = _as_list(mission.get("objectives"))
-        if objectives:
+        if v.objectives:
             lines.append("")
             lines.append("OBJECTIVES")
-            for o in objectives:
+            for o in v.objectives:
                 lines.append(f"- {o}")
 
-        success = _as_list(mission.get("success_criteria"))
-        if success:
+        if v.success_criteria:
             lines.append("")
             lines.append("SUCCESS CRITERIA")
-            for s in success:
+            for s in v.success_criteria:
                 lines.append(f"- {s}")
 
-        in_s = _as_list(scope.get("in_scope"))
-        out_s = _as_list(scope.get("out_of_scope"))
-        if in_s or out_s:
+        if v.in_scope or v.out_of_scope:
             lines.append("")
             lines.append("SCOPE")
-            for s in in_s:
+            for s in v.in_scope:
                 lines.append(f"+ {s}")
-            for s in out_s:
+            for s in v.out_of_scope:
                 lines.append(f"- DO NOT: {s}")
 
-        prohibited = self.prohibited_actions()
-        if prohibited:
+        if v.prohibited_actions:
             lines.append("")
             lines.append("HARD GUARDRAILS — never do any of these, no matter what:")
-            for p in prohibited:
+            for p in v.prohibited_actions:
                 lines.append(f"- {p}")
 
-        review = guardrails.get("escalation_required") or guardrails.get(
-            "human_review"
-        )
-        if review:
+        if v.escalation:
             lines.append(
                 "If a request asks you to take an action you are unsure about, "
                 "stop and request human review."
             )
 
-        if economy:
-            if "budget_limit" in economy:
-                lim = economy.get("budget_limit")
-            elif "max_spend_per_task" in economy:
-                lim = economy.get("max_spend_per_task")
-            else:
-                lim = None
-            # `is not None` so `budget_limit: 0` still emits the line
-            # ("do not spend any money on this task" is a real instruction).
-            if lim is not None and isinstance(lim, (int, float)) and lim >= 0:
-                cur = economy.get("currency", "USD")
-                lines.append("")
-                lines.append(
-                    f"BUDGET: do not spend more than {lim} {cur} per task."
-                )
+        lim = v.budget_limit
+        # `is not None` so `budget_limit: 0` still emits the line
+        # ("do not spend any money on this task" is a real instruction).
+        if v.has_economy and lim is not None and isinstance(lim, (int, float)) and lim >= 0:
+            lines.append("")
+            lines.append(f"BUDGET: do not spend more than {lim} {v.currency} per task.")
 
-        if ai.get("model_preference"):
+        if v.model_preference:
             lines.append("")
             lines.append(
-                f"You are running on {ai['model_preference']}; tune verbosity accordingly."
+                f"You are running on {v.model_preference}; tune verbosity accordingly."
             )
 
         lines.append("")
         lines.append(
-            f"Lifecycle status: {self.status}. "
+            f"Lifecycle status: {v.status}. "
             "If status is not 'active', refuse all task requests."
         )
         return "\n".join(lines).strip() + "\n"
@@ -418,7 +592,7 @@ class Employee:
         """Return a kwargs dict that fits langchain ChatPromptTemplate.from_messages."""
         return {
             "system_message": self.system_prompt(),
-            "model": (self._data.get("ai_settings") or {}).get("model_preference"),
+            "model": self._view.model_preference,
         }
 
     def __repr__(self) -> str:  # pragma: no cover
@@ -0,0 +1,182 @@
+"""Precompiled matcher for `guardrails.prohibited_actions`.
+
+`Employee.is_action_allowed` denies an action when a prohibited entry is a
+substring of it *or* it is a substring of a prohibited entry. Scanning the
+list entry by entry costs O(entries x length) per call, and the check runs
+on every tool invocation, so the list is compiled once into two automata:
+
+  - an Aho–Corasick automaton over the entries answers "does any entry occur
+    in the action?" in one pass over the action;
+  - a generalized suffix automaton over the entries answers "does the action
+    occur in any entry?" in one pass over the action.
+
+Both work on the same normalised strings the linear scan compares
+(`strip().lower()`, empty entries dropped), so decisions are identical.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, List
+
+
+def normalize(text: str) -> str:
+    """The form every guardrail comparison is made in."""
+    return (text or "").strip().lower()
+
+
+class _AhoCorasick:
+    """Multi-pattern substring search; reports only *whether* a pattern occurs."""
+
+    __slots__ = ("_goto", "_fail", "_hit")
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        goto: List[Dict[str, int]] = [{}]
+        hit: List[bool] = [False]
+        for pattern in patterns:
+            state = 0
+            for ch in pattern:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    hit.append(False)
+                state = nxt
+            hit[state] = True
+
+        # Breadth-first failure links; a state is a hit if any pattern ends
+        # at it or at a state on its failure chain.
+        fail = [0] * len(goto)
+        queue = list(goto[0].values())
+        for state in queue:
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(ch, 0)
+                hit[nxt] = hit[nxt] or hit[fail[nxt]]
+
+        self._goto = goto
+        self._fail = fail
+        self._hit = hit
+
+    def search(self, text: str) -> bool:
+        goto, fail, hit = self._goto, self._fail, self._hit
+        state = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if hit[state]:
+                return True
+        return False
+
+
+class _SuffixAutomaton:
+    """Recognises every substring of a set of strings (generalized SAM)."""
+
+    __slots__ = ("_next",)
+
+    def __init__(self, strings: Iterable[str]) -> None:
+        nxt: List[Dict[str, int]] = [{}]
+        link: List[int] = [-1]
+        length: List[int] = [0]
+
+        def clone(q: int, new_length: int) -> int:
+            nxt.append(dict(nxt[q]))
+            link.append(link[q])
+            length.append(new_length)
+            return len(nxt) - 1
+
+        def redirect(p: int, ch: str, q: int, target: int) -> None:
+            while p != -1 and nxt[p].get(ch) == q:
+                nxt[p][ch] = target
+                p = link[p]
+
+        def extend(last: int, ch: str) -> int:
+            q = nxt[last].get(ch)
+            if q is not None:
+                # The transition already exists (shared prefix with an
+                # earlier string): reuse q, splitting it if it is too long.
+                if length[q] == length[last] + 1:
+                    return q
+                c = clone(q, length[last] + 1)
+                link[q] = c
+                redirect(last, ch, q, c)
+                return c
+
+            cur = len(nxt)
+            nxt.append({})
+            link.append(0)
+            length.append(length[last] + 1)
+            p = last
+            while p != -1 and ch not in nxt[p]:
+                nxt[p][ch] = cur
+                p = link[p]
+            if p != -1:
+                q = nxt[p][ch]
+                if length[q] == length[p] + 1:
+                    link[cur] = q
+                else:
+                    c = clone(q, length[p] + 1)
+                    redirect(p, ch, q, c)
+                    link[q] = link[cur] = c
+            return cur
+
+        for s in strings:
+            last = 0
+            for ch in s:
+                last = extend(last, ch)
+
+        self._next = nxt
+
+    def contains(self, text: str) -> bool:
+        nxt = self._next
+        state = 0
+        for ch in text:
+            state = nxt[state].get(ch, -1)
+            if state < 0:
+                return False
+        return True
+
+
+class GuardrailMatcher:
+    """Compiled form of a `prohibited_actions` list.
+
+    `blocks(action)` is True exactly when the linear check would deny
+    `action`: it is empty after normalisation, a prohibited entry occurs in
+    it, or it occurs in a prohibited entry.
+    """
+
+    __slots__ = ("patterns", "_longest", "_forward", "_reverse")
+
+    def __init__(self, prohibited: Iterable[str]) -> None:
+        patterns = sorted({p for p in map(normalize, prohibited) if p})
+        self.patterns: List[str] = patterns
+        self._longest = max(map(len, patterns), default=0)
+        self._forward = _AhoCorasick(patterns)
+        self._reverse = _SuffixAutomaton(patterns)
+
+    def blocks(self, action: str) -> bool:
+        haystack = normalize(action)
+        if not haystack:
+            return True
+        if not self.patterns:
+            return False
+        if len(haystack) <= self._longest and self._reverse.contains(haystack):
+            return True
+        return self._forward.search(haystack)
+
+    def blocks_many(self, actions: Iterable[str]) -> List[bool]:
+        """`blocks` for a batch; repeated actions are checked once."""
+        decided: Dict[str, bool] = {}
+        results: List[bool] = []
+        for action in actions:
+            key = normalize(action)
+            if key in decided:
+                blocked = decided[key]
+            else:
+                blocked = decided[key] = self.blocks(action)
+            results.append(blocked)
+        return results
@@ -0,0 +1,159 @@
+"""Cross-process budget ledger.
+
+An in-memory `BudgetTracker` only sees the spends of its own process, so a
+contract served by N gunicorn / multiprocessing workers could spend N times
+its `economy.budget_limit`. A `BudgetLedger` keeps the running total in a
+SQLite database (WAL mode) that every local process opens, and reserves
+with a compare-and-add inside one `BEGIN IMMEDIATE` transaction:
+
+    UPDATE ledger SET spent = spent + :amount
+     WHERE key = :key AND spent + :amount <= :limit
+    SELECT spent FROM ledger WHERE key = :key
+
+so two processes can never both take the last slice of a budget. (No
+`RETURNING`, which needs SQLite 3.35 and is missing from e.g. the Python
+3.8 builds on Ubuntu 20.04.) Plug it
+into a tracker with
+
+    >>> ledger = BudgetLedger("/var/run/agents/budget.sqlite3", key=emp.agent_id)
+    >>> emp.budget = BudgetTracker(emp.budget.limit, emp.budget.currency, ledger=ledger)
+
+WAL with `synchronous=NORMAL` means a reservation does not wait for an
+fsync; the ledger survives process crashes, and only an OS crash or power
+loss can lose the most recent reservations.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+
+class LedgerError(RuntimeError):
+    """Raised when the shared ledger cannot be read or updated."""
+
+
+class BudgetLedger:
+    """Running spend total for one budget `key`, shared across processes.
+
+    Safe to use from several threads; a connection is opened lazily per
+    process, so a ledger created before `fork()` (e.g. in a gunicorn
+    `--preload` app) reconnects in each worker.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        key: Optional[str] = "default",
+        *,
+        timeout: float = 30.0,
+    ) -> None:
+        """
+        Initialize the ledger.
+
+        Args:
+            path: SQLite database file; created if missing
+            key: Budget this ledger accounts for (usually the agent_id)
+            timeout: Seconds to wait for another process's write to finish
+        """
+        self.path = Path(path)
+        self.key = key or "default"
+        self.timeout = timeout
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is not None and self._pid == os.getpid():
+            return self._conn
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # Autocommit: every statement below is its own atomic transaction.
+            conn = sqlite3.connect(
+                str(self.path),
+                timeout=self.timeout,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS ledger ("
+                " key TEXT PRIMARY KEY,"
+                " spent REAL NOT NULL)"
+            )
+            conn.execute(
+                "INSERT OR IGNORE INTO ledger (key, spent) VALUES (?, 0.0)",
+                (self.key,),
+            )
+        except (sqlite3.Error, OSError) as e:
+            raise LedgerError(f"Cannot open budget ledger {self.path}: {e}") from e
+        self._conn = conn
+        self._pid = os.getpid()
+        return conn
+
+    def reserve(self, amount: float, limit: Optional[float]) -> Tuple[bool, float]:
+        """Add `amount` to the total unless that would exceed `limit`.
+
+        Args:
+            amount: Amount to reserve
+            limit: Ceiling for the total; None records without a ceiling
+
+        Returns:
+            (reserved, total) where total is the spend after the call
+        """
+        with self._lock:
+            conn = self._connect()
+            try:
+                # The write lock is taken up front, so the total read back
+                # is the one this update produced.
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    cursor = conn.execute(
+                        "UPDATE ledger SET spent = spent + ?"
+                        " WHERE key = ? AND (? IS NULL OR spent + ? <= ?)",
+                        (amount, self.key, limit, amount, limit),
+                    )
+                    reserved = cursor.rowcount == 1
+                    (spent,) = conn.execute(
+                        "SELECT spent FROM ledger WHERE key = ?", (self.key,)
+                    ).fetchone()
+                    conn.execute("COMMIT")
+                except BaseException:
+                    if conn.in_transaction:
+                        conn.execute("ROLLBACK")
+                    raise
+                return reserved, spent
+            except sqlite3.Error as e:
+                raise LedgerError(f"Budget ledger update failed: {e}") from e
+
+    def spent(self) -> float:
+        """Current total across every process using this ledger."""
+        with self._lock:
+            conn = self._connect()
+            try:
+                (spent,) = conn.execute(
+                    "SELECT spent FROM ledger WHERE key = ?", (self.key,)
+                ).fetchone()
+            except sqlite3.Error as e:
+                raise LedgerError(f"Budget ledger read failed: {e}") from e
+            return spent
+
+    def reset(self) -> None:
+        """Set the total back to zero (for every process)."""
+        with self._lock:
+            conn = self._connect()
+            try:
+                conn.execute("UPDATE ledger SET spent = 0.0 WHERE key = ?", (self.key,))
+            except sqlite3.Error as e:
+                raise LedgerError(f"Budget ledger reset failed: {e}") from e
+
+    def close(self) -> None:
+        """Close this process's connection."""
+        with self._lock:
+            if self._conn is not None and self._pid == os.getpid():
+                self._conn.close()
+            self._conn = None
@@ -0,0 +1,328 @@
+"""Many contracts in one process, indexed by agent id and hot-reloadable.
+
+A gateway that serves thousands of agents should not call
+`Employee.from_file` per request. An `EmployeeRegistry` loads every
+contract under a directory once, in parallel, and answers
+`registry.get(agent_id)` with a dict lookup:
+
+    >>> registry = EmployeeRegistry("contracts/")
+    >>> registry.get("dev-001").is_action_allowed("rm -rf /")
+    False
+    >>> registry.reload()   # e.g. from a timer; only changed files reload
+
+Reloads are incremental: a file whose (mtime, size) is unchanged is not
+opened, and a file whose stat changed but whose content hash did not (a
+`touch`, a checkout of the same revision) is not re-parsed. The loaded
+contracts live in an immutable snapshot that a reload replaces with one
+attribute assignment, so lookups never take a lock and never see a
+half-applied reload. A contract that stops validating keeps serving its
+last good version and the error is reported.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Deque, Dict, List, Mapping, Optional, Tuple, Union
+
+from tooling import YAMLErrorContext
+from tooling.disk_cache import content_hash
+from tooling.watch import scan_stat_index
+
+from .aio import AsyncLoader, default_loader
+from .employee import ContractError, Employee, _parser
+
+# Lookup latencies kept for the percentiles in `metrics()`.
+LATENCY_SAMPLES = 4096
+
+
+def _load_contract(raw: bytes, validate: bool) -> Dict[str, Any]:
+    """Parse (and validate) one contract; runs in a worker thread or process."""
+    try:
+        data, _ = _parser.parse_bytes(raw)
+    except YAMLErrorContext as exc:
+        raise ContractError(f"YAML parse error: {exc}") from exc
+    if validate:
+        Employee._enforce_validation(data, raw.decode("utf-8"))
+    return data
+
+
+@dataclass(frozen=True)
+class _Entry:
+    path: str
+    stat: Tuple[int, int]
+    digest: str
+    employee: Employee
+    memory: int
+
+
+@dataclass(frozen=True)
+class _Snapshot:
+    by_path: Mapping[str, _Entry]
+    by_id: Mapping[str, _Entry]
+    errors: Mapping[str, str]
+    # Per failing file: the stat it failed with, and why.
+    failed: Mapping[str, Tuple[Tuple[int, int], str]]
+
+
+@dataclass
+class ReloadReport:
+    """What one `EmployeeRegistry.reload()` changed."""
+
+    added: List[str] = field(default_factory=list)
+    updated: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    unchanged: int = 0
+    errors: Dict[str, str] = field(default_factory=dict)
+    duration: float = 0.0
+
+
+class EmployeeRegistry:
+    """Contracts under `directory`, indexed by `identity.agent_id`.
+
+    Lookups (`get`, `[]`, `in`, `agent_ids`) read the current snapshot
+    without locking and are safe from any number of threads; `reload`
+    calls are serialised with each other. When two files declare the same
+    agent id, the first path (in sorted order) wins and the other is
+    reported as an error.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        *,
+        validate: bool = True,
+        keep_data: bool = True,
+        executor: str = "thread",
+        max_workers: Optional[int] = None,
+        suffix: str = ".md",
+    ) -> None:
+        """
+        Initialize the registry and load every contract.
+
+        Args:
+            directory: Directory scanned (recursively) for contracts
+            validate: Run the full validator on every (re)loaded contract
+            keep_data: Keep each contract's parsed tree; False keeps only its
+                compact view (see `Employee`)
+            executor: "thread" or "process"; processes parse and validate
+                without contending for the GIL
+            max_workers: Worker count for loading (default: CPU count)
+            suffix: File name suffix of contracts
+        """
+        if executor not in ("thread", "process"):
+            raise ValueError("executor must be 'thread' or 'process'.")
+        self.directory = str(directory)
+        self.validate = validate
+        self.keep_data = keep_data
+        self.executor = executor
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.suffix = suffix
+        self._snapshot = _Snapshot({}, {}, {}, {})
+        self._reload_lock = threading.Lock()
+        self._lookups = 0
+        self._latencies: Deque[int] = deque(maxlen=LATENCY_SAMPLES)
+        self._reload_count = 0
+        self._reload_seconds = 0.0
+        self._last_reload_seconds = 0.0
+        self.reload()
+
+    # ---- lookups ------------------------------------------------------
+
+    def get(self, agent_id: str) -> Optional[Employee]:
+        """The contract for `agent_id`, or None."""
+        start = time.perf_counter_ns()
+        entry = self._snapshot.by_id.get(agent_id)
+        self._latencies.append(time.perf_counter_ns() - start)
+        self._lookups += 1
+        return entry.employee if entry is not None else None
+
+    def __getitem__(self, agent_id: str) -> Employee:
+        employee = self.get(agent_id)
+        if employee is None:
+            raise KeyError(agent_id)
+        return employee
+
+    def __contains__(self, agent_id: object) -> bool:
+        return agent_id in self._snapshot.by_id
+
+    def __len__(self) -> int:
+        return len(self._snapshot.by_id)
+
+    def agent_ids(self) -> List[str]:
+        return sorted(self._snapshot.by_id)
+
+    @property
+    def errors(self) -> Dict[str, str]:
+        """Per file, why it is not (or no longer) served as loaded."""
+        return dict(self._snapshot.errors)
+
+    def memory_usage(self) -> Dict[str, int]:
+        """Approximate bytes held by each contract's parsed state."""
+        return {agent_id: entry.memory for agent_id, entry in self._snapshot.by_id.items()}
+
+    # ---- reloading ----------------------------------------------------
+
+    def reload(self) -> ReloadReport:
+        """Pick up added, changed and removed contracts.
+
+        Returns:
+            ReloadReport describing the swap that was made
+        """
+        with self._reload_lock:
+            start = time.perf_counter()
+            report = self._reload(self._snapshot)
+            report.duration = time.perf_counter() - start
+            self._reload_count += 1
+            self._reload_seconds += report.duration
+            self._last_reload_seconds = report.duration
+            return report
+
+    async def areload(self, *, loader: Optional[AsyncLoader] = None) -> ReloadReport:
+        """`reload` for asyncio code.
+
+        The reload runs on `loader`'s executor and counts against its
+        `max_concurrency` (a process-pool loader uses the loop's default
+        executor, since the reload updates this registry in place). Its
+        parsing still fans out per `executor` / `max_workers`, so the loop
+        keeps serving lookups meanwhile. Concurrent `areload` calls on one
+        loop share a single reload.
+        """
+        loader = loader or default_loader()
+
+        def start() -> Awaitable[ReloadReport]:
+            return loader.offload_local(self.reload)
+
+        return await loader.shared(("reload", id(self)), start)
+
+    def _reload(self, current: _Snapshot) -> ReloadReport:
+        report = ReloadReport()
+        stats = scan_stat_index([self.directory], suffix=self.suffix)
+        entries: Dict[str, _Entry] = {}
+        failures: Dict[str, Tuple[Tuple[int, int], str]] = {}
+        pending: Dict[str, Tuple[Tuple[int, int], str, bytes]] = {}
+
+        for path in sorted(stats):
+            old = current.by_path.get(path)
+            failed = current.failed.get(path)
+            if failed is not None and failed[0] == stats[path]:
+                # Still the same broken file: keep the error, skip the work.
+                failures[path] = failed
+                if old is not None:
+                    entries[path] = old
+                continue
+            if old is not None and old.stat == stats[path]:
+                entries[path] = old
+                continue
+            try:
+                raw = Path(path).read_bytes()
+            except OSError as exc:
+                failures[path] = (stats[path], f"Cannot read contract: {exc}")
+                if old is not None:
+                    entries[path] = old
+                continue
+            digest = content_hash(raw)
+            if old is not None and old.digest == digest:
+                entries[path] = _Entry(path, stats[path], digest, old.employee, old.memory)
+                continue
+            pending[path] = (stats[path], digest, raw)
+
+        for path, outcome in zip(pending, self._load_all(pending)):
+            stat, digest, _ = pending[path]
+            old = current.by_path.get(path)
+            if isinstance(outcome, Exception):
+                failures[path] = (stat, str(outcome))
+                if old is not None:
+                    entries[path] = old
+                continue
+            try:
+                employee = Employee(outcome, keep_data=self.keep_data, source=Path(path))
+            except ContractError as exc:
+                # Unvalidated trees can still lack the sections Employee needs.
+                failures[path] = (stat, str(exc))
+                if old is not None:
+                    entries[path] = old
+                continue
+            entries[path] = _Entry(path, stat, digest, employee, employee.memory_size())
+            (report.updated if old is not None else report.added).append(path)
+
+        report.removed = sorted(set(current.by_path) - set(stats))
+        report.unchanged = len(stats) - len(pending)
+        report.errors = {path: message for path, (_, message) in failures.items()}
+
+        by_id: Dict[str, _Entry] = {}
+        for path in sorted(entries):
+            entry = entries[path]
+            agent_id = entry.employee.agent_id
+            if not agent_id:
+                report.errors[path] = "Contract has no identity.agent_id."
+            elif agent_id in by_id:
+                report.errors[path] = (
+                    f"Duplicate agent_id {agent_id!r} (also in {by_id[agent_id].path})."
+                )
+            else:
+                by_id[str(agent_id)] = entry
+
+        self._snapshot = _Snapshot(entries, by_id, dict(report.errors), failures)
+        return report
+
+    def _load_all(self, pending: Mapping[str, Any]) -> List[Any]:
+        """Parse and validate `pending` files; an exception per failure."""
+        raws = [raw for _, _, raw in pending.values()]
+        if len(raws) < 2 or self.max_workers < 2:
+            return [self._load_one(raw) for raw in raws]
+        pool: Executor
+        workers = min(self.max_workers, len(raws))
+        if self.executor == "process":
+            pool = ProcessPoolExecutor(max_workers=workers)
+        else:
+            pool = ThreadPoolExecutor(max_workers=workers)
+        with pool:
+            futures = [pool.submit(_load_contract, raw, self.validate) for raw in raws]
+            return [self._outcome(future) for future in futures]
+
+    def _load_one(self, raw: bytes) -> Any:
+        try:
+            return _load_contract(raw, self.validate)
+        except (ContractError, UnicodeDecodeError) as exc:
+            return exc
+
+    @staticmethod
+    def _outcome(future: Any) -> Any:
+        try:
+            return future.result()
+        except (ContractError, UnicodeDecodeError) as exc:
+            return exc
+
+    # ---- metrics ------------------------------------------------------
+
+    def metrics(self) -> Dict[str, Any]:
+        """Lookup latency and reload duration, plus size of the registry.
+
+        Latency percentiles are taken over the most recent
+        `LATENCY_SAMPLES` lookups and reported in nanoseconds.
+        """
+        latencies = sorted(self._latencies)
+        snapshot = self._snapshot
+
+        def percentile(q: float) -> int:
+            if not latencies:
+                return 0
+            return latencies[min(len(latencies) - 1, int(q * len(latencies)))]
+
+        return {
+            "contracts": len(snapshot.by_id),
+            "errors": len(snapshot.errors),
+            "memory_bytes": sum(e.memory for e in snapshot.by_id.values()),
+            "lookups": self._lookups,
+            "lookup_p50_ns": percentile(0.50),
+            "lookup_p99_ns": percentile(0.99),
+            "reloads": self._reload_count,
+            "last_reload_seconds": self._last_reload_seconds,
+            "total_reload_seconds": self._reload_seconds,
+        }
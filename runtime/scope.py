@@ -0,0 +1,148 @@
+"""Indexed matcher for `scope.in_scope` / `scope.out_of_scope` phrases.
+
+A phrase matches a task description if either
+
+  1. its lowercase form is a substring of the lowercased task, or
+  2. every one of its content tokens prefix-matches some task token: the
+     two tokens agree on their first ``min(4, len(a), len(b))`` characters
+     (so "writing"/"write"/"writes" all match without a real stemmer).
+
+Phrases are tokenized once, when the matcher is built, and every phrase
+token is filed in an inverted index under the 4-char (or 3-char) prefix a
+task token would need to satisfy it. Deciding a task then costs one
+tokenization of the task plus one index lookup per distinct task-token
+prefix, instead of re-tokenizing every phrase and comparing every token
+pair.
+"""
+
+from __future__ import annotations
+
+import re
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Set
+
+_TOKEN_RE = re.compile(r"[a-zA-Z0-9_]{3,}")
+_STOPWORDS = frozenset(
+    {"and", "the", "for", "with", "that", "this", "from", "into", "your"}
+)
+
+
+def tokens(text: str) -> Set[str]:
+    """Tokenize a phrase into lowercase content words (≥3 chars).
+    Strips punctuation and ignores stopwords like 'and'/'the'/'for'."""
+    return {w for w in _TOKEN_RE.findall((text or "").lower()) if w not in _STOPWORDS}
+
+
+class ScopeMatcher:
+    """Compiled, ordered list of scope phrases.
+
+    `first_match(text)` returns the index of the first phrase (in the order
+    given) that matches `text`, or None.
+
+    Two tokens `a`, `b` (both ≥3 chars) prefix-match exactly when
+    `a[:k] == b[:k]` with `k = min(4, len(a), len(b))`. For a phrase token
+    `p` that means one of:
+
+      - `len(p) >= 4`: some task token starts with `p[:4]`, or some task
+        token *is* `p[:3]`;
+      - `len(p) == 3`: some task token starts with `p`.
+
+    A task token `t` therefore produces the keys `t[:4]` (which is `t`
+    itself when it is three characters long) and `t[:3]`, looked up in
+    `_by_prefix4` and `_by_prefix3` respectively. Each hit satisfies one
+    phrase token ("requirement"); a phrase matches by tokens once all of its
+    requirements are satisfied.
+
+    For the substring rule each phrase is filed under one of its
+    3-character slices (the one least shared with other phrases); a phrase
+    can only occur verbatim in the task if that slice does, so only those
+    phrases are tested with `in`.
+    """
+
+    __slots__ = (
+        "phrases",
+        "_lowered",
+        "_required",
+        "_owner",
+        "_by_prefix4",
+        "_by_prefix3",
+        "_by_trigram",
+        "_short",
+    )
+
+    def __init__(self, phrases: Iterable[str]) -> None:
+        self.phrases: List[str] = list(phrases)
+        self._lowered = [p.lower() for p in self.phrases]
+        # Per phrase: how many token requirements must hold (0 = substring only).
+        self._required: List[int] = []
+        # Per requirement: the phrase it belongs to.
+        self._owner: List[int] = []
+        self._by_prefix4: Dict[str, List[int]] = {}
+        self._by_prefix3: Dict[str, List[int]] = {}
+
+        for index, lowered in enumerate(self._lowered):
+            phrase_tokens = tokens(lowered)
+            self._required.append(len(phrase_tokens))
+            for token in phrase_tokens:
+                requirement = len(self._owner)
+                self._owner.append(index)
+                if len(token) >= 4:
+                    self._by_prefix4.setdefault(token[:4], []).append(requirement)
+                    self._by_prefix4.setdefault(token[:3], []).append(requirement)
+                else:
+                    self._by_prefix3.setdefault(token, []).append(requirement)
+
+        trigrams = [_trigrams(lowered) for lowered in self._lowered]
+        frequency = Counter(gram for grams in trigrams for gram in grams)
+        self._by_trigram: Dict[str, List[int]] = {}
+        self._short: List[int] = []
+        for index, grams in enumerate(trigrams):
+            if grams:
+                rarest = min(sorted(grams), key=frequency.__getitem__)
+                self._by_trigram.setdefault(rarest, []).append(index)
+            elif self._lowered[index]:
+                self._short.append(index)
+
+    def first_match(self, text: str) -> Optional[int]:
+        task_tokens = tokens(text)
+        by_prefix4, by_prefix3 = self._by_prefix4, self._by_prefix3
+        satisfied: Set[int] = set()
+        for key in {t[:4] for t in task_tokens}:
+            satisfied.update(by_prefix4.get(key, ()))
+        for key in {t[:3] for t in task_tokens}:
+            satisfied.update(by_prefix3.get(key, ()))
+
+        counts = Counter(map(self._owner.__getitem__, satisfied))
+        required = self._required
+        first = min(
+            (phrase for phrase, n in counts.items() if n == required[phrase]),
+            default=len(self.phrases),
+        )
+
+        haystack = (text or "").lower()
+        candidates = [p for p in self._short if p < first]
+        by_trigram = self._by_trigram
+        for gram in _trigrams(haystack) & by_trigram.keys():
+            candidates.extend(p for p in by_trigram[gram] if p < first)
+        lowered = self._lowered
+        for phrase in sorted(candidates):
+            if lowered[phrase] in haystack:
+                return phrase
+        return first if first < len(self.phrases) else None
+
+    def first_matches(self, texts: Iterable[str]) -> List[Optional[int]]:
+        """`first_match` for a batch; repeated texts are decided once."""
+        decided: Dict[str, Optional[int]] = {}
+        results: List[Optional[int]] = []
+        for text in texts:
+            key = text or ""
+            if key in decided:
+                index = decided[key]
+            else:
+                index = decided[key] = self.first_match(text)
+            results.append(index)
+        return results
+
+
+def _trigrams(text: str) -> Set[str]:
+    return {text[i : i + 3] for i in range(len(text) - 2)}
@@ -70,11 +70,11 @@ def _join_list(items: Optional[List[Any]], *, bullet: str = "- ") -> str:
     return "\n".join(f"{bullet}{str(x).strip()}" for x in items)
 
 
-def _build_description(employee: Employee) -> str:
+def _build_description(data: Dict[str, Any]) -> str:
     """The frontmatter `description` is what Claude reads to decide whether
     to load the full skill. Keep it tight and action-oriented."""
-    role = employee.data.get("role", {}) or {}
-    mission = employee.data.get("mission", {}) or {}
+    role = data.get("role", {}) or {}
+    mission = data.get("mission", {}) or {}
     title = role.get("title", "AI agent")
     level = role.get("level", "")
     purpose = mission.get("purpose", "")
@@ -85,19 +85,19 @@ def _build_description(employee: Employee) -> str:
     return _short(text, _MAX_DESCRIPTION_CHARS)
 
 
-def _build_frontmatter(employee: Employee, *, name: Optional[str] = None) -> Dict[str, Any]:
-    role = employee.data.get("role", {}) or {}
-    identity = employee.data.get("identity", {}) or {}
-    permissions = employee.data.get("permissions", {}) or {}
+def _build_frontmatter(data: Dict[str, Any], *, name: Optional[str] = None) -> Dict[str, Any]:
+    role = data.get("role", {}) or {}
+    identity = data.get("identity", {}) or {}
+    permissions = data.get("permissions", {}) or {}
     fm: Dict[str, Any] = {
         "name": _slugify(
             name
             or identity.get("agent_id")
             or role.get("title")
-            or employee.data.get("spec", {}).get("name")
+            or data.get("spec", {}).get("name")
             or "employee-skill"
         ),
-        "description": _build_description(employee),
+        "description": _build_description(data),
     }
     tools = permissions.get("tool_access") or []
     if isinstance(tools, list) and tools:
@@ -105,11 +105,10 @@ def _build_frontmatter(employee: Employee, *, name: Optional[str] = None) -> Dic
     return fm
 
 
-def _render_body(employee: Employee) -> str:
+def _render_body(d: Dict[str, Any]) -> str:
     """Render the contract as a SKILL.md body. Sections are deliberately
     short and skimmable — Claude loads the body lazily under progressive
     disclosure, so we want the most load-bearing constraints first."""
-    d = employee.data
     role = d.get("role", {}) or {}
     mission = d.get("mission", {}) or {}
     scope = d.get("scope", {}) or {}
@@ -202,12 +201,20 @@ def to_skill_md(employee: Employee, *, name: Optional[str] = None) -> str:
     Returns
     -------
     str
-        A complete SKILL.md document, ready to write to disk.
+        A complete SKILL.md document, ready to write to disk. The result is
+        cached on ``employee`` until :meth:`runtime.Employee.invalidate`.
     """
-    fm = _build_frontmatter(employee, name=name)
-    fm_yaml = yaml.safe_dump(fm, sort_keys=False, allow_unicode=True).strip()
-    body = _render_body(employee)
-    return f"---\n{fm_yaml}\n---\n\n{body}"
+
+    def render() -> str:
+        # Read once: a contract loaded with keep_data=False re-reads its
+        # tree on every `data` access.
+        data = employee.data
+        fm = _build_frontmatter(data, name=name)
+        fm_yaml = yaml.safe_dump(fm, sort_keys=False, allow_unicode=True).strip()
+        body = _render_body(data)
+        return f"---\n{fm_yaml}\n---\n\n{body}"
+
+    return employee.memo(("skill_md", name), render)
 
 
 __all__ = ["to_skill_md"]
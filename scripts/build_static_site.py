@@ -8,21 +8,43 @@ empty string when serving from a custom-domain root).
 
 The site is fully static — no Python backend is required at runtime.
 The interactive validator stays available on the Replit/Vercel deploy.
+
+Builds are incremental: each route's inputs (templates, web code, static
+assets, plus the schema / example / doc files the route reads) are hashed
+into `dist/.build-manifest.json`, and a route is re-rendered only when that
+hash changes. Outputs are written only when their bytes differ, static
+assets are copied only when their size or mtime differs, and stale routes
+render in parallel across processes (`--jobs`). `--force` rebuilds all.
 """
 from __future__ import annotations
 
+import argparse
+import json
 import os
 import re
 import shutil
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 ROOT = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(ROOT))
 
-from web.app import app, EXAMPLES  # noqa: E402
+from tooling.disk_cache import content_hash  # noqa: E402
+from web.app import (  # noqa: E402
+    COMPARISON_PATH,
+    EXAMPLES,
+    EXAMPLES_DIR,
+    INTEGRATION_PATH,
+    SCHEMA_PATH,
+    app,
+)
 
 DIST = ROOT / "dist"
+MANIFEST = DIST / ".build-manifest.json"
+STATIC_SRC = ROOT / "web" / "static"
 BASE_PATH = os.environ.get("BASE_PATH", "/employee-md").rstrip("/")
 CANONICAL_ORIGIN = os.environ.get(
     "CANONICAL_ORIGIN", "https://nosytlabs.github.io"
@@ -90,44 +112,229 @@ def rewrite_urls(html: str) -> str:
     return _URL_ATTR_RE.sub(sub, html)
 
 
-def main() -> int:
-    if DIST.exists():
-        shutil.rmtree(DIST)
-    DIST.mkdir(parents=True)
+# ---- route inputs ---------------------------------------------------------
 
-    static_src = ROOT / "web" / "static"
-    if static_src.is_dir():
-        shutil.copytree(static_src, DIST / "static")
+def _files(root: Path, pattern: str = "**/*") -> List[Path]:
+    return sorted(p for p in root.glob(pattern) if p.is_file())
 
-    client = app.test_client()
-    snapped = 0
-    failed: list[tuple[str, int]] = []
 
-    for route in routes():
-        resp = client.get(route)
-        if resp.status_code != 200:
-            failed.append((route, resp.status_code))
-            print(f"  FAIL    {route}  ({resp.status_code})")
-            continue
+def common_inputs() -> List[Path]:
+    """Files every route's output may depend on."""
+    return [
+        *_files(ROOT / "web" / "templates"),
+        *_files(ROOT / "web", "*.py"),
+        # Pages link assets as `?v=<content hash>`.
+        *_files(STATIC_SRC),
+        ROOT / "tooling" / "constants.py",
+        Path(__file__).resolve(),
+    ]
+
+
+def route_inputs(route: str) -> List[Path]:
+    """Files a single route reads on top of `common_inputs()`."""
+    examples = _files(EXAMPLES_DIR, "*.md")
+    if route == "/":
+        return [SCHEMA_PATH, COMPARISON_PATH, *examples]
+    if route == "/spec":
+        return [SCHEMA_PATH]
+    if route in ("/examples", "/sitemap.xml"):
+        return examples
+    if route.startswith("/examples/"):
+        return [EXAMPLES_DIR / f"{route.rsplit('/', 1)[-1]}.md"]
+    if route == "/runtime":
+        return [EXAMPLES_DIR / "senior-dev.md", *_files(ROOT / "runtime", "*.py")]
+    if route == "/integration":
+        return [INTEGRATION_PATH]
+    return []
+
+
+def input_digests(route_list: Iterable[str]) -> Dict[str, str]:
+    """Per route, a hash of everything its output is derived from."""
+    file_digests: Dict[Path, str] = {}
+
+    def digest(paths: Iterable[Path]) -> str:
+        parts = []
+        for path in paths:
+            if path not in file_digests:
+                try:
+                    file_digests[path] = content_hash(path.read_bytes())
+                except OSError:
+                    file_digests[path] = "missing"
+            parts.append(f"{path.relative_to(ROOT)}={file_digests[path]}")
+        return content_hash("\n".join(parts).encode("utf-8"))
+
+    common = digest(common_inputs())
+    settings = f"{BASE_PATH}|{CANONICAL_ORIGIN}"
+    return {
+        route: content_hash(f"{settings}|{common}|{digest(route_inputs(route))}".encode())
+        for route in route_list
+    }
+
+
+# ---- rendering ------------------------------------------------------------
+
+_client: Any = None
+
+
+def render(route: str) -> Tuple[str, int, Optional[bytes], float]:
+    """(route, status, rewritten body or None, seconds) for one route.
+
+    Runs in the build process or in a worker; each keeps one test client.
+    """
+    global _client
+    if _client is None:
+        _client = app.test_client()
+    start = time.perf_counter()
+    resp = _client.get(route)
+    if resp.status_code != 200:
+        return route, resp.status_code, None, time.perf_counter() - start
+
+    body = resp.get_data()
+    ctype = resp.headers.get("Content-Type", "")
+    if any(t in ctype for t in ("text/html", "xml", "text/plain", "css")):
+        try:
+            body = rewrite_urls(body.decode("utf-8")).encode("utf-8")
+        except UnicodeDecodeError:
+            pass
+    return route, 200, body, time.perf_counter() - start
+
 
-        body = resp.get_data()
-        ctype = resp.headers.get("Content-Type", "")
-        if any(t in ctype for t in ("text/html", "xml", "text/plain", "css")):
-            try:
-                body = rewrite_urls(body.decode("utf-8")).encode("utf-8")
-            except UnicodeDecodeError:
-                pass
+def render_all(route_list: List[str], jobs: int) -> List[Tuple[str, int, Optional[bytes], float]]:
+    """Render `route_list`, across `jobs` processes when that can pay off."""
+    if jobs < 2 or len(route_list) < 2:
+        return [render(route) for route in route_list]
+    with ProcessPoolExecutor(max_workers=min(jobs, len(route_list))) as pool:
+        return list(pool.map(render, route_list))
 
+
+# ---- output ---------------------------------------------------------------
+
+def write_if_changed(path: Path, body: bytes) -> bool:
+    """Write `body` to `path` unless it already holds exactly that."""
+    try:
+        if path.stat().st_size == len(body) and path.read_bytes() == body:
+            return False
+    except OSError:
+        pass
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(body)
+    return True
+
+
+def sync_static(src: Path, dst: Path) -> Tuple[int, int, int]:
+    """Mirror `src` into `dst`, copying only files whose size or mtime differ.
+
+    Returns:
+        (copied, unchanged, removed) file counts
+    """
+    copied = unchanged = removed = 0
+    wanted = set()
+    for path in _files(src):
+        rel = path.relative_to(src)
+        wanted.add(rel)
+        target = dst / rel
+        st = path.stat()
+        try:
+            tst = target.stat()
+            if tst.st_size == st.st_size and tst.st_mtime_ns == st.st_mtime_ns:
+                unchanged += 1
+                continue
+        except OSError:
+            pass
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(path, target)
+        copied += 1
+    if dst.is_dir():
+        for path in _files(dst):
+            if path.relative_to(dst) not in wanted:
+                path.unlink()
+                removed += 1
+    return copied, unchanged, removed
+
+
+def load_manifest() -> Dict[str, Dict[str, str]]:
+    try:
+        data = json.loads(MANIFEST.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data.get("routes", {}) if isinstance(data, dict) else {}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--force", action="store_true", help="Re-render every route, ignoring the manifest"
+    )
+    parser.add_argument(
+        "--jobs", type=int, default=os.cpu_count() or 1,
+        help="Worker processes for rendering (default: CPU count)",
+    )
+    args = parser.parse_args(argv)
+
+    build_start = time.perf_counter()
+    DIST.mkdir(parents=True, exist_ok=True)
+    copied, kept, dropped = sync_static(STATIC_SRC, DIST / "static")
+
+    route_list = routes()
+    digests = input_digests(route_list)
+    previous = {} if args.force else load_manifest()
+    stale = [
+        route for route in route_list
+        if previous.get(route, {}).get("inputs") != digests[route]
+        or not output_path(route).is_file()
+    ]
+
+    render_start = time.perf_counter()
+    rendered = render_all(stale, args.jobs)
+    render_wall = time.perf_counter() - render_start
+
+    manifest = {route: previous[route] for route in route_list if route not in stale}
+    timings: Dict[str, Tuple[str, float]] = {}
+    failed: List[Tuple[str, int]] = []
+    written = 0
+    for route, status, body, seconds in rendered:
+        if body is None:
+            failed.append((route, status))
+            timings[route] = (f"FAIL {status}", seconds)
+            continue
+        changed = write_if_changed(output_path(route), body)
+        written += changed
+        timings[route] = ("written" if changed else "same", seconds)
+        manifest[route] = {"inputs": digests[route]}
+
+    # Routes that no longer exist (e.g. a deleted example).
+    removed_pages = 0
+    for route in set(previous) - set(route_list):
         out = output_path(route)
-        out.parent.mkdir(parents=True, exist_ok=True)
-        out.write_bytes(body)
-        snapped += 1
-        print(f"  OK      {route}  -> {out.relative_to(ROOT)}")
+        if out.is_file():
+            out.unlink()
+            removed_pages += 1
+
+    (DIST / ".nojekyll").write_text("", encoding="utf-8")
+    MANIFEST.write_text(
+        json.dumps({"routes": manifest}, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+    )
 
-    nojekyll = DIST / ".nojekyll"
-    nojekyll.write_text("", encoding="utf-8")
+    print(f"  {'route':<36} {'result':<10} {'time':>9}")
+    for route in route_list:
+        result, seconds = timings.get(route, ("unchanged", 0.0))
+        shown = f"{seconds * 1000:7.1f}ms" if route in timings else f"{'-':>9}"
+        print(f"  {route:<36} {result:<10} {shown}")
 
-    print(f"\nSnapshot complete: {snapped} pages, {len(failed)} failed")
+    total = time.perf_counter() - build_start
+    render_cpu = sum(seconds for _, seconds in timings.values())
+    print(
+        f"\nSnapshot complete: {len(route_list)} routes, {len(stale)} rendered "
+        f"({written} written), {len(route_list) - len(stale)} unchanged, "
+        f"{removed_pages} removed, {len(failed)} failed"
+    )
+    print(
+        f"  static:    {copied} copied, {kept} unchanged, {dropped} removed"
+    )
+    print(
+        f"  time:      {total:.2f}s total, {render_wall:.2f}s rendering "
+        f"({render_cpu:.2f}s summed over routes, {args.jobs} jobs)"
+    )
     print(f"  base path: {BASE_PATH or '/ (root)'}")
     print(f"  output:    {DIST.relative_to(ROOT)}/")
     return 1 if failed else 0
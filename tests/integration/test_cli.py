@@ -1,7 +1,15 @@
 """Integration tests for CLI."""
 
+import json
+import os
+import shutil
 import subprocess
 import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
 
 
 class TestCLI:
@@ -49,3 +57,105 @@ class TestCLI:
         )
         assert result.returncode != 0
         assert "No files found" in result.stderr or "Error" in result.stderr
+
+    def test_cli_ndjson_output(self, tmp_path):
+        """Test NDJSON output emits one JSON object per file."""
+        valid = tmp_path / "valid.md"
+        valid.write_text("role:\n  title: Agent\n  level: senior\nlifecycle:\n  status: active\n")
+        invalid = tmp_path / "invalid.md"
+        invalid.write_text("role:\n  title: Agent\n  level: boss\nlifecycle:\n  status: active\n")
+
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "tooling.cli",
+                str(valid),
+                str(invalid),
+                "--format",
+                "ndjson",
+                "--no-cache",
+                "--quiet",
+            ],
+            capture_output=True,
+            text=True,
+        )
+
+        lines = [json.loads(line) for line in result.stdout.splitlines()]
+        assert result.returncode == 1
+        assert {line["file"]: line["valid"] for line in lines} == {
+            str(valid): True,
+            str(invalid): False,
+        }
+
+    def test_cli_reads_executor_settings_from_env(self, tmp_path):
+        """Test EMPLOYEE_MD_EXECUTOR / EMPLOYEE_MD_WORKERS act as defaults."""
+        contract = tmp_path / "valid.md"
+        contract.write_text("role:\n  title: Agent\n  level: senior\nlifecycle:\n  status: active\n")
+
+        def run(*args, **env):
+            return subprocess.run(
+                [sys.executable, "-m", "tooling.cli", str(contract), "--no-cache", *args],
+                capture_output=True,
+                text=True,
+                env={**os.environ, **env},
+            )
+
+        result = run(EMPLOYEE_MD_WORKERS="0")
+        assert result.returncode == 1
+        assert "--workers must be at least 1" in result.stderr
+        assert run("--workers", "1", EMPLOYEE_MD_WORKERS="0").returncode == 0
+
+        result = run(EMPLOYEE_MD_EXECUTOR="fibers")
+        assert result.returncode == 1
+        assert "'fibers'" in result.stderr
+        assert run("--executor", "thread", EMPLOYEE_MD_EXECUTOR="fibers").returncode == 0
+
+        assert run(EMPLOYEE_MD_EXECUTOR="process", EMPLOYEE_MD_WORKERS="2").returncode == 0
+
+    @pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+    def test_cli_changed_since_skips_non_contract_markdown(self, tmp_path):
+        """Test --changed-since without paths ignores changed docs."""
+        contract = "role:\n  title: Agent\n  level: senior\nlifecycle:\n  status: active\n"
+        (tmp_path / "employee.md").write_text(contract)
+        (tmp_path / "README.md").write_text("# Project\n")
+
+        def git(*args):
+            subprocess.run(
+                ["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+                cwd=tmp_path,
+                check=True,
+                capture_output=True,
+            )
+
+        git("init", "-q")
+        git("add", ".")
+        git("commit", "-q", "-m", "initial")
+
+        (tmp_path / "employee.md").write_text(contract + "# edited\n")
+        (tmp_path / "README.md").write_text("# Project\n\nSee the docs.\n")
+        (tmp_path / "docs").mkdir()
+        (tmp_path / "docs" / "guide.md").write_text("Some *prose*.\n")
+
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "tooling.cli",
+                "--changed-since",
+                "HEAD",
+                "--format",
+                "ndjson",
+                "--no-cache",
+                "--quiet",
+            ],
+            capture_output=True,
+            text=True,
+            cwd=tmp_path,
+            env={**os.environ, "PYTHONPATH": str(REPO_ROOT)},
+        )
+
+        assert result.returncode == 0, result.stderr
+        lines = [json.loads(line) for line in result.stdout.splitlines()]
+        assert [line["file"] for line in lines] == ["employee.md"]
+        assert lines[0]["valid"] is True
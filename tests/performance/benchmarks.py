@@ -1,14 +1,40 @@
 """Performance benchmarks for employee.md validator."""
 
+import copy
+import os
+import subprocess
 import sys
+import tempfile
 import time
 from pathlib import Path
-from typing import List, Dict, Callable
+from typing import Any, List, Dict, Callable
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
+from tooling.cache import reset_cache
+from tooling.cli import expand_file_patterns
 from tooling.employee_validator import EmployeeValidationOrchestrator
+from tooling.git_changes import changed_files_since, select_changed
 from tooling.monitoring import get_metrics, reset_metrics
+from tooling.parser import LIBYAML_AVAILABLE, SecureYAMLParser
+from tooling.validators import (
+    CompiledValidator,
+    EnumValidator,
+    FormatValidator,
+    RangeValidator,
+    RequiredFieldValidator,
+    TypeValidator,
+)
+
+
+def _ledger_worker(path: str, reservations: int, barrier: Any) -> None:
+    from runtime import BudgetLedger, BudgetTracker
+
+    tracker = BudgetTracker(1e12, ledger=BudgetLedger(path, key="benchmark"))
+    tracker.try_spend(0.0)
+    barrier.wait()
+    for _ in range(reservations):
+        tracker.try_spend(0.001)
 
 
 class BenchmarkRunner:
@@ -168,6 +194,921 @@ class BenchmarkRunner:
             "throughput_per_minute": throughput * 60,
         }
 
+    def benchmark_yaml_parsing(
+        self, files: List[str], iterations: int = 20
+    ) -> Dict[str, Dict]:
+        """Compare the pure-Python and libyaml-backed parser loaders.
+
+        Args:
+            files: List of file paths to parse
+            iterations: Number of iterations
+
+        Returns:
+            Dictionary with timing results per loader and the speedup
+        """
+        contents = [Path(f).read_text(encoding="utf-8") for f in files]
+        python_parser = SecureYAMLParser(use_libyaml=False)
+        libyaml_parser = SecureYAMLParser()
+
+        def run_python():
+            for content in contents:
+                python_parser.parse_string(content)
+
+        def run_libyaml():
+            for content in contents:
+                libyaml_parser.parse_string(content)
+
+        python_results = self.run_benchmark(
+            f"parse_python_{len(files)}_files", run_python, iterations
+        )
+        libyaml_results = self.run_benchmark(
+            f"parse_libyaml_{len(files)}_files", run_libyaml, iterations
+        )
+
+        return {
+            "python": python_results,
+            "libyaml": libyaml_results,
+            "libyaml_available": LIBYAML_AVAILABLE,
+            "speedup": python_results["mean"] / libyaml_results["mean"],
+            "file_count": len(files),
+        }
+
+    def benchmark_per_file_overhead(
+        self, files: List[str], iterations: int = 20
+    ) -> Dict[str, Dict]:
+        """Compare a warm orchestrator with one built per file.
+
+        A fresh orchestrator per file pays for validator instances, a parser
+        and a thread pool on every call; the warm one creates them once.
+        Caching is disabled so both sides parse and validate every file.
+
+        Args:
+            files: List of file paths to validate
+            iterations: Number of iterations
+
+        Returns:
+            Dictionary with timing results per mode and per-file overhead
+        """
+        warm = EmployeeValidationOrchestrator(use_cache=False, parallel_validation=True)
+
+        def run_cold():
+            for filepath in files:
+                with EmployeeValidationOrchestrator(
+                    use_cache=False, parallel_validation=True
+                ) as orchestrator:
+                    orchestrator.validate_file(filepath)
+
+        def run_warm():
+            for filepath in files:
+                warm.validate_file(filepath)
+
+        cold_results = self.run_benchmark(
+            f"per_file_cold_{len(files)}_files", run_cold, iterations
+        )
+        warm_results = self.run_benchmark(
+            f"per_file_warm_{len(files)}_files", run_warm, iterations
+        )
+        warm.close()
+
+        return {
+            "cold": cold_results,
+            "warm": warm_results,
+            "overhead_per_file": (cold_results["mean"] - warm_results["mean"])
+            / len(files),
+            "speedup": cold_results["mean"] / warm_results["mean"],
+            "file_count": len(files),
+        }
+
+    def benchmark_compiled_plan(
+        self, files: List[str], corpus_size: int = 10000, iterations: int = 3
+    ) -> Dict[str, Dict]:
+        """Compare the five validators with the compiled single-pass plan.
+
+        The corpus is ``corpus_size`` parsed contracts cycled from ``files``,
+        each with its own agent_id so no two documents are identical.
+
+        Args:
+            files: List of file paths to build the corpus from
+            corpus_size: Number of contracts to validate per iteration
+            iterations: Number of iterations
+
+        Returns:
+            Dictionary with timing results per mode and the speedup
+        """
+        parser = SecureYAMLParser()
+        templates = [parser.parse_string(Path(f).read_text())[0] for f in files]
+        corpus = []
+        for i in range(corpus_size):
+            contract = copy.deepcopy(templates[i % len(templates)])
+            if isinstance(contract.get("identity"), dict):
+                contract["identity"]["agent_id"] = f"agent-{i}"
+            corpus.append(contract)
+
+        validators = [
+            RequiredFieldValidator(),
+            EnumValidator(),
+            TypeValidator(),
+            FormatValidator(),
+            RangeValidator(),
+        ]
+        compiled = CompiledValidator()
+
+        def run_validators():
+            for contract in corpus:
+                for validator in validators:
+                    validator.validate(contract)
+
+        def run_compiled():
+            for contract in corpus:
+                compiled.validate(contract)
+
+        validator_results = self.run_benchmark(
+            f"validators_{corpus_size}_contracts", run_validators, iterations, 1
+        )
+        compiled_results = self.run_benchmark(
+            f"compiled_{corpus_size}_contracts", run_compiled, iterations, 1
+        )
+
+        return {
+            "validators": validator_results,
+            "compiled": compiled_results,
+            "speedup": validator_results["mean"] / compiled_results["mean"],
+            "contract_count": corpus_size,
+        }
+
+    def benchmark_changed_since(
+        self, files: List[str], file_count: int = 20000, changed_count: int = 10
+    ) -> Dict[str, Any]:
+        """Compare full-tree validation with --changed-since on a git repo.
+
+        Builds a throwaway repository of ``file_count`` contracts, commits
+        it, edits ``changed_count`` of them and times three CI-style runs:
+        the whole tree with no cache, the whole tree with a warm persistent
+        cache, and only the files changed since HEAD.
+
+        Args:
+            files: Contract files used as templates
+            file_count: Number of contracts in the synthetic repository
+            changed_count: Number of contracts edited after the commit
+
+        Returns:
+            Dictionary with wall time per mode
+        """
+        templates = [Path(f).read_text(encoding="utf-8") for f in files]
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as repo:
+            for i in range(file_count):
+                directory = Path(repo, "agents", f"team-{i // 100:03d}")
+                directory.mkdir(parents=True, exist_ok=True)
+                (directory / f"agent-{i}.md").write_text(templates[i % len(templates)])
+            git = ["git", "-c", "user.name=bench", "-c", "user.email=bench@example.com"]
+            subprocess.run(git + ["init", "-q"], cwd=repo, check=True)
+            subprocess.run(git + ["add", "."], cwd=repo, check=True)
+            subprocess.run(git + ["commit", "-q", "-m", "corpus"], cwd=repo, check=True)
+            for i in range(0, file_count, file_count // changed_count):
+                path = Path(repo, "agents", f"team-{i // 100:03d}", f"agent-{i}.md")
+                path.write_text(path.read_text() + f"# edited {i}\n")
+
+            cache_dir = str(Path(repo, ".employee-md-cache"))
+            os.chdir(repo)
+            try:
+
+                def run_full(cached: bool) -> int:
+                    reset_cache()
+                    with EmployeeValidationOrchestrator(
+                        use_cache=cached, cache_dir=cache_dir if cached else None
+                    ) as orchestrator:
+                        return len(orchestrator.validate_batch(expand_file_patterns(["agents"])))
+
+                def run_changed() -> int:
+                    reset_cache()
+                    selected = select_changed(["agents"], changed_files_since("HEAD"))
+                    with EmployeeValidationOrchestrator(cache_dir=cache_dir) as orchestrator:
+                        return len(orchestrator.validate_batch(selected))
+
+                timings: Dict[str, Any] = {}
+                for name, func in (
+                    ("full_no_cache", lambda: run_full(False)),
+                    ("populate_cache", lambda: run_full(True)),
+                    ("full_warm_cache", lambda: run_full(True)),
+                    ("changed_since", run_changed),
+                ):
+                    start = time.perf_counter()
+                    count = func()
+                    timings[name] = {"seconds": time.perf_counter() - start, "files": count}
+            finally:
+                os.chdir(cwd)
+
+        timings.pop("populate_cache")
+        timings["file_count"] = file_count
+        timings["changed_count"] = changed_count
+        return timings
+
+    def benchmark_employee_load(
+        self, files: List[str], iterations: int = 20
+    ) -> Dict[str, Any]:
+        """Count YAML parses and time each ``Employee.from_file`` load.
+
+        Loading reads the file once and validates the tree it parsed, so
+        every validated load should cost exactly one parse.
+
+        Args:
+            files: List of contract paths to load
+            iterations: Number of iterations
+
+        Returns:
+            Dictionary with load timings and parses per load
+        """
+        from yaml.constructor import BaseConstructor
+
+        from runtime.employee import Employee
+
+        parses = 0
+        original = BaseConstructor.get_single_data
+
+        def counting(constructor: Any) -> Any:
+            nonlocal parses
+            parses += 1
+            return original(constructor)
+
+        BaseConstructor.get_single_data = counting  # type: ignore[method-assign]
+        try:
+            for filepath in files:
+                Employee.from_file(filepath)
+            parses_per_load = parses / len(files)
+        finally:
+            BaseConstructor.get_single_data = original  # type: ignore[method-assign]
+
+        def run_load():
+            for filepath in files:
+                Employee.from_file(filepath)
+
+        timing = self.run_benchmark(
+            f"employee_load_{len(files)}_files", run_load, iterations
+        )
+
+        return {
+            "load": timing,
+            "parses_per_load": parses_per_load,
+            "per_load": timing["mean"] / len(files),
+            "file_count": len(files),
+        }
+
+    def benchmark_guardrail_matcher(
+        self, guardrails: int = 500, actions: int = 2000, iterations: int = 10
+    ) -> Dict[str, Any]:
+        """Compare the per-entry guardrail scan with the compiled matcher.
+
+        Args:
+            guardrails: Number of prohibited actions in the contract
+            actions: Number of actions checked per iteration
+            iterations: Number of iterations
+
+        Returns:
+            Dictionary with timing results per mode and the speedup
+        """
+        import random
+
+        from runtime.compact import _as_list
+        from runtime.employee import Employee
+
+        rng = random.Random(0)
+        verbs = ["delete", "drop", "export", "disable", "transfer", "publish"]
+        nouns = ["database", "backups", "user records", "audit log", "funds"]
+        prohibited = [
+            f"{rng.choice(verbs)} {rng.choice(nouns)} in region {i}"
+            for i in range(guardrails)
+        ]
+        checks = [
+            f"please {rng.choice(verbs)} the {rng.choice(nouns)} for ticket {i}"
+            for i in range(actions)
+        ] + prohibited[: actions // 10]
+        emp = Employee(
+            {
+                "role": {"title": "Agent"},
+                "lifecycle": {"status": "active"},
+                "guardrails": {"prohibited_actions": prohibited},
+            }
+        )
+
+        def linear_allowed(action: str) -> bool:
+            haystack = (action or "").strip().lower()
+            if not haystack:
+                return False
+            guardrails_section = emp.data.get("guardrails") or {}
+            for forbidden in _as_list(guardrails_section.get("prohibited_actions")):
+                needle = forbidden.strip().lower()
+                if needle and (needle in haystack or haystack in needle):
+                    return False
+            return True
+
+        assert [linear_allowed(a) for a in checks] == [
+            emp.is_action_allowed(a) for a in checks
+        ]
+
+        def run_linear():
+            for action in checks:
+                linear_allowed(action)
+
+        def run_compiled():
+            for action in checks:
+                emp.is_action_allowed(action)
+
+        linear_results = self.run_benchmark(
+            f"guardrails_linear_{guardrails}", run_linear, iterations
+        )
+        compiled_results = self.run_benchmark(
+            f"guardrails_compiled_{guardrails}", run_compiled, iterations
+        )
+
+        return {
+            "linear": linear_results,
+            "matcher": compiled_results,
+            "speedup": linear_results["mean"] / compiled_results["mean"],
+            "per_check": compiled_results["mean"] / len(checks),
+            "guardrail_count": guardrails,
+        }
+
+    def benchmark_scope_matcher(
+        self, phrases: int = 200, tasks: int = 1000, iterations: int = 10
+    ) -> Dict[str, Any]:
+        """Compare the pairwise scope scan with the indexed scope matcher.
+
+        Args:
+            phrases: Number of scope phrases, split between in and out of scope
+            tasks: Number of task descriptions decided per iteration
+            iterations: Number of iterations
+
+        Returns:
+            Dictionary with timing results per mode and the speedup
+        """
+        import random
+        import re
+
+        from runtime.employee import Employee, ScopeDecision
+
+        rng = random.Random(0)
+        letters = "abcdefghijklmnopqrstuvwxyz"
+        vocabulary = [
+            "".join(rng.choice(letters) for _ in range(rng.randint(3, 9)))
+            for _ in range(300)
+        ]
+
+        def sentence(words: int) -> str:
+            return " ".join(rng.choice(vocabulary) for _ in range(words))
+
+        out_of_scope = [sentence(3) + f" zone{i}" for i in range(phrases // 2)]
+        in_scope = [sentence(2) for _ in range(phrases - phrases // 2)]
+        texts = [f"please {sentence(12)} today" for _ in range(tasks)]
+        emp = Employee(
+            {
+                "role": {"title": "Agent"},
+                "lifecycle": {"status": "active"},
+                "scope": {"in_scope": in_scope, "out_of_scope": out_of_scope},
+            }
+        )
+
+        def pairwise_tokens(text: str) -> set:
+            stop = {"and", "the", "for", "with", "that", "this", "from", "into", "your"}
+            return {
+                w
+                for w in re.findall(r"[a-zA-Z0-9_]{3,}", (text or "").lower())
+                if w not in stop
+            }
+
+        def pairwise_matches(phrase: str, tokens: set, lower: str) -> bool:
+            if not phrase:
+                return False
+            if phrase.lower() in lower:
+                return True
+            phrase_tokens = pairwise_tokens(phrase)
+            if not phrase_tokens:
+                return False
+            return all(
+                any(t.startswith(p[:4]) or p.startswith(t[:4]) for t in tokens)
+                for p in phrase_tokens
+            )
+
+        def pairwise_decision(text: str) -> ScopeDecision:
+            lower = (text or "").lower()
+            tokens = pairwise_tokens(text)
+            for needle in out_of_scope:
+                if pairwise_matches(needle, tokens, lower):
+                    return ScopeDecision(False, needle, "matched out_of_scope")
+            for needle in in_scope:
+                if pairwise_matches(needle, tokens, lower):
+                    return ScopeDecision(True, needle, "matched in_scope")
+            return ScopeDecision(
+                False, None, "no in_scope entry matched (fail-closed default)"
+            )
+
+        assert [pairwise_decision(t) for t in texts] == [
+            emp.is_in_scope(t) for t in texts
+        ]
+
+        def run_pairwise():
+            for text in texts:
+                pairwise_decision(text)
+
+        def run_indexed():
+            for text in texts:
+                emp.is_in_scope(text)
+
+        pairwise_results = self.run_benchmark(
+            f"scope_pairwise_{phrases}", run_pairwise, iterations
+        )
+        indexed_results = self.run_benchmark(
+            f"scope_indexed_{phrases}", run_indexed, iterations
+        )
+
+        return {
+            "pairwise": pairwise_results,
+            "indexed": indexed_results,
+            "speedup": pairwise_results["mean"] / indexed_results["mean"],
+            "per_decision": indexed_results["mean"] / len(texts),
+            "phrase_count": phrases,
+        }
+
+    def benchmark_batch_classify(
+        self, tasks: int = 50_000, distinct: int = 5_000, iterations: int = 3
+    ) -> Dict[str, Any]:
+        """Compare a per-task is_in_scope loop with classify_many.
+
+        The queue repeats tasks the way dispatcher queues do, so the batch
+        API's per-text dedupe is exercised as well as the process pool.
+
+        Args:
+            tasks: Queue length
+            distinct: Number of distinct task descriptions in the queue
+            iterations: Number of iterations
+
+        Returns:
+            Dictionary with timing results per mode
+        """
+        import random
+
+        from runtime.employee import Employee
+
+        rng = random.Random(0)
+        letters = "abcdefghijklmnopqrstuvwxyz"
+        vocabulary = [
+            "".join(rng.choice(letters) for _ in range(rng.randint(3, 9)))
+            for _ in range(300)
+        ]
+
+        def sentence(words: int) -> str:
+            return " ".join(rng.choice(vocabulary) for _ in range(words))
+
+        emp = Employee(
+            {
+                "role": {"title": "Agent"},
+                "lifecycle": {"status": "active"},
+                "scope": {
+                    "in_scope": [sentence(2) for _ in range(100)],
+                    "out_of_scope": [sentence(3) for _ in range(100)],
+                },
+            }
+        )
+        pool = [f"please {sentence(12)} today" for _ in range(distinct)]
+        queue = [rng.choice(pool) for _ in range(tasks)]
+
+        def run_loop():
+            for text in queue:
+                emp.is_in_scope(text)
+
+        def run_batch():
+            emp.classify_many(queue)
+
+        def run_workers():
+            emp.classify_many(queue, workers=0)
+
+        loop_results = self.run_benchmark(f"scope_loop_{tasks}", run_loop, iterations)
+        batch_results = self.run_benchmark(
+            f"scope_classify_many_{tasks}", run_batch, iterations
+        )
+        worker_results = self.run_benchmark(
+            f"scope_classify_many_workers_{tasks}", run_workers, iterations
+        )
+
+        return {
+            "loop": loop_results,
+            "batch": batch_results,
+            "workers": worker_results,
+            "speedup": loop_results["mean"] / batch_results["mean"],
+            "task_count": tasks,
+            "distinct_count": distinct,
+        }
+
+    def benchmark_prompt_cache(
+        self, files: List[str], calls: int = 1000, iterations: int = 5
+    ) -> Dict[str, Any]:
+        """Compare re-rendering the system prompt with the memoized one.
+
+        Args:
+            files: Contracts to render
+            calls: Prompt requests per contract per iteration
+            iterations: Number of iterations
+
+        Returns:
+            Dictionary with timing results per mode
+        """
+        from runtime.employee import Employee
+
+        employees = [Employee.from_file(f) for f in files]
+
+        def run_render():
+            for emp in employees:
+                for _ in range(calls):
+                    emp._render_system_prompt()
+
+        def run_cached():
+            for emp in employees:
+                for _ in range(calls):
+                    emp.system_prompt()
+
+        render_results = self.run_benchmark(
+            f"prompt_render_{len(files)}", run_render, iterations
+        )
+        cached_results = self.run_benchmark(
+            f"prompt_cached_{len(files)}", run_cached, iterations
+        )
+        requests = len(files) * calls
+        return {
+            "render": render_results,
+            "cached": cached_results,
+            "render_per_call": render_results["mean"] / requests,
+            "cached_per_call": cached_results["mean"] / requests,
+            "speedup": render_results["mean"] / cached_results["mean"],
+        }
+
+    def benchmark_budget_contention(
+        self, threads: int = 128, spends: int = 2000, tasks: int = 1000
+    ) -> Dict[str, Any]:
+        """Micro-spends from many threads (and asyncio tasks) on one budget.
+
+        Compares the single-lock BudgetTracker with ShardedBudgetTracker,
+        and the asyncio front end with a plain tracker called from
+        coroutines. Sharding removes cross-thread lock contention, which
+        only shows up where threads really run in parallel (several cores,
+        or a free-threaded interpreter); under the GIL on one core both
+        trackers are bound by the interpreter itself.
+
+        Args:
+            threads: Concurrent spending threads
+            spends: Spends per thread (and per asyncio task)
+            tasks: Concurrent asyncio tasks
+
+        Returns:
+            Dictionary with spends/second per tracker
+        """
+        import asyncio
+        import threading
+
+        from runtime import AsyncBudgetTracker, BudgetTracker, ShardedBudgetTracker
+
+        def run_threads(tracker: Any) -> float:
+            barrier = threading.Barrier(threads + 1)
+
+            def worker():
+                barrier.wait()
+                for _ in range(spends):
+                    tracker.try_spend(0.0001)
+
+            workers = [threading.Thread(target=worker) for _ in range(threads)]
+            for w in workers:
+                w.start()
+            start = time.perf_counter()
+            barrier.wait()
+            for w in workers:
+                w.join()
+            return threads * spends / (time.perf_counter() - start)
+
+        def run_tasks(spend: Callable[[float], Any]) -> float:
+            async def task():
+                for _ in range(spends // 10):
+                    await spend(0.0001)
+                    await asyncio.sleep(0)
+
+            async def main():
+                await asyncio.gather(*(task() for _ in range(tasks)))
+
+            start = time.perf_counter()
+            asyncio.run(main())
+            return tasks * (spends // 10) / (time.perf_counter() - start)
+
+        plain = BudgetTracker(1e12)
+        async_tracker = AsyncBudgetTracker(limit=1e12)
+
+        async def plain_spend(amount: float) -> bool:
+            return plain.try_spend(amount)
+
+        return {
+            "threads": {
+                "lock": run_threads(BudgetTracker(1e12)),
+                "sharded": run_threads(ShardedBudgetTracker(1e12)),
+            },
+            "asyncio": {
+                "lock": run_tasks(plain_spend),
+                "sharded": run_tasks(async_tracker.try_spend),
+            },
+            "thread_count": threads,
+            "task_count": tasks,
+            "cpu_count": os.cpu_count(),
+        }
+
+    def benchmark_shared_ledger(
+        self, processes: int = 8, reservations: int = 2000
+    ) -> Dict[str, Any]:
+        """Reservations per second against one BudgetLedger from N processes.
+
+        Args:
+            processes: Concurrent worker processes
+            reservations: Reservations per process
+
+        Returns:
+            Dictionary with throughput and the final ledger total
+        """
+        import multiprocessing
+
+        from runtime import BudgetLedger
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "budget.sqlite3")
+            barrier = multiprocessing.Barrier(processes + 1)
+            workers = [
+                multiprocessing.Process(
+                    target=_ledger_worker, args=(path, reservations, barrier)
+                )
+                for _ in range(processes)
+            ]
+            for w in workers:
+                w.start()
+            barrier.wait()
+            start = time.perf_counter()
+            for w in workers:
+                w.join()
+            elapsed = time.perf_counter() - start
+
+            ledger = BudgetLedger(path, key="benchmark")
+            total = ledger.spent()
+            ledger.close()
+
+        return {
+            "reservations_per_second": processes * reservations / elapsed,
+            "reservations": processes * reservations,
+            "process_count": processes,
+            "ledger_total": total,
+            "cpu_count": os.cpu_count(),
+        }
+
+    def benchmark_compact_view(
+        self, files: List[str], calls: int = 10_000, iterations: int = 5
+    ) -> Dict[str, Any]:
+        """Memory per contract and accessor cost, raw tree vs compact view.
+
+        Args:
+            files: Contracts to load
+            calls: Accessor rounds per contract per iteration
+            iterations: Number of iterations
+
+        Returns:
+            Dictionary with bytes per contract and accessor timings
+        """
+        from runtime.compact import _as_list, deep_sizeof
+        from runtime.employee import Employee
+
+        kept = [Employee.from_file(f) for f in files]
+        dropped = [Employee.from_file(f, keep_data=False) for f in files]
+        tree_bytes = sum(deep_sizeof(emp.data) for emp in kept) / len(files)
+        view_bytes = sum(emp.memory_size() for emp in dropped) / len(files)
+
+        def walk_tree():
+            # The accessors as they were: `.get(...) or {}` chains per call.
+            for emp in kept:
+                d = emp.data
+                for _ in range(calls):
+                    ident = d.get("identity") or {}
+                    ident.get("agent_id")
+                    str(d["lifecycle"].get("status") or "unknown")
+                    _as_list((d.get("scope") or {}).get("in_scope"))
+
+        def read_view():
+            for emp in dropped:
+                for _ in range(calls):
+                    emp.agent_id
+                    emp.status
+                    emp.in_scope()
+
+        tree_results = self.run_benchmark(
+            f"accessors_tree_{len(files)}", walk_tree, iterations
+        )
+        view_results = self.run_benchmark(
+            f"accessors_view_{len(files)}", read_view, iterations
+        )
+        return {
+            "tree": tree_results,
+            "view": view_results,
+            "tree_bytes_per_contract": tree_bytes,
+            "view_bytes_per_contract": view_bytes,
+            "speedup": tree_results["mean"] / view_results["mean"],
+        }
+
+    def benchmark_async_load(
+        self, source: str, contracts: int = 1000, tick: float = 0.001
+    ) -> Dict[str, Any]:
+        """Event-loop latency while contracts load, blocking vs `aload`.
+
+        A ticker task sleeps `tick` seconds in a loop and records how late
+        it wakes up; the lag is what every other coroutine on the loop
+        would see.
+
+        Args:
+            source: Contract copied (with a fresh agent_id) `contracts` times
+            contracts: Number of contracts to load
+            tick: Ticker interval in seconds
+
+        Returns:
+            Dictionary with lag percentiles per mode and load durations
+        """
+        import asyncio
+        from concurrent.futures import ProcessPoolExecutor
+
+        from runtime import AsyncLoader, Employee
+
+        text = Path(source).read_text(encoding="utf-8")
+        agent_line = next(line for line in text.splitlines() if "agent_id:" in line)
+
+        def percentile(values: List[float], q: float) -> float:
+            ordered = sorted(values)
+            return ordered[min(len(ordered) - 1, int(q * len(ordered)))] if ordered else 0.0
+
+        async def measure(load: Callable[[], Any]) -> Dict[str, float]:
+            lags: List[float] = []
+            done = asyncio.Event()
+
+            async def ticker():
+                while not done.is_set():
+                    start = time.perf_counter()
+                    await asyncio.sleep(tick)
+                    lags.append(time.perf_counter() - start - tick)
+
+            ticking = asyncio.ensure_future(ticker())
+            await asyncio.sleep(tick * 5)
+            start = time.perf_counter()
+            await load()
+            elapsed = time.perf_counter() - start
+            done.set()
+            await ticking
+            return {
+                "seconds": elapsed,
+                "lag_p50": percentile(lags, 0.50),
+                "lag_p99": percentile(lags, 0.99),
+                "lag_max": max(lags, default=0.0),
+            }
+
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = []
+            for i in range(contracts):
+                path = os.path.join(tmp, f"agent-{i:05d}.md")
+                with open(path, "w", encoding="utf-8") as f:
+                    f.write(text.replace(agent_line, f'  agent_id: "agent-{i:05d}"'))
+                paths.append(path)
+
+            async def idle():
+                await asyncio.sleep(0.5)
+
+            async def blocking():
+                for path in paths:
+                    Employee.from_file(path)
+                    await asyncio.sleep(0)
+
+            async def offloaded():
+                await asyncio.gather(*(Employee.aload(path) for path in paths))
+
+            with ProcessPoolExecutor() as pool:
+                process_loader = AsyncLoader(pool)
+
+                async def offloaded_to_processes():
+                    await asyncio.gather(
+                        *(Employee.aload(path, loader=process_loader) for path in paths)
+                    )
+
+                results = {
+                    name: asyncio.run(measure(load))
+                    for name, load in (
+                        ("idle", idle),
+                        ("blocking", blocking),
+                        ("aload", offloaded),
+                        ("processes", offloaded_to_processes),
+                    )
+                }
+        results["async_contracts"] = contracts
+        return results
+
+    def benchmark_registry(self, source: str, contracts: int = 1000) -> Dict[str, Any]:
+        """Load a directory of contracts into an EmployeeRegistry and reload it.
+
+        Args:
+            source: Contract copied (with a fresh agent_id) `contracts` times
+            contracts: Number of contracts in the directory
+
+        Returns:
+            Dictionary with load / reload timings and lookup latency
+        """
+        from runtime import Employee, EmployeeRegistry
+
+        text = Path(source).read_text(encoding="utf-8")
+        agent_line = next(
+            line for line in text.splitlines() if "agent_id:" in line
+        )
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = []
+            for i in range(contracts):
+                path = os.path.join(tmp, f"agent-{i:05d}.md")
+                with open(path, "w", encoding="utf-8") as f:
+                    f.write(text.replace(agent_line, f'  agent_id: "agent-{i:05d}"'))
+                paths.append(path)
+
+            start = time.perf_counter()
+            for path in paths:
+                Employee.from_file(path)
+            per_file = time.perf_counter() - start
+
+            loads = {}
+            for executor in ("thread", "process"):
+                start = time.perf_counter()
+                registry = EmployeeRegistry(tmp, executor=executor)
+                loads[executor] = time.perf_counter() - start
+
+            start = time.perf_counter()
+            registry.reload()
+            unchanged = time.perf_counter() - start
+
+            with open(paths[0], "a", encoding="utf-8") as f:
+                f.write("\n")
+            os.utime(paths[0], ns=(0, time.time_ns() + 1_000_000_000))
+            start = time.perf_counter()
+            report = registry.reload()
+            one_changed = time.perf_counter() - start
+
+            agent_ids = registry.agent_ids()
+            for _ in range(10):
+                for agent_id in agent_ids:
+                    registry.get(agent_id)
+            metrics = registry.metrics()
+
+        return {
+            "registry_contracts": contracts,
+            "per_file_load": per_file,
+            "thread_load": loads["thread"],
+            "process_load": loads["process"],
+            "reload_unchanged": unchanged,
+            "reload_one_changed": one_changed,
+            "reloaded": len(report.updated),
+            "lookup_p50_ns": metrics["lookup_p50_ns"],
+            "lookup_p99_ns": metrics["lookup_p99_ns"],
+            "memory_bytes": metrics["memory_bytes"],
+            "cpu_count": os.cpu_count(),
+        }
+
+    def benchmark_site_render(self, requests: int = 300) -> Dict[str, Any]:
+        """Requests/second for the site's generated pages, render cache off vs on.
+
+        Uses Flask's test client, so the figures exclude the network and the
+        WSGI server but include routing, rendering and the caching headers.
+        With the cache off, every request re-derives the schema sections,
+        the highlighted YAML and the page HTML (the behaviour before the
+        render cache existed).
+
+        Args:
+            requests: Requests per route and mode
+
+        Returns:
+            Dictionary with requests/second per route and mode
+        """
+        from web import app as site
+
+        client = site.app.test_client()
+        routes = ["/", "/spec", "/examples", "/examples/senior-dev"]
+
+        def rps(route: str) -> float:
+            client.get(route)
+            start = time.perf_counter()
+            for _ in range(requests):
+                if client.get(route).status_code != 200:
+                    raise RuntimeError(f"{route} did not return 200")
+            return requests / (time.perf_counter() - start)
+
+        results: Dict[str, Any] = {"site_routes": routes, "requests": requests}
+        try:
+            for mode, enabled in (("uncached", False), ("cached", True)):
+                site._render_cache.enabled = enabled
+                site._render_cache.clear()
+                results[mode] = {route: rps(route) for route in routes}
+        finally:
+            site._render_cache.enabled = True
+        return results
+
     def print_results(self) -> None:
         """Print benchmark results in a formatted table."""
         print("\n" + "=" * 80)
@@ -194,6 +1135,156 @@ class BenchmarkRunner:
                 print(f"  Speedup:        {results['speedup']:.2f}x")
                 print(f"  Files:           {results['file_count']}")
 
+            elif "libyaml" in results:
+                print(f"  Python Loader Mean:  {results['python']['mean']*1000:.3f} ms")
+                print(f"  libyaml Loader Mean: {results['libyaml']['mean']*1000:.3f} ms")
+                print(f"  libyaml Available:   {results['libyaml_available']}")
+                print(f"  Speedup:             {results['speedup']:.2f}x")
+                print(f"  Files:               {results['file_count']}")
+
+            elif "cold" in results:
+                print(f"  Per-File Setup Mean: {results['cold']['mean']*1000:.3f} ms")
+                print(f"  Warm Reuse Mean:     {results['warm']['mean']*1000:.3f} ms")
+                print(
+                    f"  Overhead/File:       {results['overhead_per_file']*1e6:.1f} us"
+                )
+                print(f"  Speedup:             {results['speedup']:.2f}x")
+                print(f"  Files:               {results['file_count']}")
+
+            elif "compiled" in results:
+                print(
+                    f"  Five Validators Mean: {results['validators']['mean']*1000:.3f} ms"
+                )
+                print(
+                    f"  Compiled Plan Mean:   {results['compiled']['mean']*1000:.3f} ms"
+                )
+                print(f"  Speedup:              {results['speedup']:.2f}x")
+                print(f"  Contracts:            {results['contract_count']}")
+
+            elif "changed_since" in results:
+                for mode in ("full_no_cache", "full_warm_cache", "changed_since"):
+                    timing = results[mode]
+                    print(
+                        f"  {mode:<16} {timing['seconds']*1000:>10.1f} ms"
+                        f"  ({timing['files']} files)"
+                    )
+                print(
+                    f"  Repo: {results['file_count']} contracts, "
+                    f"{results['changed_count']} changed"
+                )
+
+            elif "parses_per_load" in results:
+                print(f"  Load Mean:       {results['per_load']*1e6:.1f} us/contract")
+                print(f"  Parses/Load:     {results['parses_per_load']:.2f}")
+                print(f"  Files:           {results['file_count']}")
+
+            elif "matcher" in results:
+                print(f"  Linear Scan Mean: {results['linear']['mean']*1000:.3f} ms")
+                print(f"  Matcher Mean:     {results['matcher']['mean']*1000:.3f} ms")
+                print(f"  Per Check:        {results['per_check']*1e6:.2f} us")
+                print(f"  Speedup:          {results['speedup']:.2f}x")
+                print(f"  Guardrails:       {results['guardrail_count']}")
+
+            elif "indexed" in results:
+                print(f"  Pairwise Mean: {results['pairwise']['mean']*1000:.3f} ms")
+                print(f"  Indexed Mean:  {results['indexed']['mean']*1000:.3f} ms")
+                print(f"  Per Decision:  {results['per_decision']*1e6:.2f} us")
+                print(f"  Speedup:       {results['speedup']:.2f}x")
+                print(f"  Phrases:       {results['phrase_count']}")
+
+            elif "batch" in results:
+                print(f"  is_in_scope Loop Mean:   {results['loop']['mean']*1000:.1f} ms")
+                print(f"  classify_many Mean:      {results['batch']['mean']*1000:.1f} ms")
+                print(
+                    f"  classify_many (pool):    {results['workers']['mean']*1000:.1f} ms"
+                )
+                print(f"  Speedup:                 {results['speedup']:.2f}x")
+                print(
+                    f"  Tasks:                   {results['task_count']} "
+                    f"({results['distinct_count']} distinct)"
+                )
+
+            elif "cached_per_call" in results:
+                print(f"  Render Per Call: {results['render_per_call']*1e6:.2f} us")
+                print(f"  Cached Per Call: {results['cached_per_call']*1e6:.2f} us")
+                print(f"  Speedup:         {results['speedup']:.2f}x")
+
+            elif "thread_count" in results:
+                for mode in ("threads", "asyncio"):
+                    lock = results[mode]["lock"]
+                    sharded = results[mode]["sharded"]
+                    print(
+                        f"  {mode:<8} lock: {lock:>12,.0f}/s  sharded: {sharded:>12,.0f}/s"
+                        f"  ({sharded / lock:.2f}x)"
+                    )
+                print(
+                    f"  {results['thread_count']} threads, {results['task_count']} tasks, "
+                    f"{results['cpu_count']} CPUs"
+                )
+
+            elif "reservations_per_second" in results:
+                print(
+                    f"  Reservations/sec: {results['reservations_per_second']:,.0f}"
+                )
+                print(
+                    f"  Reservations:     {results['reservations']} from "
+                    f"{results['process_count']} processes "
+                    f"({results['cpu_count']} CPUs)"
+                )
+                print(f"  Ledger Total:     {results['ledger_total']:.3f}")
+
+            elif "async_contracts" in results:
+                for mode in ("idle", "blocking", "aload", "processes"):
+                    timing = results[mode]
+                    print(
+                        f"  {mode:<9} loop lag p50 {timing['lag_p50']*1000:6.2f} ms"
+                        f"  p99 {timing['lag_p99']*1000:6.2f} ms"
+                        f"  max {timing['lag_max']*1000:7.2f} ms"
+                        f"  (load {timing['seconds']:.2f} s)"
+                    )
+                print(f"  Contracts: {results['async_contracts']}")
+
+            elif "view_bytes_per_contract" in results:
+                print(
+                    f"  Raw Tree:       {results['tree_bytes_per_contract']:,.0f} bytes/contract"
+                )
+                print(
+                    f"  Compact View:   {results['view_bytes_per_contract']:,.0f} bytes/contract"
+                )
+                print(f"  Accessors Tree: {results['tree']['mean']*1000:.2f} ms")
+                print(f"  Accessors View: {results['view']['mean']*1000:.2f} ms")
+                print(f"  Speedup:        {results['speedup']:.2f}x")
+
+            elif "registry_contracts" in results:
+                print(f"  from_file Loop:      {results['per_file_load']*1000:.1f} ms")
+                print(f"  Registry (threads):  {results['thread_load']*1000:.1f} ms")
+                print(f"  Registry (procs):    {results['process_load']*1000:.1f} ms")
+                print(
+                    f"  Reload, unchanged:   {results['reload_unchanged']*1000:.1f} ms"
+                )
+                print(
+                    f"  Reload, 1 changed:   {results['reload_one_changed']*1000:.1f} ms"
+                    f"  ({results['reloaded']} reparsed)"
+                )
+                print(
+                    f"  Lookup p50/p99:      {results['lookup_p50_ns']} / "
+                    f"{results['lookup_p99_ns']} ns"
+                )
+                print(
+                    f"  Memory:              {results['memory_bytes'] / 1e6:.1f} MB "
+                    f"for {results['registry_contracts']} contracts "
+                    f"({results['cpu_count']} CPUs)"
+                )
+
+            elif "site_routes" in results:
+                for route in results["site_routes"]:
+                    before = results["uncached"][route]
+                    after = results["cached"][route]
+                    print(
+                        f"  {route:<22} {before:7.0f} -> {after:7.0f} req/s"
+                        f"  ({after / before:.1f}x)"
+                    )
+
             elif "cache_hits" in results:
                 print(f"  Cache Hits:    {results['cache_hits']}")
                 print(f"  Cache Misses:  {results['cache_misses']}")
@@ -245,9 +1336,46 @@ def main():
         orchestrator_parallel, test_files, duration_seconds=3
     )
 
+    parse_files = [str(examples_dir.parent / "employee.md")] + [
+        str(p)
+        for p in sorted(examples_dir.glob("*.md"))
+        if p.name not in ("README.md", "molt-bot-integration.md")
+    ]
+    parsing = runner.benchmark_yaml_parsing(parse_files)
+    overhead = runner.benchmark_per_file_overhead(parse_files)
+    compiled = runner.benchmark_compiled_plan(parse_files)
+    changed_since = runner.benchmark_changed_since(parse_files)
+    employee_load = runner.benchmark_employee_load(
+        [f for f in parse_files if Path(f).parent == examples_dir]
+    )
+
     runner.results["sequential_vs_parallel"] = comparison
     runner.results["cache_hit_rate"] = cache_stats
     runner.results["throughput"] = throughput
+    runner.results["yaml_parsing"] = parsing
+    runner.results["per_file_overhead"] = overhead
+    runner.results["compiled_plan"] = compiled
+    runner.results["changed_since"] = changed_since
+    runner.results["employee_load"] = employee_load
+    runner.results["guardrail_matcher"] = runner.benchmark_guardrail_matcher()
+    runner.results["scope_matcher"] = runner.benchmark_scope_matcher()
+    runner.results["batch_classify"] = runner.benchmark_batch_classify()
+    runner.results["budget_contention"] = runner.benchmark_budget_contention()
+    runner.results["shared_ledger"] = runner.benchmark_shared_ledger()
+    runner.results["prompt_cache"] = runner.benchmark_prompt_cache(
+        [f for f in parse_files if Path(f).parent == examples_dir]
+    )
+
+    runner.results["compact_view"] = runner.benchmark_compact_view(
+        [f for f in parse_files if Path(f).parent == examples_dir]
+    )
+    runner.results["async_load"] = runner.benchmark_async_load(
+        str(examples_dir / "senior-dev.md")
+    )
+    runner.results["registry"] = runner.benchmark_registry(
+        str(examples_dir / "senior-dev.md")
+    )
+    runner.results["site_render"] = runner.benchmark_site_render()
 
     runner.print_results()
 
@@ -0,0 +1,141 @@
+"""Load test for the validation API (POST /api/validate).
+
+Runs against the Flask app in-process by default, or against a live server:
+
+    python tests/performance/load_test_api.py
+    python tests/performance/load_test_api.py --url http://localhost:5000 --concurrency 16
+
+Two request mixes are measured:
+
+  - repeat: the example contracts over and over (served from the result
+    cache after the first request for each);
+  - unique: every body differs (a trailing comment), so every request
+    parses and validates.
+
+Exits 1 if a mix misses the API_LATENCY_TARGET_P50 / _P99 targets. The
+targets are per server worker: validation is CPU-bound, so keep
+--concurrency at (or below) the number of worker processes serving --url,
+otherwise the percentiles measure queueing rather than the endpoint.
+"""
+
+import argparse
+import sys
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from tooling.constants import API_LATENCY_TARGET_P50, API_LATENCY_TARGET_P99
+
+EXAMPLES_DIR = Path(__file__).parent.parent.parent / "examples"
+
+
+def load_contracts() -> List[bytes]:
+    return [
+        p.read_bytes()
+        for p in sorted(EXAMPLES_DIR.glob("*.md"))
+        if p.name not in ("README.md", "molt-bot-integration.md")
+    ]
+
+
+def in_process_client() -> Callable[[bytes], int]:
+    from web.app import app
+
+    local = threading.local()
+
+    def post(body: bytes) -> int:
+        client = getattr(local, "client", None)
+        if client is None:
+            client = local.client = app.test_client()
+        return client.post("/api/validate", data=body).status_code
+
+    return post
+
+
+def http_client(url: str) -> Callable[[bytes], int]:
+    endpoint = url.rstrip("/") + "/api/validate"
+
+    def post(body: bytes) -> int:
+        request = urllib.request.Request(
+            endpoint, data=body, headers={"Content-Type": "application/yaml"}
+        )
+        with urllib.request.urlopen(request) as response:
+            response.read()
+            return response.status
+
+    return post
+
+
+def percentile(values: List[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def run_mix(
+    post: Callable[[bytes], int], bodies: List[bytes], concurrency: int
+) -> Dict[str, float]:
+    """POST every body, `concurrency` requests at a time; latencies in ms."""
+
+    def timed(body: bytes) -> float:
+        start = time.perf_counter()
+        status = post(body)
+        elapsed = (time.perf_counter() - start) * 1000
+        if status != 200:
+            raise RuntimeError(f"/api/validate returned {status}")
+        return elapsed
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        latencies = list(pool.map(timed, bodies))
+    elapsed = time.perf_counter() - start
+    return {
+        "requests": len(bodies),
+        "rps": len(bodies) / elapsed,
+        "p50": percentile(latencies, 0.50),
+        "p99": percentile(latencies, 0.99),
+        "max": max(latencies),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", help="Base URL of a running server (default: in-process)")
+    parser.add_argument("--requests", type=int, default=2000, help="Requests per mix")
+    parser.add_argument("--concurrency", type=int, default=1, help="Concurrent clients")
+    args = parser.parse_args()
+
+    post = http_client(args.url) if args.url else in_process_client()
+    contracts = load_contracts()
+    # Warm up: first request per contract fills the cache and imports.
+    for body in contracts:
+        post(body)
+
+    mixes = {
+        "repeat": [contracts[i % len(contracts)] for i in range(args.requests)],
+        "unique": [
+            contracts[i % len(contracts)] + f"\n# load-test {time.time_ns()} {i}\n".encode()
+            for i in range(args.requests)
+        ],
+    }
+
+    print(f"Target: p50 < {API_LATENCY_TARGET_P50} ms, p99 < {API_LATENCY_TARGET_P99} ms")
+    print(f"Server: {args.url or 'in-process test client'}, concurrency {args.concurrency}\n")
+    ok = True
+    for name, bodies in mixes.items():
+        stats = run_mix(post, bodies, args.concurrency)
+        passed = stats["p50"] < API_LATENCY_TARGET_P50 and stats["p99"] < API_LATENCY_TARGET_P99
+        ok = ok and passed
+        print(
+            f"  {name:<7} {stats['rps']:8.0f} req/s  p50 {stats['p50']:6.2f} ms"
+            f"  p99 {stats['p99']:6.2f} ms  max {stats['max']:7.2f} ms"
+            f"  {'OK' if passed else 'MISSED'}"
+        )
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
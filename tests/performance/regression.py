@@ -1,8 +1,10 @@
 """Performance regression tests for employee.md validator."""
 
+import subprocess
 import sys
 import time
 from pathlib import Path
+from typing import Set, Tuple
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
@@ -12,8 +14,48 @@ from tooling.constants import (
     REGRESSION_THRESHOLD_PER_FILE,
     REGRESSION_THRESHOLD_PER_VALIDATION,
     REGRESSION_THRESHOLD_THROUGHPUT,
+    STARTUP_BUDGET_CLI,
+    STARTUP_BUDGET_PACKAGE,
 )
 
+ROOT = Path(__file__).parent.parent.parent
+
+# Heavy modules that must stay out of a plain import (loaded on first use).
+DEFERRED_MODULES = {
+    "asyncio",
+    "concurrent.futures",
+    "hashlib",
+    "jsonschema",
+    "sqlite3",
+    "subprocess",
+}
+
+
+def import_time(module: str, runs: int = 5) -> Tuple[float, Set[str]]:
+    """Cumulative `python -X importtime` milliseconds for `module`.
+
+    Best of `runs` fresh interpreters, plus every module the import loaded.
+    """
+    best = float("inf")
+    loaded: Set[str] = set()
+    for _ in range(runs):
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=ROOT,
+        )
+        for line in proc.stderr.splitlines():
+            if not line.startswith("import time:"):
+                continue
+            _, cumulative, name = line[len("import time:"):].split("|")
+            name = name.strip()
+            loaded.add(name)
+            if name == module:
+                best = min(best, int(cumulative) / 1000)
+    return best, loaded
+
 
 class PerformanceRegressionTests:
     """Performance regression tests."""
@@ -120,6 +162,23 @@ class PerformanceRegressionTests:
             duration_per_validation < REGRESSION_THRESHOLD_PER_VALIDATION
         ), f"Cache validation too slow: {duration_per_validation:.4f}ms > {REGRESSION_THRESHOLD_PER_VALIDATION}ms threshold"
 
+    def test_startup_import_time(self):
+        """Test that imports stay lazy and within the startup budget."""
+        budgets = {
+            "tooling": STARTUP_BUDGET_PACKAGE,
+            "runtime": STARTUP_BUDGET_PACKAGE,
+            "tooling.cli": STARTUP_BUDGET_CLI,
+        }
+        for module, budget in budgets.items():
+            duration_ms, loaded = import_time(module)
+            print(f"import {module}: {duration_ms:.1f}ms (budget {budget:.0f}ms)")
+
+            eager = sorted(DEFERRED_MODULES & loaded)
+            assert not eager, f"import {module} loads {', '.join(eager)} eagerly"
+            assert (
+                duration_ms < budget
+            ), f"import {module} too slow: {duration_ms:.1f}ms > {budget}ms budget"
+
     def test_throughput(self):
         """Test validation throughput."""
         test_file = self.examples_dir / "minimal.md"
@@ -174,6 +233,12 @@ class PerformanceRegressionTests:
         except AssertionError as e:
             print(f"✗ Cache performance FAILED: {e}\n")
 
+        try:
+            self.test_startup_import_time()
+            print("✓ Startup import time OK\n")
+        except AssertionError as e:
+            print(f"✗ Startup import time FAILED: {e}\n")
+
         try:
             self.test_throughput()
             print("✓ Throughput OK\n")
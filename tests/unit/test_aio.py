@@ -0,0 +1,186 @@
+"""Tests for the asyncio loading API."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from runtime import AsyncLoader, ContractError, Employee, EmployeeRegistry
+from runtime.aio import default_loader, set_default_loader
+
+EXAMPLES = Path(__file__).resolve().parents[2] / "examples"
+SENIOR_DEV = EXAMPLES / "senior-dev.md"
+
+
+def test_aload_matches_from_file():
+    emp = asyncio.run(Employee.aload(SENIOR_DEV))
+    assert emp.data == Employee.from_file(SENIOR_DEV).data
+    assert emp.system_prompt() == Employee.from_file(SENIOR_DEV).system_prompt()
+
+
+def test_aload_keep_data_false():
+    emp = asyncio.run(Employee.aload(SENIOR_DEV, keep_data=False))
+    assert emp._data is None
+    assert emp.agent_id == "dev-001"
+
+
+def test_concurrent_loads_of_one_path_share_a_load(monkeypatch):
+    calls = []
+    read_file = Employee._read_file
+
+    def counting(path, validate):
+        calls.append(path)
+        time.sleep(0.05)
+        return read_file(path, validate)
+
+    monkeypatch.setattr(Employee, "_read_file", staticmethod(counting))
+
+    async def main():
+        return await asyncio.gather(*(Employee.aload(SENIOR_DEV) for _ in range(10)))
+
+    employees = asyncio.run(main())
+    assert len(calls) == 1
+    assert all(emp is employees[0] for emp in employees)
+
+    # Once the load is done, a new call loads again.
+    asyncio.run(Employee.aload(SENIOR_DEV))
+    assert len(calls) == 2
+
+
+def test_different_options_are_separate_loads():
+    async def main():
+        return await asyncio.gather(
+            Employee.aload(SENIOR_DEV), Employee.aload(SENIOR_DEV, keep_data=False)
+        )
+
+    kept, dropped = asyncio.run(main())
+    assert kept is not dropped
+
+
+def test_concurrency_is_bounded():
+    loader = AsyncLoader(ThreadPoolExecutor(max_workers=8), max_concurrency=3)
+    lock = threading.Lock()
+    running = [0]
+    peak = [0]
+
+    def work():
+        with lock:
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+        time.sleep(0.01)
+        with lock:
+            running[0] -= 1
+
+    async def main():
+        await asyncio.gather(*(loader.offload(work) for _ in range(20)))
+
+    asyncio.run(main())
+    loader.executor.shutdown()
+    assert peak[0] == 3
+
+
+def test_errors_reach_every_caller(tmp_path):
+    async def main():
+        return await asyncio.gather(
+            Employee.aload(tmp_path / "missing.md"),
+            Employee.aload(tmp_path / "missing.md"),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(main())
+    assert all(isinstance(r, FileNotFoundError) for r in results)
+
+    bad = tmp_path / "bad.md"
+    bad.write_text("---\nrole: {}\n---\n", encoding="utf-8")
+    with pytest.raises(ContractError):
+        asyncio.run(Employee.aload(bad))
+
+
+def test_cancelling_one_caller_keeps_the_shared_load():
+    async def main():
+        first = asyncio.ensure_future(Employee.aload(SENIOR_DEV))
+        second = asyncio.ensure_future(Employee.aload(SENIOR_DEV))
+        await asyncio.sleep(0)
+        first.cancel()
+        return await second
+
+    assert asyncio.run(main()).agent_id == "dev-001"
+
+
+def test_process_executor():
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        loader = AsyncLoader(pool)
+
+        async def main():
+            return await asyncio.gather(
+                Employee.aload(SENIOR_DEV, loader=loader),
+                Employee.aload(EXAMPLES / "freelancer.md", loader=loader),
+            )
+
+        dev, writer = asyncio.run(main())
+    assert dev.agent_id == "dev-001"
+    assert writer.agent_id == "writer-001"
+
+
+def test_set_default_loader():
+    custom = AsyncLoader(max_concurrency=1)
+    set_default_loader(custom)
+    try:
+        assert default_loader() is custom
+    finally:
+        set_default_loader(None)
+    assert default_loader() is not custom
+
+
+def test_rejects_zero_concurrency():
+    with pytest.raises(ValueError):
+        AsyncLoader(max_concurrency=0)
+
+
+def test_areload_picks_up_changes_and_shares_calls(tmp_path):
+    (tmp_path / "dev.md").write_bytes(SENIOR_DEV.read_bytes())
+    registry = EmployeeRegistry(tmp_path)
+    (tmp_path / "writer.md").write_bytes((EXAMPLES / "freelancer.md").read_bytes())
+
+    async def main():
+        return await asyncio.gather(registry.areload(), registry.areload())
+
+    first, second = asyncio.run(main())
+    assert first is second
+    assert first.added == [str(tmp_path / "writer.md")]
+    assert registry.agent_ids() == ["dev-001", "writer-001"]
+
+
+def test_areload_runs_on_the_loaders_executor(tmp_path):
+    (tmp_path / "dev.md").write_bytes(SENIOR_DEV.read_bytes())
+    registry = EmployeeRegistry(tmp_path)
+    (tmp_path / "writer.md").write_bytes((EXAMPLES / "freelancer.md").read_bytes())
+    threads = []
+    real_reload = registry.reload
+
+    def reload():
+        threads.append(threading.current_thread().name)
+        return real_reload()
+
+    registry.reload = reload
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="custom-reload") as pool:
+        report = asyncio.run(registry.areload(loader=AsyncLoader(pool)))
+
+    assert report.added == [str(tmp_path / "writer.md")]
+    assert len(threads) == 1 and threads[0].startswith("custom-reload")
+
+
+def test_areload_with_process_loader_stays_in_process(tmp_path):
+    (tmp_path / "dev.md").write_bytes(SENIOR_DEV.read_bytes())
+    registry = EmployeeRegistry(tmp_path)
+    (tmp_path / "writer.md").write_bytes((EXAMPLES / "freelancer.md").read_bytes())
+
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        asyncio.run(registry.areload(loader=AsyncLoader(pool)))
+
+    assert registry.agent_ids() == ["dev-001", "writer-001"]
@@ -0,0 +1,146 @@
+"""Tests for the sharded and asyncio budget trackers."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import pytest
+
+from runtime import (
+    AsyncBudgetTracker,
+    BudgetExceeded,
+    BudgetTracker,
+    ShardedBudgetTracker,
+)
+from runtime.aio import AsyncLoader
+from runtime.ledger import BudgetLedger
+
+
+def spend_until_exhausted(tracker, amount, attempts):
+    granted = 0
+    for _ in range(attempts):
+        try:
+            tracker.try_spend(amount)
+            granted += 1
+        except BudgetExceeded:
+            pass
+    return granted
+
+
+def test_ceiling_holds_under_contention():
+    # Binary fractions keep the float sums exact.
+    tracker = ShardedBudgetTracker(100.0, shards=4, lease=3.0)
+    granted = []
+    lock = threading.Lock()
+
+    def worker():
+        n = spend_until_exhausted(tracker, 0.25, 100)
+        with lock:
+            granted.append(n)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert sum(granted) == 400
+    assert tracker.spent == 100.0
+    assert tracker.remaining() == 0.0
+
+
+def test_reclaims_other_leases_before_refusing():
+    tracker = ShardedBudgetTracker(10.0, shards=2, lease=8.0)
+    tracker.try_spend(1.0)  # main thread's shard leases 8.0
+
+    def other():
+        # Only 2.0 left in the pool; needs 4.0 back from the first shard.
+        tracker.try_spend(6.0)
+
+    t = threading.Thread(target=other)
+    t.start()
+    t.join()
+
+    assert tracker.spent == 7.0
+    with pytest.raises(BudgetExceeded) as exc:
+        tracker.try_spend(3.5)
+    assert exc.value.spent == 7.0
+    tracker.try_spend(3.0)
+    assert tracker.remaining() == 0.0
+
+
+def test_matches_budget_tracker_semantics():
+    amounts = [0.5, 2.0, 0.0, 4.0, 3.0, 1.5, 0.5, 0.25]
+    plain = BudgetTracker(8.0)
+    sharded = ShardedBudgetTracker(8.0, lease=1.0)
+    for amount in amounts:
+        outcomes = []
+        for tracker in (plain, sharded):
+            try:
+                outcomes.append(tracker.try_spend(amount))
+            except BudgetExceeded:
+                outcomes.append("exceeded")
+        assert outcomes[0] == outcomes[1]
+        assert plain.spent == sharded.spent
+
+    with pytest.raises(ValueError):
+        sharded.try_spend(-1)
+
+
+def test_unlimited_and_reset():
+    tracker = ShardedBudgetTracker(None)
+    assert tracker.try_spend(1e9) is True
+    assert tracker.remaining() is None
+    tracker.reset()
+    assert tracker.spent == 0.0
+
+    capped = ShardedBudgetTracker(0)
+    with pytest.raises(BudgetExceeded):
+        capped.try_spend(0.01)
+
+
+def test_async_tracker():
+    tracker = AsyncBudgetTracker(limit=5.0)
+
+    async def spend_all():
+        results = await asyncio.gather(
+            *(tracker.try_spend(0.5) for _ in range(10)),
+        )
+        with pytest.raises(BudgetExceeded):
+            await tracker.try_spend(0.5)
+        return results
+
+    assert asyncio.run(spend_all()) == [True] * 10
+    assert tracker.spent == 5.0
+    assert tracker.currency == "USD"
+    asyncio.run(tracker.reset())
+    assert tracker.remaining() == 5.0
+
+
+@pytest.mark.parametrize("use_loader", [False, True])
+def test_async_tracker_offloads_ledger_io(tmp_path, use_loader):
+    ledger = BudgetLedger(tmp_path / "budget.sqlite3", key="agent")
+    threads = []
+    real_reserve = ledger.reserve
+
+    def reserve(amount, limit):
+        threads.append(threading.get_ident())
+        return real_reserve(amount, limit)
+
+    ledger.reserve = reserve
+    loader = AsyncLoader(max_concurrency=2) if use_loader else None
+    tracker = AsyncBudgetTracker(BudgetTracker(1.0, ledger=ledger), loader=loader)
+
+    async def spend():
+        loop_thread = threading.get_ident()
+        assert await tracker.try_spend(0.75) is True
+        with pytest.raises(BudgetExceeded):
+            await tracker.try_spend(0.5)
+        await tracker.reset()
+        return loop_thread
+
+    loop_thread = asyncio.run(spend())
+    assert len(threads) == 2
+    assert loop_thread not in threads
+    assert tracker.spent == 0.0
@@ -162,3 +162,145 @@ class TestValidationCache:
         retrieved = cache.get(complex_data)
 
         assert retrieved == result
+
+    def test_cache_hit_refreshes_recency(self):
+        cache = ValidationCache(max_size=2)
+        cache.set({"data": 0}, {"result": 0})
+        cache.set({"data": 1}, {"result": 1})
+
+        # Touch the oldest entry so the next insert evicts {"data": 1}.
+        assert cache.get({"data": 0}) == {"result": 0}
+        cache.set({"data": 2}, {"result": 2})
+
+        assert cache.get({"data": 0}) == {"result": 0}
+        assert cache.get({"data": 1}) is None
+
+    def test_cache_overwrite_does_not_evict(self):
+        cache = ValidationCache(max_size=2)
+        cache.set({"data": 0}, {"result": 0})
+        cache.set({"data": 1}, {"result": 1})
+        cache.set({"data": 1}, {"result": "updated"})
+
+        assert cache.get({"data": 0}) == {"result": 0}
+        assert cache.get_stats()["evictions"] == 0
+
+    def test_cache_counts_hits_misses_evictions(self):
+        cache = ValidationCache(max_size=1)
+        cache.set({"data": 0}, {"result": 0})
+        cache.get({"data": 0})
+        cache.get({"data": "missing"})
+        cache.set({"data": 1}, {"result": 1})
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["evictions"] == 1
+
+    def test_cache_sweep_purges_expired_entries(self):
+        cache = ValidationCache(default_ttl=0.05)
+        for i in range(3):
+            cache.set({"data": i}, {"result": i})
+
+        time.sleep(0.1)
+        # Any write after sweep_interval purges expired entries up front.
+        cache.set({"data": "fresh"}, {"result": "fresh"})
+
+        stats = cache.get_stats()
+        assert stats["size"] == 1
+        assert stats["expirations"] == 3
+
+    def test_purge_expired(self):
+        cache = ValidationCache(default_ttl=60)
+        cache.set({"data": 0}, {"result": 0}, ttl=0.01)
+        cache.set({"data": 1}, {"result": 1})
+
+        time.sleep(0.05)
+
+        assert cache.purge_expired() == 1
+        assert cache.get_stats()["size"] == 1
+
+    def test_configure_shrinks_in_lru_order(self):
+        cache = ValidationCache(max_size=3)
+        for i in range(3):
+            cache.set({"data": i}, {"result": i})
+
+        cache.configure(max_size=1, default_ttl=10)
+
+        assert cache.max_size == 1
+        assert cache.default_ttl == 10
+        assert cache.get({"data": 2}) == {"result": 2}
+        assert cache.get_stats()["evictions"] == 2
+
+    def test_configure_global_cache(self):
+        from tooling.cache import configure_cache, get_cache
+
+        cache = get_cache()
+        original = (cache.max_size, cache.default_ttl)
+        try:
+            assert configure_cache(max_size=7, default_ttl=42) is cache
+            assert cache.max_size == 7
+            assert cache.default_ttl == 42
+        finally:
+            configure_cache(max_size=original[0], default_ttl=original[1])
+
+
+class TestCanonicalHash:
+    """Tests for the streaming cache-key hasher."""
+
+    def test_dict_order_does_not_matter(self):
+        from tooling.cache import canonical_hash
+
+        assert canonical_hash({"a": 1, "b": [1, 2]}) == canonical_hash(
+            {"b": [1, 2], "a": 1}
+        )
+
+    def test_scalar_types_are_distinguished(self):
+        from tooling.cache import canonical_hash
+
+        assert canonical_hash({"a": "1"}) != canonical_hash({"a": 1})
+        assert canonical_hash({"a": 1}) != canonical_hash({"a": True})
+        assert canonical_hash({"a": None}) != canonical_hash({"a": "None"})
+
+    def test_structure_boundaries_are_distinguished(self):
+        from tooling.cache import canonical_hash
+
+        assert canonical_hash(["ab", "c"]) != canonical_hash(["a", "bc"])
+        assert canonical_hash([[1], 2]) != canonical_hash([1, [2]])
+        assert canonical_hash([1, 2]) != canonical_hash([2, 1])
+
+    def test_set_order_does_not_matter(self):
+        from tooling.cache import canonical_hash
+
+        assert canonical_hash({"s": {"x", "y", "z"}}) == canonical_hash(
+            {"s": {"z", "y", "x"}}
+        )
+
+    def test_recursive_data_falls_back(self):
+        cache = ValidationCache()
+        data = {"items": []}
+        data["items"].append(data)
+
+        cache.set(data, {"result": 1})
+        assert cache.get(data) == {"result": 1}
+
+    def test_key_for_source_accepts_text_and_bytes(self):
+        cache = ValidationCache()
+
+        assert cache.key_for_source("role: {}") == cache.key_for_source(b"role: {}")
+        assert cache.key_for_source("role: {}") != cache.key_for_source("role: []")
+
+    def test_validate_data_uses_source_key(self):
+        from tooling.cache import get_cache
+        from tooling.employee_validator import EmployeeValidationOrchestrator
+
+        reset_cache()
+        orchestrator = EmployeeValidationOrchestrator(use_cache=True)
+        data = {"role": {"title": "A", "level": "senior"}, "lifecycle": {"status": "active"}}
+        source = "role: {title: A, level: senior}\nlifecycle: {status: active}\n"
+
+        first = orchestrator.validate_data(data, source=source)
+
+        cache = get_cache()
+        assert cache.get(key=cache.key_for_source(source)) is first
+        assert orchestrator.validate_data(data, source=source) is first
+        reset_cache()
@@ -0,0 +1,95 @@
+"""Tests for the compact contract view and dropping the raw tree."""
+
+from __future__ import annotations
+
+import copy
+import pickle
+from pathlib import Path
+
+import pytest
+
+from runtime import ContractError, ContractView, Employee
+from runtime.skill_export import to_skill_md
+
+EXAMPLES = Path(__file__).resolve().parents[2] / "examples"
+
+
+def test_view_matches_tree():
+    emp = Employee.from_file(EXAMPLES / "senior-dev.md")
+    view = emp.view
+    data = emp.data
+
+    assert view.agent_id == data["identity"]["agent_id"]
+    assert view.title == data["role"]["title"]
+    assert view.status == data["lifecycle"]["status"]
+    assert list(view.prohibited_actions) == data["guardrails"]["prohibited_actions"]
+    assert list(view.in_scope) == data["scope"]["in_scope"]
+    assert list(view.out_of_scope) == data["scope"]["out_of_scope"]
+    assert view.budget_limit == data["economy"]["budget_limit"]
+
+
+def test_view_is_immutable():
+    view = Employee.from_file(EXAMPLES / "senior-dev.md").view
+    with pytest.raises(AttributeError):
+        view.status = "terminated"
+    with pytest.raises(AttributeError):
+        del view.status
+    with pytest.raises(AttributeError):
+        view.extra = 1
+
+
+def test_view_copies_and_pickles():
+    view = Employee.from_file(EXAMPLES / "senior-dev.md").view
+    for clone in (copy.copy(view), pickle.loads(pickle.dumps(view))):
+        for name in ContractView.__slots__:
+            assert getattr(clone, name) == getattr(view, name)
+
+
+def test_strings_are_interned_across_contracts():
+    first = Employee.from_file(EXAMPLES / "senior-dev.md")
+    second = Employee.from_file(EXAMPLES / "senior-dev.md")
+    assert first.view.status is second.view.status
+    assert first.view.prohibited_actions[0] is second.view.prohibited_actions[0]
+
+
+def test_invalidate_rebuilds_view_from_mutated_tree():
+    emp = Employee.from_file(EXAMPLES / "senior-dev.md")
+    emp.data["lifecycle"]["status"] = "suspended"
+    emp.invalidate()
+    assert emp.status == "suspended"
+    assert not emp.is_active
+
+
+def test_dropped_tree_behaves_the_same():
+    kept = Employee.from_file(EXAMPLES / "senior-dev.md")
+    dropped = Employee.from_file(EXAMPLES / "senior-dev.md", keep_data=False)
+
+    assert dropped._data is None
+    assert dropped.system_prompt() == kept.system_prompt()
+    assert to_skill_md(dropped) == to_skill_md(kept)
+    assert dropped.is_action_allowed("run tests") == kept.is_action_allowed("run tests")
+    assert dropped.is_in_scope("write unit tests") == kept.is_in_scope("write unit tests")
+    assert dropped.budget.limit == kept.budget.limit
+
+
+def test_dropped_tree_is_reread_on_demand():
+    path = EXAMPLES / "senior-dev.md"
+    dropped = Employee.from_file(path, keep_data=False)
+    assert dropped.data == Employee.from_file(path).data
+    assert dropped._data is None
+
+    from_text = Employee.from_yaml(path.read_text(encoding="utf-8"), keep_data=False)
+    assert from_text.data["identity"]["agent_id"] == "dev-001"
+
+
+def test_dropped_tree_without_source_raises():
+    data = Employee.from_file(EXAMPLES / "senior-dev.md").data
+    emp = Employee(data, keep_data=False)
+    with pytest.raises(ContractError):
+        emp.data
+
+
+def test_dropping_the_tree_shrinks_memory():
+    kept = Employee.from_file(EXAMPLES / "senior-dev.md")
+    dropped = Employee.from_file(EXAMPLES / "senior-dev.md", keep_data=False)
+    assert dropped.memory_size() * 4 < kept.memory_size()
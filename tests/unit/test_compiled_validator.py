@@ -0,0 +1,178 @@
+"""Tests for CompiledValidator and compile_plan."""
+
+import copy
+import random
+
+import pytest
+
+from tooling.validators import (
+    CompiledValidator,
+    EnumValidator,
+    FormatValidator,
+    RangeValidator,
+    RequiredFieldValidator,
+    TypeValidator,
+    compile_plan,
+)
+
+
+FULL_CONFIG = {
+    "spec": {
+        "name": "employee.md",
+        "status": "stable",
+        "schema": "https://example.com/schema.json",
+        "homepage": "https://example.com",
+        "compatibility": ["1.x"],
+    },
+    "identity": {
+        "agent_id": "agent-123",
+        "wallet": "0x" + "a" * 40,
+        "created_at": "2024-01-15T10:30:00Z",
+        "updated_at": "2024-02-01",
+    },
+    "role": {"title": "Agent", "level": "senior", "department": "Engineering"},
+    "lifecycle": {"status": "active", "start_date": "2024-01-01", "next_review": "TBD"},
+    "economy": {"rate": 10, "currency": "USD", "wallets": {"eth": "0x" + "b" * 40}},
+    "guardrails": {"prohibited_actions": ["delete"], "confidence_threshold": 0.8},
+    "ai_settings": {
+        "model_preference": "any",
+        "generation_params": {"temperature": 0.5, "top_p": 0.9},
+    },
+    "knowledge_base": {"documentation_urls": ["https://docs.example.com"]},
+    "protocols": {"x402": {"wallet_address": "0x" + "c" * 40}},
+}
+
+ODD_VALUES = [
+    None,
+    "TBD",
+    "",
+    "junk",
+    "senior",
+    "2024-13-45",
+    "not-a-url",
+    "0xdeadbeef",
+    0,
+    -3,
+    2.5,
+    True,
+    [],
+    ["https://ok.example.com", "ftp://bad"],
+    {},
+    {"eth": "0xnope", "btc": None},
+]
+
+
+def run_legacy(config):
+    errors = []
+    for validator in (
+        RequiredFieldValidator(),
+        EnumValidator(),
+        TypeValidator(),
+        FormatValidator(),
+        RangeValidator(),
+    ):
+        errors.extend(validator.validate(config).errors)
+    return errors
+
+
+def as_tuples(errors):
+    return [(e.field, e.message, e.severity, e.suggestion) for e in errors]
+
+
+def mutate(config, rng):
+    config = copy.deepcopy(config)
+    for _ in range(rng.randint(1, 6)):
+        section = rng.choice(list(config) + ["missing_section"])
+        roll = rng.random()
+        if roll < 0.1:
+            config.pop(section, None)
+        elif roll < 0.15:
+            config[section] = rng.choice(ODD_VALUES)
+        elif isinstance(config.get(section), dict):
+            data = config[section]
+            key = rng.choice(list(data) + ["level", "status", "rate", "wallets"])
+            if rng.random() < 0.2:
+                data.pop(key, None)
+            elif isinstance(data.get(key), dict) and data[key]:
+                inner = rng.choice(list(data[key]))
+                data[key][inner] = rng.choice(ODD_VALUES)
+            else:
+                data[key] = rng.choice(ODD_VALUES)
+    return config
+
+
+def outcome(func, config):
+    try:
+        return as_tuples(func(config))
+    except Exception as e:
+        return type(e)
+
+
+class TestCompiledValidator:
+    """Tests for CompiledValidator class."""
+
+    def test_valid_config(self):
+        result = CompiledValidator().validate(FULL_CONFIG)
+        assert result.is_valid is True
+        assert result.errors == []
+
+    def test_reports_errors_in_validator_order(self):
+        config = copy.deepcopy(FULL_CONFIG)
+        config["guardrails"]["confidence_threshold"] = 3
+        config["identity"]["created_at"] = "yesterday"
+        config["role"]["department"] = 7
+        config["role"]["level"] = "boss"
+        del config["lifecycle"]["status"]
+
+        result = CompiledValidator().validate(config)
+
+        assert result.is_valid is False
+        assert [e.field for e in result.errors] == [
+            "lifecycle.status",
+            "role.level",
+            "role.department",
+            "identity.created_at",
+            "guardrails.confidence_threshold",
+        ]
+        assert as_tuples(result.errors) == as_tuples(run_legacy(config))
+
+    def test_non_mapping_section_matches_validators(self):
+        config = copy.deepcopy(FULL_CONFIG)
+        config["role"] = "Agent"
+        config["guardrails"] = ["x"]
+
+        result = CompiledValidator().validate(config)
+
+        assert as_tuples(result.errors) == as_tuples(run_legacy(config))
+
+    def test_raises_like_validators(self):
+        config = copy.deepcopy(FULL_CONFIG)
+        config["role"]["level"] = ["senior"]
+
+        with pytest.raises(TypeError):
+            run_legacy(config)
+        with pytest.raises(TypeError):
+            CompiledValidator().validate(config)
+
+    def test_matches_validators_on_mutated_configs(self):
+        rng = random.Random(1234)
+        validator = CompiledValidator()
+
+        for _ in range(2000):
+            config = mutate(FULL_CONFIG, rng)
+            expected = outcome(run_legacy, config)
+            actual = outcome(lambda c: validator.validate(c).errors, config)
+            assert actual == expected, config
+
+
+class TestCompilePlan:
+    """Tests for compile_plan function."""
+
+    def test_paths_are_pre_split(self):
+        plan = compile_plan()
+        ranges = plan.sections["ai_settings"].ranges
+        assert ("generation_params", "temperature") in [r[1] for r in ranges]
+
+    def test_rejects_checks_for_unknown_sections(self):
+        with pytest.raises(ValueError):
+            compile_plan(rules={"role": {"title": str}})
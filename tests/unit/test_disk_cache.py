@@ -0,0 +1,119 @@
+"""Tests for DiskValidationCache."""
+
+from tooling import disk_cache
+from tooling.cache import reset_cache
+from tooling.disk_cache import DiskValidationCache, clear_disk_cache, content_hash
+from tooling.employee_validator import EmployeeValidationOrchestrator
+from tooling.parser import SecureYAMLParser
+from tooling.validators import ValidationError, ValidationResult
+
+
+VALID_YAML = """
+role:
+  title: Agent
+  level: senior
+lifecycle:
+  status: active
+"""
+
+
+def _result():
+    return ValidationResult(
+        is_valid=False,
+        errors=[
+            ValidationError(
+                field="role.level",
+                message="Invalid role.level",
+                line_number=3,
+                suggestion="Use one of: senior",
+            )
+        ],
+        warnings=[ValidationError(field="spec", message="old", severity="warning")],
+    )
+
+
+class TestDiskValidationCache:
+    """Tests for DiskValidationCache class."""
+
+    def test_round_trip(self, tmp_path):
+        cache = DiskValidationCache(tmp_path / "cache")
+        key = content_hash(b"role: {}")
+
+        assert cache.get(key) is None
+        cache.set(key, _result())
+
+        assert cache.get(key) == _result()
+
+    def test_persists_across_instances(self, tmp_path):
+        key = content_hash(b"role: {}")
+        DiskValidationCache(tmp_path).set(key, _result())
+
+        assert DiskValidationCache(tmp_path).get(key) == _result()
+
+    def test_eviction_is_size_bounded(self, tmp_path):
+        cache = DiskValidationCache(tmp_path, max_entries=3)
+        for i in range(5):
+            cache.set(f"key-{i}", _result())
+
+        assert cache.get_stats() == {"size": 3, "max_size": 3}
+        assert cache.get("key-0") is None
+        assert cache.get("key-4") is not None
+
+    def test_fingerprint_change_discards_entries(self, tmp_path, monkeypatch):
+        DiskValidationCache(tmp_path).set("key", _result())
+
+        monkeypatch.setattr(disk_cache, "_fingerprint", "different-validator")
+
+        assert DiskValidationCache(tmp_path).get("key") is None
+
+    def test_clear_disk_cache_removes_database(self, tmp_path):
+        cache_dir = tmp_path / "cache"
+        cache = DiskValidationCache(cache_dir)
+        cache.set("key", _result())
+        cache.close()
+
+        assert clear_disk_cache(cache_dir) is True
+        assert not cache_dir.exists()
+        assert clear_disk_cache(cache_dir) is False
+
+    def test_unwritable_location_is_a_miss(self, tmp_path):
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        cache = DiskValidationCache(blocker / "cache")
+
+        cache.set("key", _result())
+        assert cache.get("key") is None
+
+
+class TestOrchestratorDiskCache:
+    """Tests for the orchestrator's use of the persistent cache."""
+
+    def test_unchanged_file_skipped_across_runs(self, tmp_path, monkeypatch):
+        contract = tmp_path / "agent.md"
+        contract.write_text(VALID_YAML)
+        cache_dir = tmp_path / "cache"
+
+        first = EmployeeValidationOrchestrator(cache_dir=cache_dir)
+        assert first.validate_file(str(contract)).is_valid
+        # A new run starts with an empty in-memory cache.
+        reset_cache()
+
+        def fail_parse(self, filepath):
+            raise AssertionError("unchanged file was re-parsed")
+
+        monkeypatch.setattr(SecureYAMLParser, "parse_file", fail_parse)
+        second = EmployeeValidationOrchestrator(cache_dir=cache_dir)
+
+        assert second.validate_file(str(contract)).is_valid
+
+    def test_changed_file_is_revalidated(self, tmp_path):
+        contract = tmp_path / "agent.md"
+        contract.write_text(VALID_YAML)
+        cache_dir = tmp_path / "cache"
+
+        orchestrator = EmployeeValidationOrchestrator(cache_dir=cache_dir)
+        assert orchestrator.validate_file(str(contract)).is_valid
+
+        contract.write_text(VALID_YAML.replace("senior", "super-senior"))
+
+        assert not orchestrator.validate_file(str(contract)).is_valid
@@ -0,0 +1,209 @@
+"""Tests for EmployeeValidationOrchestrator."""
+
+import pytest
+
+from tooling.employee_validator import EmployeeValidationOrchestrator
+
+
+VALID_YAML = """
+role:
+  title: Agent
+  level: senior
+lifecycle:
+  status: active
+"""
+
+INVALID_YAML = """
+role:
+  title: Agent
+  level: super-senior
+lifecycle:
+  status: active
+"""
+
+
+@pytest.fixture
+def contract_files(tmp_path):
+    paths = []
+    for i in range(6):
+        fp = tmp_path / f"agent-{i}.md"
+        fp.write_text(VALID_YAML if i % 2 == 0 else INVALID_YAML)
+        paths.append(str(fp))
+    return paths
+
+
+class TestProcessExecutor:
+    """Tests for the process-pool batch executor."""
+
+    def test_invalid_executor_rejected(self):
+        with pytest.raises(ValueError):
+            EmployeeValidationOrchestrator(executor="fibers")
+
+    def test_invalid_max_workers_rejected(self):
+        with pytest.raises(ValueError):
+            EmployeeValidationOrchestrator(max_workers=0)
+
+    def test_process_batch_matches_sequential(self, contract_files):
+        sequential = EmployeeValidationOrchestrator(use_cache=False)
+        process = EmployeeValidationOrchestrator(
+            use_cache=False, executor="process", max_workers=2
+        )
+
+        expected = sequential.validate_batch(contract_files)
+        actual = process.validate_batch(contract_files)
+
+        assert set(actual) == set(contract_files)
+        for filepath in contract_files:
+            assert actual[filepath].is_valid == expected[filepath].is_valid
+            assert [
+                (e.field, e.message, e.suggestion) for e in actual[filepath].errors
+            ] == [
+                (e.field, e.message, e.suggestion) for e in expected[filepath].errors
+            ]
+
+    def test_process_batch_reports_parse_errors(self, tmp_path, contract_files):
+        broken = tmp_path / "broken.md"
+        broken.write_text("role: [\n")
+        process = EmployeeValidationOrchestrator(
+            use_cache=False, executor="process", max_workers=2
+        )
+
+        results = process.validate_batch(contract_files + [str(broken)])
+
+        assert results[str(broken)].is_valid is False
+        assert results[str(broken)].errors[0].field == "file"
+        assert results[str(broken)].errors[0].line_number is not None
+
+
+class TestInstanceReuse:
+    """Tests for validators, parsers and the thread pool being reused."""
+
+    def test_validator_results_are_independent(self):
+        orchestrator = EmployeeValidationOrchestrator(use_cache=False)
+        validator = orchestrator._validators[1]
+
+        invalid = validator.validate({"role": {"level": "super-senior"}})
+        valid = validator.validate({"role": {"level": "senior"}})
+
+        assert invalid.is_valid is False
+        assert len(invalid.errors) == 1
+        assert valid.is_valid is True
+        assert valid.errors == []
+        assert validator.errors == []
+
+    def test_parallel_batch_shares_one_executor(self, contract_files):
+        with EmployeeValidationOrchestrator(
+            use_cache=False, parallel_validation=True
+        ) as orchestrator:
+            first = orchestrator.validate_batch(contract_files)
+            executor = orchestrator._executor
+            orchestrator.validate_file(contract_files[1])
+            second = orchestrator.validate_batch(contract_files)
+
+            assert executor is not None
+            assert orchestrator._executor is executor
+        assert orchestrator._executor is None
+
+        for filepath in contract_files:
+            assert first[filepath].is_valid == second[filepath].is_valid
+            assert [e.message for e in first[filepath].errors] == [
+                e.message for e in second[filepath].errors
+            ]
+
+    def test_parallel_errors_in_validator_order(self):
+        data = {"role": {"level": "super-senior"}, "lifecycle": {"status": "x"}}
+        sequential = EmployeeValidationOrchestrator(use_cache=False)
+        with EmployeeValidationOrchestrator(
+            use_cache=False, parallel_validation=True
+        ) as parallel:
+            actual = parallel.validate_data(data)
+
+        expected = sequential.validate_data(data)
+        assert [e.message for e in actual.errors] == [
+            e.message for e in expected.errors
+        ]
+
+    def test_parser_reused_per_directory(self, contract_files):
+        orchestrator = EmployeeValidationOrchestrator(use_cache=False)
+        orchestrator.validate_batch(contract_files)
+
+        assert len(orchestrator._parsers) == 1
+
+
+class TestIterValidate:
+    """Tests for streaming results with iter_validate."""
+
+    def test_sequential_yields_in_input_order(self, contract_files):
+        orchestrator = EmployeeValidationOrchestrator(use_cache=False)
+
+        paths = [fp for fp, _ in orchestrator.iter_validate(contract_files)]
+
+        assert paths == contract_files
+
+    def test_threads_ordered_matches_batch(self, contract_files):
+        with EmployeeValidationOrchestrator(
+            use_cache=False, parallel_validation=True, max_workers=1
+        ) as orchestrator:
+            streamed = list(orchestrator.iter_validate(contract_files, ordered=True))
+            batch = orchestrator.validate_batch(contract_files)
+
+        assert [fp for fp, _ in streamed] == contract_files
+        for filepath, result in streamed:
+            assert result.is_valid == batch[filepath].is_valid
+
+    def test_threads_unordered_yields_every_file_once(self, contract_files):
+        with EmployeeValidationOrchestrator(
+            use_cache=False, parallel_validation=True
+        ) as orchestrator:
+            paths = [
+                fp for fp, _ in orchestrator.iter_validate(contract_files + contract_files)
+            ]
+
+        assert sorted(paths) == sorted(contract_files)
+
+    def test_processes_ordered(self, contract_files):
+        orchestrator = EmployeeValidationOrchestrator(
+            use_cache=False, executor="process", max_workers=2
+        )
+
+        streamed = list(orchestrator.iter_validate(contract_files, ordered=True))
+
+        assert [fp for fp, _ in streamed] == contract_files
+        assert [r.is_valid for _, r in streamed] == [
+            i % 2 == 0 for i in range(len(contract_files))
+        ]
+
+
+class TestValidateContent:
+    """Validating request bodies without a file."""
+
+    def test_matches_validate_file(self, contract_files):
+        orchestrator = EmployeeValidationOrchestrator(use_cache=False)
+        for path in contract_files[:2]:
+            with open(path, "rb") as f:
+                raw = f.read()
+            expected = orchestrator.validate_file(path)
+            for content in (raw, raw.decode("utf-8")):
+                result = orchestrator.validate_content(content)
+                assert result.is_valid == expected.is_valid
+                assert [e.message for e in result.errors] == [
+                    e.message for e in expected.errors
+                ]
+
+    def test_parse_error(self):
+        result = EmployeeValidationOrchestrator(use_cache=False).validate_content(
+            "role: [unclosed"
+        )
+        assert not result.is_valid
+        assert result.errors[0].field == "file"
+
+    def test_repeated_content_skips_parsing(self, monkeypatch):
+        orchestrator = EmployeeValidationOrchestrator(use_cache=True)
+        content = VALID_YAML + "# validate_content cache\n"
+        first = orchestrator.validate_content(content)
+
+        def fail(_):
+            raise AssertionError("parsed again")
+
+        monkeypatch.setattr(orchestrator.parser, "parse_string", fail)
+        assert orchestrator.validate_content(content) is first
@@ -0,0 +1,94 @@
+"""Tests for git-aware changed-file selection."""
+
+import os
+import shutil
+import subprocess
+
+import pytest
+
+from tooling.git_changes import GitChangesError, changed_files_since, select_changed
+
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+
+CONTRACT = "role:\n  title: Agent\n  level: senior\nlifecycle:\n  status: active\n"
+
+
+def git(repo, *args):
+    subprocess.run(
+        ["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    (tmp_path / "agents" / "team").mkdir(parents=True)
+    for name in ("a.md", "b.md", "team/c.md"):
+        (tmp_path / "agents" / name).write_text(CONTRACT)
+    (tmp_path / "other.md").write_text(CONTRACT)
+    git(tmp_path, "init", "-q")
+    git(tmp_path, "add", ".")
+    git(tmp_path, "commit", "-q", "-m", "initial")
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def real(path):
+    return os.path.realpath(path)
+
+
+class TestChangedFilesSince:
+    """Tests for changed_files_since function."""
+
+    def test_no_changes(self, repo):
+        assert changed_files_since("HEAD") == set()
+
+    def test_reports_modified_untracked_and_committed(self, repo):
+        (repo / "agents" / "a.md").write_text(CONTRACT + "# edited\n")
+        (repo / "agents" / "team" / "new.md").write_text(CONTRACT)
+        (repo / "other.md").write_text(CONTRACT + "# edited\n")
+        git(repo, "commit", "-q", "-am", "edit other")
+        (repo / "agents" / "b.md").unlink()
+
+        changed = changed_files_since("HEAD~1")
+
+        assert changed == {
+            real(repo / "agents" / "a.md"),
+            real(repo / "agents" / "team" / "new.md"),
+            real(repo / "other.md"),
+        }
+
+    def test_unknown_revision(self, repo):
+        with pytest.raises(GitChangesError):
+            changed_files_since("no-such-rev")
+
+    def test_rejects_option_like_revision(self, repo):
+        with pytest.raises(GitChangesError):
+            changed_files_since("--output=/tmp/x")
+
+
+class TestSelectChanged:
+    """Tests for select_changed function."""
+
+    def test_matches_directories_files_and_globs(self, repo):
+        changed = {
+            real(repo / "agents" / "a.md"),
+            real(repo / "agents" / "team" / "c.md"),
+            real(repo / "other.md"),
+        }
+
+        assert select_changed(["agents"], changed) == [
+            os.path.join("agents", "a.md"),
+            os.path.join("agents", "team", "c.md"),
+        ]
+        assert select_changed(["other.md", "agents/b.md"], changed) == ["other.md"]
+        assert select_changed(["agents/*.md"], changed) == [
+            os.path.join("agents", "a.md")
+        ]
+
+    def test_skips_files_that_no_longer_exist(self, repo):
+        gone = real(repo / "agents" / "gone.md")
+        assert select_changed(["agents"], {gone}) == []
@@ -0,0 +1,79 @@
+"""Tests for the compiled guardrail matcher."""
+
+from __future__ import annotations
+
+import random
+
+from runtime import Employee
+from runtime.guardrails import GuardrailMatcher
+
+
+def linear_blocks(prohibited, action):
+    """The original per-entry scan `is_action_allowed` used to run."""
+    haystack = (action or "").strip().lower()
+    if not haystack:
+        return True
+    for forbidden in prohibited:
+        needle = forbidden.strip().lower()
+        if needle and (needle in haystack or haystack in needle):
+            return True
+    return False
+
+
+def test_both_directions_and_normalisation():
+    matcher = GuardrailMatcher(["  Delete Production Database ", "", "exfiltrate"])
+    assert matcher.blocks("please DELETE production database now")
+    assert matcher.blocks("delete production")
+    assert matcher.blocks("  EXFIL ")
+    assert not matcher.blocks("write a unit test")
+    assert matcher.blocks("   ")
+    assert matcher.blocks(None)
+
+
+def test_empty_list_allows_everything_but_blank():
+    matcher = GuardrailMatcher([])
+    assert not matcher.blocks("anything")
+    assert matcher.blocks("")
+
+
+def test_matches_linear_scan_on_random_inputs():
+    rng = random.Random(42)
+    alphabet = "abcAB  İ"  # İ lowercases to two characters
+
+    def word(limit):
+        return "".join(rng.choice(alphabet) for _ in range(rng.randint(0, limit)))
+
+    for _ in range(3000):
+        prohibited = [word(8) for _ in range(rng.randint(0, 8))]
+        matcher = GuardrailMatcher(prohibited)
+        for _ in range(10):
+            action = word(12)
+            assert matcher.blocks(action) == linear_blocks(prohibited, action), (
+                prohibited,
+                action,
+            )
+
+
+def test_employee_compiles_guardrails_once(monkeypatch):
+    import runtime.employee as employee_module
+
+    built = []
+    real = employee_module.GuardrailMatcher
+
+    def counting(prohibited):
+        built.append(prohibited)
+        return real(prohibited)
+
+    monkeypatch.setattr(employee_module, "GuardrailMatcher", counting)
+    emp = Employee(
+        {
+            "role": {"title": "Agent"},
+            "lifecycle": {"status": "active"},
+            "guardrails": {"prohibited_actions": ["rm -rf", "drop table"]},
+        }
+    )
+
+    assert emp.is_action_allowed("list files") is True
+    assert emp.is_action_allowed("DROP TABLE users") is False
+    assert emp.is_action_allowed("rm") is False
+    assert len(built) == 1
@@ -0,0 +1,73 @@
+"""Tests for the lazy package imports (PEP 562) of tooling and runtime."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+
+DEFERRED = ["asyncio", "concurrent.futures", "hashlib", "jsonschema", "sqlite3", "subprocess"]
+
+
+def loaded_after(statement):
+    """Which of DEFERRED a fresh interpreter has loaded after `statement`."""
+    code = (
+        f"import json, sys\n{statement}\n"
+        f"print(json.dumps([m for m in {DEFERRED!r} if m in sys.modules]))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True, cwd=ROOT
+    ).stdout
+    return json.loads(out)
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import tooling",
+        "import runtime",
+        "import tooling.cli",
+        "from runtime import Employee",
+        "from tooling import EmployeeValidationOrchestrator",
+        "import tooling.strict_schema_check",
+    ],
+)
+def test_heavy_modules_are_deferred(statement):
+    assert loaded_after(statement) == []
+
+
+def test_deferred_modules_load_on_use():
+    assert "concurrent.futures" in loaded_after("from runtime import EmployeeRegistry")
+    assert "sqlite3" in loaded_after("from runtime import BudgetLedger")
+
+
+def test_lazy_names_resolve_to_their_definitions():
+    import runtime
+    import tooling
+    from runtime.registry import EmployeeRegistry
+    from tooling.employee_validator import EmployeeValidationOrchestrator
+
+    assert tooling.EmployeeValidationOrchestrator is EmployeeValidationOrchestrator
+    assert runtime.EmployeeRegistry is EmployeeRegistry
+    assert tooling.cache.get_cache is not None
+    for package in (tooling, runtime):
+        assert set(package.__all__) <= set(dir(package))
+        for name in package.__all__:
+            assert getattr(package, name) is not None
+
+
+def test_unknown_attribute_raises():
+    import runtime
+    import tooling
+
+    with pytest.raises(AttributeError):
+        tooling.not_a_name
+    with pytest.raises(AttributeError):
+        runtime.not_a_name
+    with pytest.raises(ImportError):
+        from tooling import not_a_name  # noqa: F401
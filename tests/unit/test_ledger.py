@@ -0,0 +1,93 @@
+"""Tests for the cross-process budget ledger."""
+
+from __future__ import annotations
+
+import multiprocessing
+
+import pytest
+
+from runtime import BudgetExceeded, BudgetTracker
+from runtime.ledger import BudgetLedger, LedgerError
+
+
+def spend_quarters(tracker, attempts, results):
+    granted = 0
+    for _ in range(attempts):
+        try:
+            tracker.try_spend(0.25)
+            granted += 1
+        except BudgetExceeded:
+            pass
+    results.put(granted)
+
+
+def test_trackers_share_one_total(tmp_path):
+    path = tmp_path / "budget.sqlite3"
+    first = BudgetTracker(1.0, ledger=BudgetLedger(path, key="agent-1"))
+    second = BudgetTracker(1.0, ledger=BudgetLedger(path, key="agent-1"))
+    other_agent = BudgetTracker(1.0, ledger=BudgetLedger(path, key="agent-2"))
+
+    first.try_spend(0.5)
+    second.try_spend(0.25)
+    with pytest.raises(BudgetExceeded) as exc:
+        first.try_spend(0.5)
+
+    assert exc.value.spent == 0.75
+    assert second.spent == 0.75
+    assert second.remaining() == 0.25
+    assert other_agent.try_spend(1.0) is True
+
+    second.reset()
+    assert first.spent == 0.0
+
+
+def test_unlimited_tracker_records_spend(tmp_path):
+    tracker = BudgetTracker(None, ledger=BudgetLedger(tmp_path / "b.sqlite3"))
+    assert tracker.try_spend(123.0) is True
+    assert tracker.spent == 123.0
+    assert tracker.remaining() is None
+
+
+@pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(), reason="needs fork"
+)
+def test_limit_holds_across_processes(tmp_path):
+    ctx = multiprocessing.get_context("fork")
+    ledger = BudgetLedger(tmp_path / "budget.sqlite3", key="agent")
+    tracker = BudgetTracker(20.0, ledger=ledger)
+    tracker.try_spend(0.0)  # connect before forking; children must reconnect
+
+    results = ctx.Queue()
+    workers = [
+        ctx.Process(target=spend_quarters, args=(tracker, 50, results))
+        for _ in range(4)
+    ]
+    for w in workers:
+        w.start()
+    granted = sum(results.get(timeout=60) for _ in workers)
+    for w in workers:
+        w.join()
+
+    assert granted == 80
+    assert tracker.spent == 20.0
+
+
+def test_unusable_path_raises_ledger_error(tmp_path):
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("")
+    tracker = BudgetTracker(1.0, ledger=BudgetLedger(blocker / "budget.sqlite3"))
+    with pytest.raises(LedgerError):
+        tracker.try_spend(0.1)
+
+
+def test_reserve_avoids_sqlite_335_syntax(tmp_path):
+    # RETURNING needs SQLite >= 3.35; Python 3.8 builds often ship older.
+    ledger = BudgetLedger(tmp_path / "budget.sqlite3", key="agent-1")
+    statements = []
+    ledger._connect().set_trace_callback(statements.append)
+
+    assert ledger.reserve(0.75, 1.0) == (True, 0.75)
+    assert ledger.reserve(0.5, 1.0) == (False, 0.75)
+    assert ledger.reserve(0.5, None) == (True, 1.25)
+    assert not any("RETURNING" in sql.upper() for sql in statements)
+    assert not ledger._connect().in_transaction
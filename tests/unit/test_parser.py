@@ -4,7 +4,7 @@ import os
 import pytest
 from pathlib import Path
 
-from tooling.parser import SecureYAMLParser, YAMLErrorContext
+from tooling.parser import LIBYAML_AVAILABLE, SecureYAMLParser, YAMLErrorContext
 
 
 class TestSecureYAMLParser:
@@ -213,6 +213,62 @@ class TestSecureYAMLParser:
         assert data == {"spec": {"name": "test-spec_v1.0"}}
         assert error_line is None
 
+    def test_parse_file_enforces_depth_limit(self, tmp_path):
+        parser = SecureYAMLParser(max_depth=2, allowed_directories=[str(tmp_path)])
+        test_file = tmp_path / "deep.yaml"
+        test_file.write_text("a:\n  b:\n    c:\n      d: deep\n")
+
+        with pytest.raises(YAMLErrorContext) as exc_info:
+            parser.parse_file(str(test_file))
+
+        assert "too deep" in str(exc_info.value).lower()
+        assert exc_info.value.line_number == 3
+
+    def test_python_loader_fallback(self):
+        parser = SecureYAMLParser(max_depth=2, use_libyaml=False)
+        assert parser.use_libyaml is False
+
+        data, _ = parser.parse_string("a:\n  b: 1\n")
+        assert data == {"a": {"b": 1}}
+        with pytest.raises(YAMLErrorContext):
+            parser.parse_string("a:\n  b:\n    c: 1\n")
+
+    @pytest.mark.skipif(not LIBYAML_AVAILABLE, reason="PyYAML built without libyaml")
+    def test_libyaml_loader_matches_python_loader(self):
+        examples_dir = Path(__file__).resolve().parents[2] / "examples"
+        fast = SecureYAMLParser()
+        slow = SecureYAMLParser(use_libyaml=False)
+        assert fast.use_libyaml is True
+
+        for fp in [examples_dir / "senior-dev.md", examples_dir / "trading-bot.md"]:
+            content = fp.read_text(encoding="utf-8")
+            assert fast.parse_string(content) == slow.parse_string(content)
+
+    @pytest.mark.skipif(not LIBYAML_AVAILABLE, reason="PyYAML built without libyaml")
+    def test_libyaml_loader_reports_line_numbers(self):
+        parser = SecureYAMLParser()
+
+        with pytest.raises(YAMLErrorContext) as exc_info:
+            parser.parse_string("spec:\n  name: test\n  version: [invalid\n")
+
+        assert "YAML parsing error" in str(exc_info.value)
+        assert exc_info.value.line_number is not None
+
+    @pytest.mark.parametrize("use_libyaml", [True, False])
+    def test_parse_file_errors_name_the_file(self, tmp_path, use_libyaml):
+        if use_libyaml and not LIBYAML_AVAILABLE:
+            pytest.skip("PyYAML built without libyaml")
+        parser = SecureYAMLParser(allowed_directories=[str(tmp_path)], use_libyaml=use_libyaml)
+        test_file = tmp_path / "bad_emp.md"
+        test_file.write_text("role:\n  title: Agent\ntags: [unclosed\n")
+
+        with pytest.raises(YAMLErrorContext) as exc_info:
+            parser.parse_file(str(test_file))
+
+        assert f'in "{test_file}", line 4' in str(exc_info.value)
+        assert "<unicode string>" not in str(exc_info.value)
+        assert exc_info.value.line_number == 4
+
     @pytest.fixture
     def tmp_path(self, tmp_path):
         return tmp_path
@@ -0,0 +1,202 @@
+"""Tests for the hot-reloading contract registry."""
+
+from __future__ import annotations
+
+import os
+import threading
+from pathlib import Path
+
+import pytest
+
+from runtime import Employee, EmployeeRegistry
+
+EXAMPLE = Path(__file__).resolve().parents[2] / "examples" / "senior-dev.md"
+
+
+def write_contract(path, agent_id, title="Senior Full-Stack Developer"):
+    text = EXAMPLE.read_text(encoding="utf-8")
+    text = text.replace('agent_id: "dev-001"', f'agent_id: "{agent_id}"')
+    text = text.replace('title: "Senior Full-Stack Developer"', f'title: "{title}"', 1)
+    path.write_text(text, encoding="utf-8")
+
+
+def bump_mtime(path):
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def contracts(tmp_path):
+    for i in range(5):
+        write_contract(tmp_path / f"agent-{i}.md", f"agent-{i}")
+    return tmp_path
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_loads_directory_indexed_by_agent_id(contracts, executor):
+    registry = EmployeeRegistry(contracts, executor=executor, max_workers=2)
+
+    assert len(registry) == 5
+    assert registry.agent_ids() == [f"agent-{i}" for i in range(5)]
+    assert isinstance(registry["agent-3"], Employee)
+    assert registry.get("agent-3").agent_id == "agent-3"
+    assert "agent-0" in registry
+    assert registry.get("nobody") is None
+    with pytest.raises(KeyError):
+        registry["nobody"]
+    assert registry.errors == {}
+
+
+def test_matches_employee_from_file(contracts):
+    registry = EmployeeRegistry(contracts)
+    direct = Employee.from_file(contracts / "agent-1.md")
+    assert registry["agent-1"].data == direct.data
+    assert registry["agent-1"].system_prompt() == direct.system_prompt()
+
+
+def test_unchanged_files_are_not_reloaded(contracts):
+    registry = EmployeeRegistry(contracts)
+    before = {agent_id: registry[agent_id] for agent_id in registry.agent_ids()}
+
+    report = registry.reload()
+
+    assert report.added == report.updated == report.removed == []
+    assert report.unchanged == 5
+    for agent_id, employee in before.items():
+        assert registry[agent_id] is employee
+
+
+def test_touched_file_with_same_content_is_not_reparsed(contracts):
+    registry = EmployeeRegistry(contracts)
+    before = registry["agent-2"]
+    bump_mtime(contracts / "agent-2.md")
+
+    report = registry.reload()
+
+    assert report.updated == []
+    assert registry["agent-2"] is before
+
+
+def test_changed_added_and_removed_files(contracts):
+    registry = EmployeeRegistry(contracts)
+    untouched = registry["agent-0"]
+    write_contract(contracts / "agent-1.md", "agent-1", title="Staff Engineer")
+    bump_mtime(contracts / "agent-1.md")
+    write_contract(contracts / "agent-9.md", "agent-9")
+    (contracts / "agent-4.md").unlink()
+
+    report = registry.reload()
+
+    assert report.updated == [str(contracts / "agent-1.md")]
+    assert report.added == [str(contracts / "agent-9.md")]
+    assert report.removed == [str(contracts / "agent-4.md")]
+    assert registry["agent-1"].title == "Staff Engineer"
+    assert "agent-9" in registry
+    assert "agent-4" not in registry
+    assert registry["agent-0"] is untouched
+
+
+def test_broken_update_keeps_last_good_version(contracts):
+    registry = EmployeeRegistry(contracts)
+    good = registry["agent-1"]
+    path = contracts / "agent-1.md"
+    path.write_text("---\nrole: [unclosed\n---\n", encoding="utf-8")
+    bump_mtime(path)
+
+    report = registry.reload()
+
+    assert str(path) in report.errors
+    assert registry["agent-1"] is good
+    assert str(path) in registry.errors
+
+    write_contract(path, "agent-1", title="Fixed")
+    bump_mtime(path)
+    registry.reload()
+    assert registry["agent-1"].title == "Fixed"
+    assert registry.errors == {}
+
+
+def test_invalid_contract_is_reported_not_served(contracts):
+    (contracts / "bad.md").write_text("---\nrole: {}\n---\n", encoding="utf-8")
+    registry = EmployeeRegistry(contracts)
+    assert len(registry) == 5
+    assert str(contracts / "bad.md") in registry.errors
+
+
+def test_duplicate_agent_id_first_path_wins(contracts):
+    write_contract(contracts / "zz-copy.md", "agent-0", title="Impostor")
+    registry = EmployeeRegistry(contracts)
+    assert registry["agent-0"].title == "Senior Full-Stack Developer"
+    assert "Duplicate agent_id" in registry.errors[str(contracts / "zz-copy.md")]
+
+
+def test_readers_see_whole_snapshots_during_reloads(contracts):
+    registry = EmployeeRegistry(contracts)
+    stop = threading.Event()
+    seen = []
+
+    def read():
+        while not stop.is_set():
+            employee = registry.get("agent-1")
+            seen.append(employee is not None and employee.agent_id == "agent-1")
+
+    reader = threading.Thread(target=read)
+    reader.start()
+    try:
+        for n in range(10):
+            write_contract(contracts / "agent-1.md", "agent-1", title=f"v{n}")
+            bump_mtime(contracts / "agent-1.md")
+            registry.reload()
+    finally:
+        stop.set()
+        reader.join()
+    assert seen and all(seen)
+    assert registry["agent-1"].title == "v9"
+
+
+def test_memory_and_metrics(contracts):
+    registry = EmployeeRegistry(contracts)
+    registry.get("agent-0")
+    registry.get("missing")
+
+    usage = registry.memory_usage()
+    assert set(usage) == set(registry.agent_ids())
+    assert all(size > (contracts / "agent-0.md").stat().st_size for size in usage.values())
+
+    metrics = registry.metrics()
+    assert metrics["contracts"] == 5
+    assert metrics["lookups"] == 2
+    assert metrics["lookup_p99_ns"] >= metrics["lookup_p50_ns"] > 0
+    assert metrics["reloads"] == 1
+    assert metrics["memory_bytes"] == sum(usage.values())
+    assert metrics["last_reload_seconds"] > 0
+
+
+def test_keep_data_false_holds_only_compact_views(contracts):
+    full = EmployeeRegistry(contracts)
+    compact = EmployeeRegistry(contracts, keep_data=False)
+
+    assert compact["agent-2"].system_prompt() == full["agent-2"].system_prompt()
+    assert compact["agent-2"].data == full["agent-2"].data
+    for agent_id, size in compact.memory_usage().items():
+        assert size < full.memory_usage()[agent_id]
+
+
+def test_rejects_unknown_executor(contracts):
+    with pytest.raises(ValueError):
+        EmployeeRegistry(contracts, executor="fiber")
+
+
+def test_unvalidated_malformed_contract_is_isolated(contracts):
+    (contracts / "bad.md").write_text("role: 5\n", encoding="utf-8")
+    registry = EmployeeRegistry(contracts, validate=False)
+    assert len(registry) == 5
+    assert "role" in registry.errors[str(contracts / "bad.md")]
+
+    good = registry["agent-1"]
+    path = contracts / "agent-1.md"
+    path.write_text("role: 5\n", encoding="utf-8")
+    bump_mtime(path)
+    report = registry.reload()
+    assert str(path) in report.errors
+    assert registry["agent-1"] is good
@@ -106,6 +106,64 @@ def test_system_prompt_for_real_example_renders():
     assert len(prompt.splitlines()) > 5
 
 
+def test_system_prompt_is_rendered_once(monkeypatch):
+    emp = Employee.from_yaml(MIN_VALID)
+    calls = []
+    render = emp._render_system_prompt
+    monkeypatch.setattr(emp, "_render_system_prompt", lambda: calls.append(1) or render())
+
+    first = emp.system_prompt()
+    assert emp.system_prompt() is first
+    assert emp.to_langchain_kwargs()["system_message"] is first
+    assert len(calls) == 1
+
+
+def test_invalidate_rebuilds_derived_state():
+    emp = Employee.from_yaml(MIN_VALID)
+    assert "Worker" in emp.system_prompt()
+    assert emp.is_action_allowed("rename the repo") is True
+    assert emp.is_in_scope("do code review").in_scope is True
+
+    emp.data["role"]["title"] = "Reviewer"
+    emp.data["guardrails"]["prohibited_actions"].append("rename the repo")
+    emp.data["scope"]["in_scope"] = ["writing tests"]
+    # Cached until told otherwise.
+    assert "Reviewer" not in emp.system_prompt()
+
+    emp.invalidate()
+    assert "Reviewer" in emp.system_prompt()
+    assert emp.is_action_allowed("rename the repo") is False
+    assert emp.is_in_scope("do code review").in_scope is False
+
+
+def test_memo_caches_artifacts_until_invalidated():
+    emp = Employee.from_yaml(MIN_VALID)
+    calls = []
+
+    def build():
+        calls.append(1)
+        return [emp.data["role"]["title"]]
+
+    first = emp.memo(("custom", 1), build)
+    assert emp.memo(("custom", 1), build) is first
+    assert emp.memo(("custom", 2), build) is not first
+    assert len(calls) == 2
+
+    emp.invalidate()
+    assert emp.memo(("custom", 1), build) is not first
+    assert len(calls) == 3
+
+
+def test_prompt_size_estimate():
+    emp = Employee.from_yaml(MIN_VALID)
+    size = emp.prompt_size()
+    prompt = emp.system_prompt()
+    assert size.chars == len(prompt)
+    assert size.bytes == len(prompt.encode("utf-8")) > size.chars  # "—" is 3 bytes
+    assert size.tokens == -(-size.chars // 4)
+    assert emp.prompt_size() is size
+
+
 def test_is_action_allowed_blocks_prohibited():
     emp = Employee.from_yaml(MIN_VALID)
     assert emp.is_action_allowed("write a unit test") is True
@@ -113,6 +171,62 @@ def test_is_action_allowed_blocks_prohibited():
     assert emp.is_action_allowed("please exfiltrate secrets") is False
 
 
+BATCH_TASKS = [
+    "please write some tests for module X",
+    "touch the production database",
+    "",
+    "plan the offsite",
+    "please write some tests for module X",
+]
+BATCH_ACTIONS = ["write a unit test", "DELETE PRODUCTION DATABASE now", "", "exfiltrate"]
+
+
+def test_classify_many_matches_is_in_scope():
+    emp = Employee.from_yaml(MIN_VALID)
+    decisions = emp.classify_many(BATCH_TASKS)
+    assert decisions == [emp.is_in_scope(t) for t in BATCH_TASKS]
+    # Identical outcomes share one ScopeDecision instance.
+    assert decisions[0] is decisions[4]
+
+
+def test_check_actions_matches_is_action_allowed():
+    emp = Employee.from_yaml(MIN_VALID)
+    assert emp.check_actions(BATCH_ACTIONS) == [
+        emp.is_action_allowed(a) for a in BATCH_ACTIONS
+    ]
+
+
+def test_batches_across_worker_processes(monkeypatch):
+    import runtime.batch
+
+    monkeypatch.setattr(runtime.batch, "MIN_PARALLEL_BATCH", 1)
+    emp = Employee.from_yaml(MIN_VALID)
+    tasks = BATCH_TASKS * 5
+    actions = BATCH_ACTIONS * 5
+    assert emp.classify_many(tasks, workers=2) == emp.classify_many(tasks)
+    assert emp.check_actions(actions, workers=2) == emp.check_actions(actions)
+
+
+def test_cli_check_scope_file_emits_ndjson(tmp_path, capsys):
+    import json
+
+    from runtime.cli import main
+
+    contract = tmp_path / "employee.md"
+    contract.write_text(MIN_VALID)
+    tasks = tmp_path / "tasks.txt"
+    tasks.write_text("please write some tests\n\ntouch the production database\n")
+
+    code = main([str(contract), "--check-scope-file", str(tasks)])
+
+    rows = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert code == 2
+    assert [(r["line"], r["in_scope"], r["matched"]) for r in rows] == [
+        (1, True, "writing tests"),
+        (3, False, "production database"),
+    ]
+
+
 def test_is_in_scope_fail_closed():
     emp = Employee.from_yaml(MIN_VALID)
     assert emp.is_in_scope("please write some tests for module X").in_scope is True
@@ -179,3 +293,41 @@ def test_to_langchain_kwargs_shape():
     assert "system_message" in kw
     assert kw["model"] == "gpt-4o"
     assert kw["system_message"].startswith("You are")
+
+
+@pytest.fixture
+def parse_counter(monkeypatch):
+    """Count YAML documents constructed by any loader."""
+    from yaml.constructor import BaseConstructor
+
+    calls = {"count": 0}
+    original = BaseConstructor.get_single_data
+
+    def counting(self):
+        calls["count"] += 1
+        return original(self)
+
+    monkeypatch.setattr(BaseConstructor, "get_single_data", counting)
+    return calls
+
+
+def test_from_file_parses_once(parse_counter):
+    Employee.from_file(EXAMPLES / "senior-dev.md")
+    assert parse_counter["count"] == 1
+
+
+def test_from_yaml_parses_once(parse_counter):
+    Employee.from_yaml(MIN_VALID)
+    assert parse_counter["count"] == 1
+
+
+def test_from_file_missing_raises_file_not_found(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        Employee.from_file(tmp_path / "missing.md")
+
+
+def test_from_file_invalid_contract_raises(tmp_path):
+    path = tmp_path / "employee.md"
+    path.write_text("role:\n  title: Agent\n  level: boss\nlifecycle:\n  status: active\n")
+    with pytest.raises(ContractError, match="role.level"):
+        Employee.from_file(path)
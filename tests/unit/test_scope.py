@@ -0,0 +1,168 @@
+"""Tests for the indexed scope matcher."""
+
+from __future__ import annotations
+
+import random
+import re
+import threading
+
+from runtime import Employee, ScopeDecision
+from runtime.scope import ScopeMatcher, tokens
+
+
+STOP = {"and", "the", "for", "with", "that", "this", "from", "into", "your"}
+
+
+def reference_tokens(text):
+    return {
+        w
+        for w in re.findall(r"[a-zA-Z0-9_]{3,}", (text or "").lower())
+        if w not in STOP
+    }
+
+
+def reference_phrase_matches(phrase, haystack_tokens, haystack_lower):
+    """The pairwise prefix scan `is_in_scope` used to run per phrase."""
+    if not phrase:
+        return False
+    if phrase.lower() in haystack_lower:
+        return True
+    phrase_tokens = reference_tokens(phrase)
+    if not phrase_tokens:
+        return False
+    for pt in phrase_tokens:
+        stem = pt[:4]
+        if not any(
+            ht.startswith(stem) or pt.startswith(ht[:4]) for ht in haystack_tokens
+        ):
+            return False
+    return True
+
+
+def reference_decision(out_of_scope, in_scope, text):
+    haystack_lower = (text or "").lower()
+    haystack_tokens = reference_tokens(text)
+    for needle in out_of_scope:
+        if reference_phrase_matches(needle, haystack_tokens, haystack_lower):
+            return ScopeDecision(False, needle, "matched out_of_scope")
+    for needle in in_scope:
+        if reference_phrase_matches(needle, haystack_tokens, haystack_lower):
+            return ScopeDecision(True, needle, "matched in_scope")
+    return ScopeDecision(False, None, "no in_scope entry matched (fail-closed default)")
+
+
+def employee(out_of_scope, in_scope):
+    return Employee(
+        {
+            "role": {"title": "Agent"},
+            "lifecycle": {"status": "active"},
+            "scope": {"in_scope": in_scope, "out_of_scope": out_of_scope},
+        }
+    )
+
+
+def test_tokens_drop_stopwords_and_short_words():
+    assert tokens("Write the tests, and CI for it!") == {"write", "tests"}
+    assert tokens(None) == set()
+
+
+def test_prefix_matching_rules():
+    matcher = ScopeMatcher(["writing tests", "api", "code review"])
+    assert matcher.first_match("please write some testcases") == 0
+    assert matcher.first_match("document the APIs") == 1
+    assert matcher.first_match("review this code") == 2
+    assert matcher.first_match("deploy to production") is None
+
+
+def test_substring_match_wins_in_order():
+    matcher = ScopeMatcher(["ode rev", "code review"])
+    assert matcher.first_match("a code review") == 0
+
+
+def test_is_in_scope_matches_reference_on_random_inputs():
+    rng = random.Random(7)
+    words = [
+        "write", "writing", "wri", "test", "tests", "tes", "api", "apis",
+        "code", "cod", "review", "the", "and", "db", "prod", "production",
+        "rite", "view", "this", "thi", "hat", "that", "ode",
+    ]
+
+    def phrase(limit):
+        picked = [rng.choice(words) for _ in range(rng.randint(0, limit))]
+        return rng.choice([" ", ", ", "-", ""]).join(picked)
+
+    for _ in range(3000):
+        out_of_scope = [phrase(3) for _ in range(rng.randint(0, 4))]
+        in_scope = [phrase(3) for _ in range(rng.randint(0, 4))]
+        emp = employee(out_of_scope, in_scope)
+        for _ in range(8):
+            text = phrase(6)
+            assert emp.is_in_scope(text) == reference_decision(
+                out_of_scope, in_scope, text
+            ), (out_of_scope, in_scope, text)
+
+
+def test_employee_builds_scope_index_once(monkeypatch):
+    import runtime.employee as employee_module
+
+    built = []
+    real = employee_module.ScopeMatcher
+
+    def counting(phrases):
+        built.append(phrases)
+        return real(phrases)
+
+    monkeypatch.setattr(employee_module, "ScopeMatcher", counting)
+    emp = employee(["production database"], ["writing tests"])
+
+    assert emp.is_in_scope("write tests").in_scope is True
+    assert emp.is_in_scope("touch the production database").matched == (
+        "production database"
+    )
+    assert len(built) == 1
+
+
+def test_invalidate_during_lookup_still_fails_closed(monkeypatch):
+    import runtime.employee as employee_module
+
+    emp = employee(["production database"], ["writing tests"])
+
+    class InvalidatingMatcher(ScopeMatcher):
+        def first_match(self, text):
+            # Another thread reloads the contract mid-lookup.
+            emp.invalidate()
+            return super().first_match(text)
+
+    monkeypatch.setattr(employee_module, "ScopeMatcher", InvalidatingMatcher)
+
+    decision = emp.is_in_scope("deploy to staging")
+    assert decision == ScopeDecision(
+        False, None, "no in_scope entry matched (fail-closed default)"
+    )
+    assert emp.is_in_scope("touch the production database").in_scope is False
+
+
+def test_concurrent_first_lookups_never_fail_open():
+    emps = [employee(["production database"], ["database"]) for _ in range(50)]
+    barrier = threading.Barrier(8)
+    decisions = []
+    lock = threading.Lock()
+
+    def worker():
+        barrier.wait()
+        for emp in emps:
+            decision = emp.is_in_scope("migrate the production database")
+            with lock:
+                decisions.append(decision)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(decisions) == 8 * len(emps)
+    assert all(
+        d == ScopeDecision(False, "production database", "matched out_of_scope")
+        for d in decisions
+    )
@@ -147,3 +147,14 @@ def test_export_round_trip_through_pyyaml():
     re_loaded = yaml.safe_load(re_dumped)
     assert re_loaded == fm
     assert body.strip(), "body must be non-empty"
+
+
+def test_export_is_cached_until_invalidated():
+    emp = Employee.from_file(EXAMPLES / "senior-dev.md")
+    first = to_skill_md(emp)
+    assert to_skill_md(emp) is first
+    assert to_skill_md(emp, name="custom") != first
+
+    emp.data["role"]["title"] = "Renamed Title"
+    emp.invalidate()
+    assert "Renamed Title" in to_skill_md(emp)
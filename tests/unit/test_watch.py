@@ -0,0 +1,132 @@
+"""Tests for watch mode."""
+
+import os
+
+import pytest
+
+from tooling.employee_validator import EmployeeValidationOrchestrator
+from tooling.watch import WatchSession, format_watch_report, scan_stat_index
+
+
+VALID_YAML = "role:\n  title: Agent\n  level: senior\nlifecycle:\n  status: active\n"
+INVALID_YAML = "role:\n  title: Agent\n  level: boss\nlifecycle:\n  status: active\n"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def write(path, content, mtime_ns):
+    path.write_text(content)
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+@pytest.fixture
+def tree(tmp_path):
+    (tmp_path / "team").mkdir()
+    (tmp_path / ".hidden").mkdir()
+    write(tmp_path / "a.md", VALID_YAML, 1_000_000_000)
+    write(tmp_path / "team" / "b.md", INVALID_YAML, 1_000_000_000)
+    write(tmp_path / ".hidden" / "c.md", VALID_YAML, 1_000_000_000)
+    (tmp_path / "notes.txt").write_text("not a contract")
+    return tmp_path
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def session(tree, clock):
+    orchestrator = EmployeeValidationOrchestrator(use_cache=False)
+    return WatchSession([str(tree)], orchestrator, debounce=0.5, clock=clock)
+
+
+class TestScanStatIndex:
+    """Tests for scan_stat_index function."""
+
+    def test_indexes_markdown_and_skips_hidden(self, tree):
+        index = scan_stat_index([str(tree)])
+
+        assert sorted(index) == [str(tree / "a.md"), str(tree / "team" / "b.md")]
+        assert index[str(tree / "a.md")] == (1_000_000_000, len(VALID_YAML))
+
+    def test_accepts_single_file(self, tree):
+        index = scan_stat_index([str(tree / "a.md")])
+        assert list(index) == [str(tree / "a.md")]
+
+
+class TestWatchSession:
+    """Tests for WatchSession class."""
+
+    def test_start_validates_everything(self, session, tree):
+        report = session.start()
+
+        assert set(report.results) == {str(tree / "a.md"), str(tree / "team" / "b.md")}
+        assert report.newly_failing == [str(tree / "team" / "b.md")]
+        assert report.failing_total == 1
+        assert report.file_total == 2
+
+    def test_no_changes_no_report(self, session, clock):
+        session.start()
+        clock.now = 10.0
+        assert session.poll() is None
+
+    def test_changes_wait_for_debounce(self, session, clock, tree):
+        session.start()
+        write(tree / "a.md", INVALID_YAML, 2_000_000_000)
+        write(tree / "team" / "b.md", VALID_YAML, 2_000_000_000)
+
+        clock.now = 1.0
+        assert session.poll() is None
+
+        clock.now = 1.6
+        report = session.poll()
+
+        assert report is not None
+        assert report.newly_failing == [str(tree / "a.md")]
+        assert report.newly_passing == [str(tree / "team" / "b.md")]
+        assert set(report.results) == {str(tree / "a.md"), str(tree / "team" / "b.md")}
+
+    def test_only_changed_files_revalidated(self, session, clock, tree):
+        session.start()
+        write(tree / "new.md", INVALID_YAML, 2_000_000_000)
+
+        clock.now = 1.0
+        session.poll()
+        clock.now = 2.0
+        report = session.poll()
+
+        assert list(report.results) == [str(tree / "new.md")]
+        assert report.newly_failing == [str(tree / "new.md")]
+        assert report.failing_total == 2
+
+    def test_removed_files_reported(self, session, clock, tree):
+        session.start()
+        (tree / "team" / "b.md").unlink()
+
+        clock.now = 1.0
+        session.poll()
+        clock.now = 2.0
+        report = session.poll()
+
+        assert report.removed == [str(tree / "team" / "b.md")]
+        assert report.failing_total == 0
+        assert "removed" in format_watch_report(report)
+
+    def test_file_filter_applied(self, tree):
+        orchestrator = EmployeeValidationOrchestrator(use_cache=False)
+        watch = WatchSession(
+            [str(tree)],
+            orchestrator,
+            file_filter=lambda files: [f for f in files if f.endswith("a.md")],
+        )
+
+        report = watch.start()
+
+        assert list(report.results) == [str(tree / "a.md")]
@@ -110,3 +110,251 @@ def test_nav_links_present(client):
                   "Integrations", "Docs"]:
         assert label in body, f"Missing nav label: {label}"
 
+
+
+# ---- validation API -----------------------------------------------------
+
+def _example(name="senior-dev.md"):
+    from pathlib import Path
+    return Path("examples", name).read_text(encoding="utf-8")
+
+
+def test_api_validate_raw_body_matches_cli_json(client, tmp_path):
+    from tooling import EmployeeValidationOrchestrator
+    from tooling.cli import OutputFormatter
+
+    text = _example()
+    resp = client.post("/api/validate?filename=dev.md", data=text)
+    assert resp.status_code == 200
+    path = tmp_path / "dev.md"
+    path.write_text(text, encoding="utf-8")
+    expected = OutputFormatter.format_json(
+        EmployeeValidationOrchestrator(use_cache=False).validate_file(str(path)), "dev.md"
+    )
+    assert resp.get_json() == json.loads(expected)
+    assert list(resp.get_json()) == list(json.loads(expected))
+
+
+def test_api_validate_json_body_reports_errors(client):
+    resp = client.post(
+        "/api/validate", json={"content": "role: [unclosed", "filename": "bad.md"}
+    )
+    body = resp.get_json()
+    assert resp.status_code == 200
+    assert body["valid"] is False
+    assert body["file"] == "bad.md"
+    assert body["errors"][0]["field"] == "file"
+
+
+def test_api_validate_rejects_malformed_json(client):
+    resp = client.post("/api/validate", data="{", content_type="application/json")
+    assert resp.status_code == 400
+    resp = client.post("/api/validate", json={"yaml": "role: {}"})
+    assert resp.status_code == 400
+
+
+def test_api_validate_enforces_max_file_size(client, monkeypatch):
+    import web.app as web_app
+
+    monkeypatch.setattr(web_app, "MAX_FILE_SIZE", 64)
+    resp = client.post("/api/validate", data="a: " + "x" * 100)
+    assert resp.status_code == 413
+    assert "too large" in resp.get_json()["error"]
+    resp = client.post("/api/validate/batch", json=["a: " + "x" * 100])
+    assert resp.status_code == 413
+
+
+def test_api_validate_batch_keeps_request_order(client):
+    resp = client.post(
+        "/api/validate/batch",
+        json=[
+            _example(),
+            {"content": "spec: {}", "filename": "partial.md"},
+            {"content": _example("minimal.md"), "filename": "minimal.md"},
+        ],
+    )
+    assert resp.status_code == 200
+    results = resp.get_json()
+    assert [r["valid"] for r in results] == [True, False, True]
+    assert "file" not in results[0]
+    assert results[1]["file"] == "partial.md"
+
+
+def test_api_validate_batch_rejects_bad_items(client):
+    assert client.post("/api/validate/batch", json={"a": 1}).status_code == 400
+    assert client.post("/api/validate/batch", json=["ok", 5]).status_code == 400
+
+
+def test_api_validate_repeats_are_served_from_cache(client, monkeypatch):
+    import web.app as web_app
+
+    orchestrator = web_app._get_orchestrator()
+    calls = []
+    original = orchestrator.parser.parse_bytes
+
+    def counting(content):
+        calls.append(content)
+        return original(content)
+
+    monkeypatch.setattr(orchestrator.parser, "parse_bytes", counting)
+    text = _example("data-analyst.md") + "\n# api cache test\n"
+    first = client.post("/api/validate", data=text).get_json()
+    second = client.post("/api/validate", data=text).get_json()
+    assert first == second
+    assert len(calls) == 1
+
+
+def test_api_cache_leaves_global_cache_alone(client, monkeypatch):
+    import web.app as web_app
+    from tooling import ValidationResult
+    from tooling.cache import get_cache
+
+    monkeypatch.setattr(web_app, "_orchestrator", None)
+    shared = get_cache()
+    monkeypatch.setattr(shared, "max_size", 7)
+    shared.set({"warm": True}, ValidationResult(is_valid=True), key="warm-entry")
+
+    assert client.post("/api/validate", data=_example("data-analyst.md")).status_code == 200
+
+    assert get_cache() is shared
+    assert shared.max_size == 7
+    assert shared.get(key="warm-entry") is not None
+    api_cache = web_app._get_orchestrator()._cache
+    assert api_cache is not shared
+    assert api_cache.max_size == web_app.API_CACHE_SIZE
+
+
+# ---- HTTP caching -------------------------------------------------------
+
+def test_pages_get_content_etag_and_304(client):
+    first = client.get("/spec")
+    etag = first.headers["ETag"]
+    assert first.headers["Cache-Control"] == "public, max-age=300"
+
+    again = client.get("/spec", headers={"If-None-Match": etag})
+    assert again.status_code == 304
+    assert again.data == b""
+    assert client.get("/spec").headers["ETag"] == etag
+
+
+def test_gzip_body_is_decodable_with_its_own_etag(client):
+    import gzip
+
+    plain = client.get("/examples")
+    packed = client.get("/examples", headers={"Accept-Encoding": "gzip"})
+
+    assert packed.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in packed.headers["Vary"]
+    assert gzip.decompress(packed.data) == plain.data
+    assert packed.headers["ETag"] != plain.headers["ETag"]
+    assert len(packed.data) < len(plain.data)
+
+
+def test_static_asset_urls_are_hashed_and_immutable(client):
+    import re
+
+    html = client.get("/").get_data(as_text=True)
+    urls = re.findall(r'href="(/(?:static/style\.css|pygments\.css)\?v=[0-9a-f]+)"', html)
+    assert len(urls) == 2
+    for url in urls:
+        resp = client.get(url)
+        assert resp.status_code == 200
+        assert "immutable" in resp.headers["Cache-Control"]
+        assert client.get(url, headers={"If-None-Match": resp.headers["ETag"]}).status_code == 304
+
+
+def test_api_and_errors_are_not_stored(client):
+    assert client.get("/healthz").headers["Cache-Control"] == "no-store"
+    assert client.post("/api/validate", data="x").headers["Cache-Control"] == "no-store"
+    assert client.get("/examples/nope").headers["Cache-Control"] == "no-store"
+
+
+def test_dev_flag_keeps_no_cache(client, monkeypatch):
+    monkeypatch.setitem(flask_app.config, "DEV_NO_CACHE", True)
+    resp = client.get("/spec", headers={"Accept-Encoding": "gzip"})
+    assert resp.headers["Cache-Control"].startswith("no-store")
+    assert resp.headers["Pragma"] == "no-cache"
+    assert "ETag" not in resp.headers
+    assert "Content-Encoding" not in resp.headers
+
+
+# ---- render cache -------------------------------------------------------
+
+def _bump(path):
+    import os
+
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def test_rendered_pages_are_reused(client, monkeypatch):
+    import web.app as web_app
+
+    calls = []
+    original = web_app.render_template
+
+    def counting(name, **context):
+        calls.append(name)
+        return original(name, **context)
+
+    monkeypatch.setattr(web_app, "render_template", counting)
+    web_app._render_cache.clear()
+    first = client.get("/examples/minimal").data
+    second = client.get("/examples/minimal").data
+    assert first == second
+    assert calls == ["example_detail.html"]
+
+
+def test_spec_page_follows_schema_changes(client, monkeypatch, tmp_path):
+    import web.app as web_app
+
+    schema = tmp_path / "schema.json"
+    schema.write_text(web_app.SCHEMA_PATH.read_text(encoding="utf-8"), encoding="utf-8")
+    monkeypatch.setattr(web_app, "SCHEMA_PATH", schema)
+    assert b"Employee.md Configuration" in client.get("/spec").data
+
+    data = json.loads(schema.read_text(encoding="utf-8"))
+    data["title"] = "Renamed Configuration"
+    schema.write_text(json.dumps(data), encoding="utf-8")
+    _bump(schema)
+    assert b"Renamed Configuration" in client.get("/spec").data
+
+
+def test_example_pages_follow_example_files(client, monkeypatch, tmp_path):
+    import web.app as web_app
+
+    for name in ("minimal.md", "senior-dev.md"):
+        (tmp_path / name).write_text(_example(name), encoding="utf-8")
+    monkeypatch.setattr(web_app, "EXAMPLES_DIR", tmp_path)
+    assert client.get("/examples/minimal").status_code == 200
+    assert client.get("/examples/freelancer").status_code == 404
+
+    edited = _example("minimal.md") + "\n# edited-marker\n"
+    (tmp_path / "minimal.md").write_text(edited, encoding="utf-8")
+    _bump(tmp_path / "minimal.md")
+    assert b"edited-marker" in client.get("/examples/minimal").data
+
+    (tmp_path / "freelancer.md").write_text(_example("freelancer.md"), encoding="utf-8")
+    (tmp_path / "senior-dev.md").unlink()
+    assert client.get("/examples/freelancer").status_code == 200
+    assert client.get("/examples/senior-dev").status_code == 404
+    listing = client.get("/examples").get_data(as_text=True)
+    assert "/examples/freelancer" in listing
+    assert "/examples/senior-dev" not in listing
+
+
+@pytest.mark.parametrize("body", ["role: 5\n", "role: [level]\nlifecycle: x\n"])
+def test_api_validate_reports_wrong_section_types(client, body):
+    resp = client.post("/api/validate", data=body)
+    assert resp.status_code == 200
+    result = resp.get_json()
+    assert result["valid"] is False
+    assert "structurally invalid" in result["errors"][0]["message"]
+
+
+def test_api_validate_batch_isolates_wrong_section_types(client):
+    resp = client.post("/api/validate/batch", json=["role: 5\n", _example("minimal.md")])
+    assert resp.status_code == 200
+    bad, good = resp.get_json()
+    assert bad["valid"] is False
+    assert good["valid"] is True
@@ -1,24 +1,89 @@
-"""Tooling package for employee.md validation."""
+"""Tooling package for employee.md validation.
+
+The names below are imported from their submodules on first access (PEP
+562), so `import tooling` -- and every CLI run, pre-commit hook included --
+only pays for the modules it actually uses.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
 
 from .constants import VERSION
-from .employee_validator import EmployeeValidationOrchestrator
-from .validators import (
-    ValidationResult,
-    ValidationError,
-    set_production_mode,
-    get_production_mode,
-)
-from .parser import SecureYAMLParser, YAMLErrorContext
-from .cache import ValidationCache, reset_cache
-from .logging_config import get_logger, ValidatorLogger, reset_logger
-from .monitoring import (
-    MetricsCollector,
-    get_metrics,
-    reset_metrics,
-    format_prometheus_metrics,
-    format_statsd_metrics,
+
+if TYPE_CHECKING:
+    from .cache import ValidationCache, configure_cache, reset_cache
+    from .config import Config, load_config
+    from .employee_validator import EmployeeValidationOrchestrator
+    from .logging_config import ValidatorLogger, get_logger, reset_logger
+    from .monitoring import (
+        MetricsCollector,
+        format_prometheus_metrics,
+        format_statsd_metrics,
+        get_metrics,
+        reset_metrics,
+    )
+    from .parser import SecureYAMLParser, YAMLErrorContext
+    from .validators import (
+        ValidationError,
+        ValidationResult,
+        get_production_mode,
+        set_production_mode,
+    )
+
+# Public name -> submodule that defines it.
+_EXPORTS: Dict[str, str] = {
+    "EmployeeValidationOrchestrator": "employee_validator",
+    "ValidationResult": "validators",
+    "ValidationError": "validators",
+    "set_production_mode": "validators",
+    "get_production_mode": "validators",
+    "SecureYAMLParser": "parser",
+    "YAMLErrorContext": "parser",
+    "ValidationCache": "cache",
+    "configure_cache": "cache",
+    "reset_cache": "cache",
+    "get_logger": "logging_config",
+    "ValidatorLogger": "logging_config",
+    "reset_logger": "logging_config",
+    "MetricsCollector": "monitoring",
+    "get_metrics": "monitoring",
+    "reset_metrics": "monitoring",
+    "format_prometheus_metrics": "monitoring",
+    "format_statsd_metrics": "monitoring",
+    "Config": "config",
+    "load_config": "config",
+}
+
+# Submodules that used to be imported eagerly, still reachable as attributes.
+_SUBMODULES = frozenset(
+    {
+        "cache",
+        "config",
+        "disk_cache",
+        "employee_validator",
+        "logging_config",
+        "monitoring",
+        "parser",
+        "utils",
+        "validators",
+    }
 )
-from .config import Config, load_config
+
+
+def __getattr__(name: str) -> Any:
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    elif name in _SUBMODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     "EmployeeValidationOrchestrator",
@@ -28,6 +93,7 @@ __all__ = [
     "YAMLErrorContext",
     "ValidationCache",
     "reset_cache",
+    "configure_cache",
     "set_production_mode",
     "get_production_mode",
     "get_logger",
@@ -1,16 +1,76 @@
 """Caching module for validation results."""
 
-import hashlib
 import threading
 import time
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Union
 from collections import OrderedDict
 
-from .constants import DEFAULT_CACHE_MAX_SIZE, DEFAULT_CACHE_TTL
+from .constants import CACHE_SWEEP_INTERVAL, DEFAULT_CACHE_MAX_SIZE, DEFAULT_CACHE_TTL
 from .monitoring import get_metrics
 
 
+def _blake2b(data: bytes = b"") -> Any:
+    """A 16-byte blake2b hasher; hashlib is imported on first use, not at startup."""
+    import hashlib
+
+    return hashlib.blake2b(data, digest_size=16)
+
+
+def _str_key(item: Any) -> str:
+    return str(item[0])
+
+
+def _hash_value(value: Any, update: Callable[[bytes], None]) -> None:
+    """Feed a canonical, type-tagged encoding of ``value`` into ``update``.
+
+    Dict keys are ordered by ``str(key)``, lists and tuples keep their order,
+    and set members are ordered by their own digest. Every item is length
+    prefixed so distinct structures cannot produce the same byte stream.
+    """
+    if isinstance(value, str):
+        encoded = value.encode("utf-8", "surrogatepass")
+        update(b"s%d:%b" % (len(encoded), encoded))
+    elif isinstance(value, dict):
+        update(b"d%d:" % len(value))
+        for key, val in sorted(value.items(), key=_str_key):
+            encoded = str(key).encode("utf-8", "surrogatepass")
+            update(b"s%d:%b" % (len(encoded), encoded))
+            _hash_value(val, update)
+    elif isinstance(value, (list, tuple)):
+        update(b"l%d:" % len(value))
+        for item in value:
+            _hash_value(item, update)
+    elif isinstance(value, (set, frozenset)):
+        digests = sorted(_digest(item) for item in value)
+        update(b"e%d:" % len(digests))
+        for item_digest in digests:
+            update(item_digest)
+    else:
+        encoded = repr(value).encode("utf-8", "surrogatepass")
+        update(b"%s%d:%b" % (type(value).__name__.encode(), len(encoded), encoded))
+
+
+def _digest(value: Any) -> bytes:
+    hasher = _blake2b()
+    _hash_value(value, hasher.update)
+    return hasher.digest()
+
+
+def canonical_hash(data: Any) -> str:
+    """Hash a parsed contract in a single pass without building copies.
+
+    Args:
+        data: Parsed YAML data (nested dicts, lists and scalars)
+
+    Returns:
+        Hex digest that is equal for structurally equal data
+    """
+    hasher = _blake2b()
+    _hash_value(data, hasher.update)
+    return hasher.hexdigest()
+
+
 @dataclass
 class CacheEntry:
     """A cached validation result."""
@@ -21,7 +81,7 @@ class CacheEntry:
 
 
 class ValidationCache:
-    """LRU cache for validation results."""
+    """LRU cache for validation results with per-entry TTL."""
 
     def __init__(
         self,
@@ -37,34 +97,36 @@ class ValidationCache:
         """
         self.max_size = max_size
         self.default_ttl = default_ttl
+        self.sweep_interval = min(default_ttl, CACHE_SWEEP_INTERVAL)
         self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
         self._lock = threading.Lock()
         self._metrics = get_metrics()
-
-    def _normalize_data(self, value: Any) -> Any:
-        if isinstance(value, dict):
-            return tuple(
-                (str(key), self._normalize_data(val))
-                for key, val in sorted(value.items(), key=lambda item: str(item[0]))
-            )
-        if isinstance(value, list):
-            return tuple(self._normalize_data(item) for item in value)
-        if isinstance(value, set):
-            return tuple(
-                sorted((self._normalize_data(item) for item in value), key=str)
-            )
-        if isinstance(value, tuple):
-            return tuple(self._normalize_data(item) for item in value)
-        return value
+        self._last_sweep = time.time()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
 
     def _compute_hash(self, data: Dict[str, Any]) -> str:
         """Compute hash of data for cache key."""
         try:
-            normalized = self._normalize_data(data)
-            content = repr(normalized)
-        except (TypeError, AttributeError):
-            content = str(data)
-        return hashlib.sha256(content.encode()).hexdigest()
+            return canonical_hash(data)
+        except (TypeError, AttributeError, ValueError, RecursionError):
+            return _blake2b(str(data).encode()).hexdigest()
+
+    def key_for_data(self, data: Dict[str, Any]) -> str:
+        """Compute the cache key for parsed data."""
+        return self._compute_hash(data)
+
+    def key_for_source(self, source: Union[str, bytes]) -> str:
+        """Compute a cache key from the raw text a contract was parsed from.
+
+        Cheaper than hashing the parsed structure when the caller already
+        holds the file contents.
+        """
+        if isinstance(source, str):
+            source = source.encode("utf-8", "surrogatepass")
+        return "raw:" + _blake2b(source).hexdigest()
 
     def get(
         self, data: Optional[Dict[str, Any]] = None, key: Optional[str] = None
@@ -82,21 +144,26 @@ class ValidationCache:
                 return None
             key = self._compute_hash(data)
 
+        now = time.time()
         with self._lock:
             entry = self._cache.get(key)
+            if entry is None:
+                self.misses += 1
+            elif now - entry.timestamp > entry.ttl:
+                del self._cache[key]
+                self.misses += 1
+                self.expirations += 1
+                self._metrics.record_cache_size(len(self._cache), self.max_size)
+                entry = None
+            else:
+                # Refresh recency so eviction is least-recently-used
+                self._cache.move_to_end(key)
+                self.hits += 1
 
         if entry is None:
             self._metrics.record_cache_miss()
             return None
 
-        # Check if expired
-        if time.time() - entry.timestamp > entry.ttl:
-            with self._lock:
-                self._cache.pop(key, None)
-                self._metrics.record_cache_size(len(self._cache), self.max_size)
-            self._metrics.record_cache_miss()
-            return None
-
         self._metrics.record_cache_hit()
         return entry.result
 
@@ -119,22 +186,81 @@ class ValidationCache:
                 return
             key = self._compute_hash(data)
 
+        now = time.time()
         with self._lock:
-            evicted = False
-            if len(self._cache) >= self.max_size:
-                evicted = True
-                # Remove oldest item (first inserted/updated)
-                self._cache.popitem(last=False)
+            if now - self._last_sweep >= self.sweep_interval:
+                self._purge_expired_locked(now)
+
+            evicted = 0
+            if key in self._cache:
+                self._cache.move_to_end(key)
+            else:
+                while self._cache and len(self._cache) >= self.max_size:
+                    # Remove least recently used item
+                    self._cache.popitem(last=False)
+                    evicted += 1
 
             self._cache[key] = CacheEntry(
-                result=result, timestamp=time.time(), ttl=ttl or self.default_ttl
+                result=result,
+                timestamp=now,
+                ttl=self.default_ttl if ttl is None else ttl,
             )
-            self._cache.move_to_end(key)
+            self.evictions += evicted
 
             self._metrics.record_cache_size(len(self._cache), self.max_size)
-            if evicted:
+            for _ in range(evicted):
                 self._metrics.record_cache_eviction()
 
+    def _purge_expired_locked(self, now: float) -> int:
+        expired = [
+            key
+            for key, entry in self._cache.items()
+            if now - entry.timestamp > entry.ttl
+        ]
+        for key in expired:
+            del self._cache[key]
+        self.expirations += len(expired)
+        self._last_sweep = now
+        return len(expired)
+
+    def purge_expired(self) -> int:
+        """Remove all expired entries.
+
+        Runs automatically from ``set()`` at most once per ``sweep_interval``
+        seconds, so expired entries do not linger until they are looked up.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            removed = self._purge_expired_locked(time.time())
+            self._metrics.record_cache_size(len(self._cache), self.max_size)
+            return removed
+
+    def configure(
+        self, max_size: Optional[int] = None, default_ttl: Optional[float] = None
+    ) -> None:
+        """Change cache limits in place, evicting LRU entries if shrinking.
+
+        Args:
+            max_size: New maximum number of entries
+            default_ttl: New default time-to-live in seconds
+        """
+        with self._lock:
+            if default_ttl is not None:
+                self.default_ttl = default_ttl
+                self.sweep_interval = min(default_ttl, CACHE_SWEEP_INTERVAL)
+            if max_size is not None:
+                self.max_size = max_size
+                evicted = 0
+                while len(self._cache) > max_size:
+                    self._cache.popitem(last=False)
+                    evicted += 1
+                self.evictions += evicted
+                for _ in range(evicted):
+                    self._metrics.record_cache_eviction()
+            self._metrics.record_cache_size(len(self._cache), self.max_size)
+
     def clear(self) -> None:
         """Clear all cached entries."""
         with self._lock:
@@ -145,27 +271,55 @@ class ValidationCache:
         """Get cache statistics.
 
         Returns:
-            Dictionary with 'size' and 'max_size' keys
+            Dictionary with 'size', 'max_size', 'hits', 'misses',
+            'evictions' and 'expirations' keys
         """
         with self._lock:
             return {
                 "size": len(self._cache),
                 "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
             }
 
 
-# Global cache instance
-_global_cache = ValidationCache()
+# Global cache instance, created on first use so runtime configuration
+# (see configure_cache) applies before any entries are stored.
+_global_cache: Optional[ValidationCache] = None
 _global_cache_lock = threading.Lock()
 
 
 def get_cache() -> ValidationCache:
     """Get the global validation cache."""
+    global _global_cache
     with _global_cache_lock:
+        if _global_cache is None:
+            _global_cache = ValidationCache()
         return _global_cache
 
 
+def configure_cache(
+    max_size: Optional[int] = None, default_ttl: Optional[float] = None
+) -> ValidationCache:
+    """Apply size/TTL settings (e.g. ``cache.size``/``cache.ttl``) to the
+    global cache.
+
+    Args:
+        max_size: Maximum number of entries
+        default_ttl: Default time-to-live in seconds
+
+    Returns:
+        The configured global cache
+    """
+    cache = get_cache()
+    cache.configure(max_size=max_size, default_ttl=default_ttl)
+    return cache
+
+
 def reset_cache() -> None:
     """Reset the global validation cache."""
     with _global_cache_lock:
-        _global_cache.clear()
+        if _global_cache is not None:
+            _global_cache.clear()
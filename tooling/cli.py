@@ -4,6 +4,7 @@ import argparse
 import json
 import logging
 import sys
+import textwrap
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -13,7 +14,7 @@ from .validators import (
     ValidationResult,
     set_production_mode,
 )
-from .cache import reset_cache
+from .cache import configure_cache, reset_cache
 from .logging_config import get_logger, ValidatorLogger
 from .monitoring import (
     get_metrics,
@@ -21,7 +22,15 @@ from .monitoring import (
     format_statsd_metrics,
 )
 from .config import load_config, Config
-from .constants import VERSION
+from .constants import (
+    VERSION,
+    DEFAULT_CACHE_MAX_SIZE,
+    DEFAULT_CACHE_TTL,
+    DEFAULT_DISK_CACHE_DIR,
+    DEFAULT_DISK_CACHE_MAX_ENTRIES,
+    WATCH_DEBOUNCE,
+    WATCH_POLL_INTERVAL,
+)
 
 
 class OutputFormatter:
@@ -65,8 +74,10 @@ class OutputFormatter:
         return "\n".join(lines)
 
     @staticmethod
-    def format_json(result: ValidationResult, filename: Optional[str] = None) -> str:
-        """Format results as JSON."""
+    def to_dict(
+        result: ValidationResult, filename: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Build the JSON-serializable form of a result."""
         output: Dict[str, Any] = {
             "valid": result.is_valid,
             "error_count": result.error_count,
@@ -98,7 +109,21 @@ class OutputFormatter:
                 for w in result.warnings
             ]
 
-        return json.dumps(output, indent=2)
+        return output
+
+    @staticmethod
+    def format_json(result: ValidationResult, filename: Optional[str] = None) -> str:
+        """Format results as JSON."""
+        return json.dumps(OutputFormatter.to_dict(result, filename), indent=2)
+
+    @staticmethod
+    def format_ndjson(
+        result: ValidationResult, filename: Optional[str] = None
+    ) -> str:
+        """Format results as a single-line JSON object."""
+        return json.dumps(
+            OutputFormatter.to_dict(result, filename), separators=(",", ":")
+        )
 
     @staticmethod
     def format_compact(result: ValidationResult, filename: Optional[str] = None) -> str:
@@ -145,6 +170,35 @@ def filter_files(files: List[str], config: Config) -> List[str]:
     return filtered
 
 
+def expand_file_patterns(patterns: List[str]) -> List[str]:
+    """Expand CLI file arguments into file paths.
+
+    Files are kept as given, directories contribute every ``*.md`` below
+    them, and anything else is treated as a glob within its parent.
+
+    Args:
+        patterns: File, directory or glob arguments
+
+    Returns:
+        List of file paths
+    """
+    files = []
+    for pattern in patterns:
+        path = Path(pattern)
+        if path.exists():
+            if path.is_file():
+                files.append(str(path))
+            elif path.is_dir():
+                files.extend(str(p) for p in path.glob("**/*.md"))
+        else:
+            # Try glob expansion
+            parent = Path(pattern).parent
+            glob_pattern = Path(pattern).name
+            if parent.exists():
+                files.extend(str(p) for p in parent.glob(glob_pattern))
+    return files
+
+
 def validate_files(
     files: List[str],
     output_format: str = "text",
@@ -154,18 +208,26 @@ def validate_files(
     log_level: int = logging.INFO,
     metrics_format: Optional[str] = None,
     logger: Optional[ValidatorLogger] = None,
+    executor: str = "thread",
+    workers: Optional[int] = None,
+    cache_dir: Optional[str] = None,
+    disk_cache_size: int = DEFAULT_DISK_CACHE_MAX_ENTRIES,
 ) -> int:
     """Validate multiple files and return exit code.
 
     Args:
         files: List of file paths to validate
-        output_format: Output format (text, json, compact)
+        output_format: Output format (text, json, compact, ndjson)
         no_cache: Disable caching
         parallel: Enable parallel validation
         production_mode: Enable production mode (sanitized errors)
         log_level: Logging level
         metrics_format: Optional metrics output format (prometheus, statsd)
         logger: Optional logger instance
+        executor: Batch executor type (thread, process)
+        workers: Optional number of batch workers
+        cache_dir: Optional directory for the persistent result cache
+        disk_cache_size: Maximum number of persistent cache entries
 
     Returns:
         Exit code (0 for success, 1 for failure)
@@ -178,36 +240,44 @@ def validate_files(
 
     metrics = get_metrics()
 
-    orchestrator = EmployeeValidationOrchestrator(
-        use_cache=not no_cache, parallel_validation=parallel
-    )
-
     all_valid = True
-    batch_results = orchestrator.validate_batch(files)
-
-    # Print results based on format
-    if output_format == "json":
-        # JSON format outputs all results as a JSON array
-        output = []
-        for filepath in files:
-            result = batch_results[filepath]
-            output.append(json.loads(OutputFormatter.format_json(result, filepath)))
-        print(json.dumps(output, indent=2))
-    else:
-        # Text or compact format
-        for filepath in files:
-            result = batch_results[filepath]
-
-            if output_format == "compact":
+    first = True
+
+    with EmployeeValidationOrchestrator(
+        use_cache=not no_cache,
+        parallel_validation=parallel,
+        executor=executor,
+        max_workers=workers,
+        cache_dir=cache_dir,
+        disk_cache_size=disk_cache_size,
+    ) as orchestrator:
+        # NDJSON lines go out in completion order; the other formats keep
+        # input order but are still printed as each result arrives.
+        results = orchestrator.iter_validate(
+            files, ordered=output_format != "ndjson"
+        )
+        for filepath, result in results:
+            if output_format == "ndjson":
+                print(OutputFormatter.format_ndjson(result, filepath), flush=True)
+            elif output_format == "json":
+                # Streamed element by element; identical to dumping the array
+                item = json.dumps(OutputFormatter.to_dict(result, filepath), indent=2)
+                print("[" if first else ",")
+                print(textwrap.indent(item, "  "), end="")
+            elif output_format == "compact":
                 print(OutputFormatter.format_compact(result, filepath))
             else:
                 print(OutputFormatter.format_text(result, filepath))
+            first = False
 
             if not result.is_valid:
                 all_valid = False
                 for error in result.errors:
                     metrics.record_error(error.field)
 
+    if output_format == "json":
+        print("[]" if first else "\n]")
+
     # Output metrics if requested
     if metrics_format:
         if metrics_format == "prometheus":
@@ -225,6 +295,59 @@ def validate_files(
     return 0 if all_valid else 1
 
 
+def watch_files(
+    directories: List[str],
+    config: Config,
+    interval: Optional[float] = None,
+    no_cache: bool = False,
+    parallel: bool = False,
+    production_mode: bool = False,
+    log_level: int = logging.INFO,
+    executor: str = "thread",
+    workers: Optional[int] = None,
+    cache_dir: Optional[str] = None,
+    disk_cache_size: int = DEFAULT_DISK_CACHE_MAX_ENTRIES,
+) -> int:
+    """Validate directories, then keep re-validating files as they change.
+
+    Args:
+        directories: Directories (or files) to watch
+        config: Configuration providing file filters and watch timings
+        interval: Seconds between change scans (default: watch.interval)
+
+    Returns:
+        Exit code (0 when stopped with Ctrl-C, 1 for a missing directory)
+    """
+    from .watch import WatchSession, run_watch
+
+    missing = [d for d in directories if not Path(d).exists()]
+    if missing:
+        print(f"Error: Cannot watch missing path: {missing[0]}", file=sys.stderr)
+        return 1
+
+    get_logger(level=log_level).set_level(log_level)
+    set_production_mode(production_mode)
+
+    with EmployeeValidationOrchestrator(
+        use_cache=not no_cache,
+        parallel_validation=parallel,
+        executor=executor,
+        max_workers=workers,
+        cache_dir=cache_dir,
+        disk_cache_size=disk_cache_size,
+    ) as orchestrator:
+        session = WatchSession(
+            directories,
+            orchestrator,
+            debounce=config.get("watch.debounce", WATCH_DEBOUNCE),
+            file_filter=lambda files: filter_files(files, config),
+        )
+        return run_watch(
+            session,
+            interval=interval or config.get("watch.interval", WATCH_POLL_INTERVAL),
+        )
+
+
 def create_parser() -> argparse.ArgumentParser:
     """Create argument parser for CLI."""
     parser = argparse.ArgumentParser(
@@ -236,11 +359,16 @@ Examples:
   %(prog)s employee.md                    Validate a single file
   %(prog)s examples/*.md                  Validate multiple files
   %(prog)s employee.md --format json       Output as JSON
+  %(prog)s agents/ --format ndjson        Stream one JSON line per file
   %(prog)s employee.md --no-cache         Disable caching
+  %(prog)s employee.md --cache-dir .cache  Keep the persistent result cache in .cache
   %(prog)s examples/*.md --format compact Compact output for multiple files
   %(prog)s employee.md --parallel          Enable parallel validation
+  %(prog)s examples/*.md --executor process --workers 8  Validate across 8 processes
   %(prog)s employee.md --production        Enable production mode (sanitized errors)
   %(prog)s employee.md --verbose           Enable verbose logging
+  %(prog)s --watch agents/                 Re-validate agents/ as files change
+  %(prog)s agents/ --changed-since origin/main  Validate only contracts changed vs main
   %(prog)s employee.md --metrics prometheus  Export metrics in Prometheus format
         """,
     )
@@ -252,9 +380,9 @@ Examples:
     parser.add_argument(
         "--format",
         "-f",
-        choices=["text", "json", "compact"],
+        choices=["text", "json", "compact", "ndjson"],
         default="text",
-        help="Output format (default: text)",
+        help="Output format; ndjson streams one JSON object per line (default: text)",
     )
 
     parser.add_argument(
@@ -265,10 +393,57 @@ Examples:
         "--clear-cache", action="store_true", help="Clear validation cache and exit"
     )
 
+    parser.add_argument(
+        "--cache-dir",
+        default=None,
+        help=f"Directory for the persistent result cache (default: {DEFAULT_DISK_CACHE_DIR})",
+    )
+
     parser.add_argument(
         "--parallel", action="store_true", help="Enable parallel validation execution"
     )
 
+    parser.add_argument(
+        "--executor",
+        choices=["thread", "process"],
+        default=None,
+        help="Batch executor: threads (with --parallel) or a process pool "
+        "(default: config 'executor', else thread)",
+    )
+
+    parser.add_argument(
+        "--workers",
+        "-j",
+        type=int,
+        default=None,
+        help="Number of batch workers (default: config 'workers', else CPU count "
+        "for processes)",
+    )
+
+    parser.add_argument(
+        "--changed-since",
+        metavar="REV",
+        default=None,
+        help="Only validate matching files changed since git revision REV "
+        "(defaults the file arguments to the config's file_filters.contract_patterns)",
+    )
+
+    parser.add_argument(
+        "--watch",
+        action="append",
+        metavar="DIR",
+        default=None,
+        help="Keep running and re-validate changed files under DIR (repeatable)",
+    )
+
+    parser.add_argument(
+        "--watch-interval",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help=f"Seconds between change scans in watch mode (default: {WATCH_POLL_INTERVAL})",
+    )
+
     parser.add_argument(
         "--production",
         action="store_true",
@@ -302,23 +477,55 @@ def main() -> int:
     parser = create_parser()
     args = parser.parse_args()
 
+    # Load configuration file if specified
+    config_file = getattr(args, "config", None)
+    config = load_config(config_file=config_file)
+    cache_dir = args.cache_dir or config.get("cache.dir", DEFAULT_DISK_CACHE_DIR)
+
     # Handle cache clearing (before checking for files)
     if args.clear_cache:
+        from .disk_cache import clear_disk_cache
+
         reset_cache()
+        clear_disk_cache(cache_dir)
         print("Cache cleared.")
         return 0
 
     # Check for files argument
-    if not hasattr(args, "files") or not args.files:
+    if args.changed_since and not args.files:
+        # Not ".": a changed README.md or docs/*.md is not a contract
+        args.files = list(config.get("file_filters.contract_patterns", []))
+
+    if not args.watch and (not hasattr(args, "files") or not args.files):
         print(
             "Error: No files specified. Use --help for usage information.",
             file=sys.stderr,
         )
         return 1
 
-    # Load configuration file if specified
-    config_file = getattr(args, "config", None)
-    config = load_config(config_file=config_file)
+    # CLI args override config (file, then EMPLOYEE_MD_* env vars)
+    executor = args.executor or config.get("executor", "thread")
+    workers = args.workers if args.workers is not None else config.get("workers")
+
+    if executor not in ("thread", "process"):
+        print(
+            f"Error: executor must be 'thread' or 'process', got {executor!r}",
+            file=sys.stderr,
+        )
+        return 1
+
+    if workers is not None and (not isinstance(workers, int) or workers < 1):
+        print("Error: --workers must be at least 1", file=sys.stderr)
+        return 1
+
+    if args.watch_interval is not None and args.watch_interval <= 0:
+        print("Error: --watch-interval must be positive", file=sys.stderr)
+        return 1
+
+    configure_cache(
+        max_size=config.get("cache.size", DEFAULT_CACHE_MAX_SIZE),
+        default_ttl=config.get("cache.ttl", DEFAULT_CACHE_TTL),
+    )
 
     # Determine log level (CLI args override config)
     if args.verbose:
@@ -328,37 +535,58 @@ def main() -> int:
     else:
         log_level = getattr(logging, config.get("logging.level", "INFO"), logging.INFO)
 
-    # Expand glob patterns
-    files = []
-    for pattern in args.files:
-        path = Path(pattern)
-        if path.exists():
-            if path.is_file():
-                files.append(str(path))
-            elif path.is_dir():
-                files.extend(str(p) for p in path.glob("**/*.md"))
-        else:
-            # Try glob expansion
-            parent = Path(pattern).parent
-            glob_pattern = Path(pattern).name
-            if parent.exists():
-                files.extend(str(p) for p in parent.glob(glob_pattern))
+    if args.watch:
+        return watch_files(
+            directories=args.watch,
+            config=config,
+            interval=args.watch_interval,
+            no_cache=args.no_cache or not config.get("cache.enabled", True),
+            parallel=args.parallel,
+            production_mode=args.production,
+            log_level=log_level,
+            executor=executor,
+            workers=workers,
+            cache_dir=cache_dir if config.get("cache.persistent", True) else None,
+            disk_cache_size=config.get(
+                "cache.persistent_size", DEFAULT_DISK_CACHE_MAX_ENTRIES
+            ),
+        )
+
+    if args.changed_since:
+        from .git_changes import GitChangesError, changed_files_since, select_changed
+
+        # Match git's changed set against the arguments instead of walking
+        # the tree, so unchanged contracts are never even listed
+        try:
+            changed = changed_files_since(args.changed_since)
+        except GitChangesError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+        files = select_changed(args.files, changed)
+    else:
+        files = expand_file_patterns(args.files)
 
     # Apply file filters from configuration
     files = filter_files(files, config)
 
-    if not files:
+    if not files and not args.changed_since:
         print("Error: No files found to validate", file=sys.stderr)
         return 1
 
     return validate_files(
         files=files,
         output_format=args.format,
-        no_cache=args.no_cache,
+        no_cache=args.no_cache or not config.get("cache.enabled", True),
         parallel=args.parallel,
         production_mode=args.production,
         log_level=log_level,
         metrics_format=args.metrics,
+        executor=executor,
+        workers=workers,
+        cache_dir=cache_dir if config.get("cache.persistent", True) else None,
+        disk_cache_size=config.get(
+            "cache.persistent_size", DEFAULT_DISK_CACHE_MAX_ENTRIES
+        ),
     )
 
 
@@ -403,6 +631,12 @@ Examples:
         "--clear-cache", action="store_true", help="Clear validation cache and exit"
     )
 
+    parser.add_argument(
+        "--cache-dir",
+        default=config.get("cache.dir", DEFAULT_DISK_CACHE_DIR),
+        help="Directory for the persistent result cache",
+    )
+
     parser.add_argument(
         "--parallel",
         action="store_true",
@@ -410,6 +644,21 @@ Examples:
         help="Enable parallel validation execution",
     )
 
+    parser.add_argument(
+        "--executor",
+        choices=["thread", "process"],
+        default=config.get("executor", "thread"),
+        help="Batch executor: threads (with --parallel) or a process pool",
+    )
+
+    parser.add_argument(
+        "--workers",
+        "-j",
+        type=int,
+        default=config.get("workers", None),
+        help="Number of batch workers (default: CPU count for processes)",
+    )
+
     parser.add_argument(
         "--production",
         action="store_true",
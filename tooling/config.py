@@ -34,14 +34,26 @@ class Config:
         """Load default configuration values."""
         self._config = {
             "parallel": False,
+            "executor": "thread",
+            "workers": None,
             "production": False,
             "verbose": False,
             "quiet": False,
-            "cache": {"enabled": True, "size": 100, "ttl": 300},
+            "cache": {
+                "enabled": True,
+                "size": 100,
+                "ttl": 300,
+                "persistent": True,
+                "persistent_size": 10000,
+                "dir": ".employee-md-cache",
+            },
+            "watch": {"interval": 1.0, "debounce": 0.3},
             "logging": {"level": "INFO", "format": "text"},
             "metrics": {"enabled": False, "format": "prometheus"},
             "allowed_directories": [],
             "file_filters": {
+                # What `--changed-since` validates when given no paths
+                "contract_patterns": ["employee.md", "examples/*.md"],
                 "exclude_patterns": [
                     {
                         "directory": "examples",
@@ -143,6 +155,8 @@ class Config:
         """Load configuration from environment variables."""
         env_mappings: Dict[str, Union[str, Tuple[str, str]]] = {
             f"{self.env_prefix}PARALLEL": "parallel",
+            f"{self.env_prefix}EXECUTOR": "executor",
+            f"{self.env_prefix}WORKERS": "workers",
             f"{self.env_prefix}PRODUCTION": "production",
             f"{self.env_prefix}VERBOSE": "verbose",
             f"{self.env_prefix}QUIET": "quiet",
@@ -151,6 +165,10 @@ class Config:
             f"{self.env_prefix}CACHE_ENABLED": ("cache", "enabled"),
             f"{self.env_prefix}CACHE_SIZE": ("cache", "size"),
             f"{self.env_prefix}CACHE_TTL": ("cache", "ttl"),
+            f"{self.env_prefix}CACHE_DIR": ("cache", "dir"),
+            f"{self.env_prefix}CACHE_PERSISTENT": ("cache", "persistent"),
+            f"{self.env_prefix}WATCH_INTERVAL": ("watch", "interval"),
+            f"{self.env_prefix}WATCH_DEBOUNCE": ("watch", "debounce"),
             f"{self.env_prefix}METRICS_ENABLED": ("metrics", "enabled"),
             f"{self.env_prefix}METRICS_FORMAT": ("metrics", "format"),
         }
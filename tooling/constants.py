@@ -199,18 +199,43 @@ MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
 
 DEFAULT_CACHE_MAX_SIZE = 100
 DEFAULT_CACHE_TTL = 300  # 5 minutes in seconds
+# Upper bound on seconds between amortized sweeps of expired cache entries
+CACHE_SWEEP_INTERVAL = 60
+
+# Persistent (on-disk) result cache
+DEFAULT_DISK_CACHE_DIR = ".employee-md-cache"
+DEFAULT_DISK_CACHE_MAX_ENTRIES = 10000
 
 # LRU cache sizes for utility functions
 ISO_DATE_CACHE_SIZE = 1024
 URL_CACHE_SIZE = 1024
 EMAIL_CACHE_SIZE = 1024
 
+# Per-directory parsers kept by a validation orchestrator
+PARSER_CACHE_SIZE = 1024
+
 # LRU cache size for ThreadPoolExecutor
 DEFAULT_MAX_WORKERS = 5
 
 # Parallel processing limits
 MAX_PARALLEL_WORKERS = 10
 
+# Batch executor types for EmployeeValidationOrchestrator.validate_batch
+EXECUTOR_TYPES = frozenset({"thread", "process"})
+
+# Work chunks handed to each process-pool worker (higher = better balancing,
+# lower = less IPC overhead)
+PROCESS_CHUNKS_PER_WORKER = 4
+
+# Files in flight per thread worker while streaming results from
+# EmployeeValidationOrchestrator.iter_validate
+STREAM_WINDOW_PER_WORKER = 4
+
+# Watch mode: seconds between stat scans, and seconds a change must settle
+# before the changed files are re-validated
+WATCH_POLL_INTERVAL = 1.0
+WATCH_DEBOUNCE = 0.3
+
 # ThreadPoolExecutor timeout in seconds
 DEFAULT_TIMEOUT = 30
 
@@ -219,3 +244,12 @@ REGRESSION_THRESHOLD = 50.0
 REGRESSION_THRESHOLD_PER_FILE = 30.0
 REGRESSION_THRESHOLD_PER_VALIDATION = 1.0
 REGRESSION_THRESHOLD_THROUGHPUT = 50.0
+
+# Validation API latency targets in milliseconds (tests/performance/load_test_api.py)
+API_LATENCY_TARGET_P50 = 5.0
+API_LATENCY_TARGET_P99 = 25.0
+
+# Startup budgets in milliseconds: cumulative `python -X importtime` figure
+# for the module (tests/performance/regression.py)
+STARTUP_BUDGET_PACKAGE = 40.0  # `import tooling` / `import runtime`
+STARTUP_BUDGET_CLI = 100.0  # `import tooling.cli`
@@ -0,0 +1,271 @@
+"""Persistent on-disk cache for validation results.
+
+Results are stored in a SQLite database (``.employee-md-cache/`` by default)
+keyed by the SHA-256 of the file contents, so unchanged contracts are not
+re-parsed or re-validated across CLI runs. Every entry is tagged with a
+fingerprint of the validator version, rules and schema; entries written by
+a different validator are discarded when the cache is opened.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from .constants import (
+    DEFAULT_DISK_CACHE_DIR,
+    DEFAULT_DISK_CACHE_MAX_ENTRIES,
+    VERSION,
+)
+from .validators import ValidationError, ValidationResult
+
+logger = logging.getLogger(__name__)
+
+_DB_FILENAME = "results.sqlite3"
+_PACKAGE_DIR = Path(__file__).resolve().parent
+
+_fingerprint: Optional[str] = None
+_fingerprint_lock = threading.Lock()
+
+
+def validator_fingerprint() -> str:
+    """Return a hash identifying the validator version, rules and schema.
+
+    Covers ``VERSION``, ``schema.json`` and the source of the modules that
+    define ``VALIDATION_RULES`` and the validators, so any change to what a
+    validation run would produce invalidates previously cached results.
+    """
+    global _fingerprint
+    with _fingerprint_lock:
+        if _fingerprint is None:
+            digest = hashlib.sha256(VERSION.encode())
+            sources = [
+                _PACKAGE_DIR / "schema.json",
+                _PACKAGE_DIR / "constants.py",
+                _PACKAGE_DIR / "utils.py",
+            ]
+            sources.extend(sorted((_PACKAGE_DIR / "validators").glob("*.py")))
+            for source in sources:
+                digest.update(source.name.encode())
+                try:
+                    digest.update(source.read_bytes())
+                except OSError:
+                    continue
+            _fingerprint = digest.hexdigest()
+        return _fingerprint
+
+
+def content_hash(content: bytes) -> str:
+    """Hash raw file contents for use as a disk cache key."""
+    return hashlib.sha256(content).hexdigest()
+
+
+def clear_disk_cache(cache_dir: Union[str, Path] = DEFAULT_DISK_CACHE_DIR) -> bool:
+    """Delete the cache database in ``cache_dir`` without opening it.
+
+    Only files owned by the cache are removed; the directory itself is
+    removed only if nothing else is left in it.
+
+    Returns:
+        True if any cache file was removed
+    """
+    directory = Path(cache_dir)
+    removed = False
+    for suffix in ("", "-wal", "-shm"):
+        try:
+            (directory / f"{_DB_FILENAME}{suffix}").unlink()
+            removed = True
+        except FileNotFoundError:
+            continue
+    try:
+        directory.rmdir()
+    except OSError:
+        pass
+    return removed
+
+
+def _errors_to_json(errors: List[ValidationError]) -> List[List[Any]]:
+    return [[e.field, e.message, e.severity, e.line_number, e.suggestion] for e in errors]
+
+
+def _errors_from_json(records: List[List[Any]]) -> List[ValidationError]:
+    return [
+        ValidationError(
+            field=field,
+            message=message,
+            severity=severity,
+            line_number=line_number,
+            suggestion=suggestion,
+        )
+        for field, message, severity, line_number, suggestion in records
+    ]
+
+
+class DiskValidationCache:
+    """Size-bounded SQLite store of validation results keyed by content hash.
+
+    Entries are evicted least-recently-used first once ``max_entries`` is
+    exceeded. Storage errors are logged and treated as cache misses so a
+    broken or read-only cache directory never fails a validation run.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Union[str, Path] = DEFAULT_DISK_CACHE_DIR,
+        max_entries: int = DEFAULT_DISK_CACHE_MAX_ENTRIES,
+    ) -> None:
+        """
+        Initialize disk cache.
+
+        Args:
+            cache_dir: Directory holding the cache database
+            max_entries: Maximum number of cached results
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_entries = max_entries
+        self.fingerprint = validator_fingerprint()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._disabled = False
+        self._lock = threading.Lock()
+
+    @property
+    def path(self) -> Path:
+        """Path of the SQLite database file."""
+        return self.cache_dir / _DB_FILENAME
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        if self._conn is not None or self._disabled:
+            return self._conn
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), timeout=10.0, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                " key TEXT PRIMARY KEY,"
+                " fingerprint TEXT NOT NULL,"
+                " result TEXT NOT NULL,"
+                " accessed_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS results_accessed_at ON results (accessed_at)")
+            # Results from another validator version can never be hit again.
+            conn.execute("DELETE FROM results WHERE fingerprint != ?", (self.fingerprint,))
+            conn.commit()
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Disabling disk cache at {self.cache_dir}: {e}")
+            self._disabled = True
+            return None
+        self._conn = conn
+        return conn
+
+    def get(self, key: str) -> Optional[ValidationResult]:
+        """Get a cached result by content hash.
+
+        Args:
+            key: Content hash of the validated file
+
+        Returns:
+            Cached ValidationResult if found, None otherwise
+        """
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return None
+            try:
+                row = conn.execute(
+                    "SELECT result FROM results WHERE key = ? AND fingerprint = ?",
+                    (key, self.fingerprint),
+                ).fetchone()
+                if row is None:
+                    return None
+                conn.execute(
+                    "UPDATE results SET accessed_at = ? WHERE key = ?",
+                    (time.time(), key),
+                )
+                conn.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"Disk cache read failed: {e}")
+                return None
+
+        payload = json.loads(row[0])
+        return ValidationResult(
+            is_valid=payload["is_valid"],
+            errors=_errors_from_json(payload["errors"]),
+            warnings=_errors_from_json(payload["warnings"]),
+        )
+
+    def set(self, key: str, result: ValidationResult) -> None:
+        """Store a validation result, evicting the oldest entries if full.
+
+        Args:
+            key: Content hash of the validated file
+            result: The validation result to cache
+        """
+        payload = json.dumps(
+            {
+                "is_valid": result.is_valid,
+                "errors": _errors_to_json(result.errors),
+                "warnings": _errors_to_json(result.warnings),
+            }
+        )
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO results"
+                    " (key, fingerprint, result, accessed_at) VALUES (?, ?, ?, ?)",
+                    (key, self.fingerprint, payload, time.time()),
+                )
+                (count,) = conn.execute("SELECT COUNT(*) FROM results").fetchone()
+                if count > self.max_entries:
+                    conn.execute(
+                        "DELETE FROM results WHERE key IN ("
+                        " SELECT key FROM results ORDER BY accessed_at LIMIT ?)",
+                        (count - self.max_entries,),
+                    )
+                conn.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"Disk cache write failed: {e}")
+
+    def clear(self) -> None:
+        """Remove every cached result."""
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+            try:
+                conn.execute("DELETE FROM results")
+                conn.commit()
+                conn.execute("VACUUM")
+            except sqlite3.Error as e:
+                logger.warning(f"Disk cache clear failed: {e}")
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary with 'size' and 'max_size' keys
+        """
+        with self._lock:
+            conn = self._connect()
+            size = 0
+            if conn is not None:
+                try:
+                    (size,) = conn.execute("SELECT COUNT(*) FROM results").fetchone()
+                except sqlite3.Error:
+                    size = 0
+            return {"size": size, "max_size": self.max_entries}
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
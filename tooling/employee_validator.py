@@ -1,13 +1,15 @@
 """Main employee.md validator orchestrator."""
 
+import os
+import threading
 import time
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Tuple
-from concurrent.futures import TimeoutError
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 from .validators import (
     ValidationResult,
     ValidationError,
+    CompiledValidator,
     RequiredFieldValidator,
     TypeValidator,
     EnumValidator,
@@ -15,19 +17,136 @@ from .validators import (
     RangeValidator,
 )
 from .parser import SecureYAMLParser, YAMLErrorContext
-from .cache import get_cache
+from .cache import ValidationCache, get_cache
 from .monitoring import get_metrics
-from .constants import MAX_PARALLEL_WORKERS, DEFAULT_TIMEOUT
+from .constants import (
+    MAX_PARALLEL_WORKERS,
+    DEFAULT_TIMEOUT,
+    DEFAULT_DISK_CACHE_MAX_ENTRIES,
+    EXECUTOR_TYPES,
+    PARSER_CACHE_SIZE,
+    PROCESS_CHUNKS_PER_WORKER,
+    STREAM_WINDOW_PER_WORKER,
+)
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor, Future
+
+    from .disk_cache import DiskValidationCache
+
+# Compact, picklable form of a ValidationError / ValidationResult used to
+# stream results back from process-pool workers without shipping dataclasses.
+_ErrorRecord = Tuple[str, str, str, Optional[int], Optional[str]]
+_ResultRecord = Tuple[str, bool, Tuple[_ErrorRecord, ...], Tuple[_ErrorRecord, ...], float]
+
+# Per-worker orchestrator, built once by the pool initializer so parser and
+# validator setup is paid once per process rather than once per file.
+_worker_orchestrator: Optional["EmployeeValidationOrchestrator"] = None
+
+
+def _error_to_record(error: ValidationError) -> _ErrorRecord:
+    return (
+        error.field,
+        error.message,
+        error.severity,
+        error.line_number,
+        error.suggestion,
+    )
+
+
+def _record_to_error(record: _ErrorRecord) -> ValidationError:
+    field, message, severity, line_number, suggestion = record
+    return ValidationError(
+        field=field,
+        message=message,
+        severity=severity,
+        line_number=line_number,
+        suggestion=suggestion,
+    )
+
+
+def _init_process_worker(production_mode: bool) -> None:
+    """Process-pool initializer: build the worker's warm orchestrator."""
+    global _worker_orchestrator
+    from .validators import set_production_mode
+
+    set_production_mode(production_mode)
+    _worker_orchestrator = EmployeeValidationOrchestrator(use_cache=False)
+
+
+def _validate_chunk(filepaths: List[str]) -> List[_ResultRecord]:
+    """Validate a chunk of files inside a process-pool worker."""
+    orchestrator = _worker_orchestrator
+    if orchestrator is None:
+        orchestrator = EmployeeValidationOrchestrator(use_cache=False)
+
+    records: List[_ResultRecord] = []
+    for filepath in filepaths:
+        start = time.perf_counter()
+        try:
+            result = orchestrator.validate_file(filepath, False)
+        except Exception as e:
+            result = ValidationResult(
+                is_valid=False,
+                errors=[
+                    ValidationError(
+                        field="file",
+                        message=f"Failed to validate {filepath}: {e}",
+                        severity="error",
+                    )
+                ],
+            )
+        records.append(
+            (
+                filepath,
+                result.is_valid,
+                tuple(_error_to_record(e) for e in result.errors),
+                tuple(_error_to_record(w) for w in result.warnings),
+                time.perf_counter() - start,
+            )
+        )
+    return records
+
+
+def _reorder(
+    indexed: Iterable[Tuple[int, str, ValidationResult]],
+) -> Iterator[Tuple[str, ValidationResult]]:
+    """Yield indexed results in index order, holding back early arrivals."""
+    early: Dict[int, Tuple[str, ValidationResult]] = {}
+    next_index = 0
+    for index, filepath, result in indexed:
+        early[index] = (filepath, result)
+        while next_index in early:
+            yield early.pop(next_index)
+            next_index += 1
+
+
+def _failed_result(message: str) -> ValidationResult:
+    return ValidationResult(
+        is_valid=False,
+        errors=[ValidationError(field="file", message=message, severity="error")],
+    )
 
 
 class EmployeeValidationOrchestrator:
-    """Orchestrates all validation steps for employee.md files."""
+    """Orchestrates all validation steps for employee.md files.
+
+    Validators, per-directory parsers and the thread pool are created once
+    and reused for every file, so an orchestrator should be kept around for
+    a whole run rather than built per file. Call ``close()`` (or use it as a
+    context manager) to shut the thread pool down.
+    """
 
     def __init__(
         self,
         use_cache: bool = True,
         parallel_validation: bool = False,
         enable_cache: Optional[bool] = None,
+        executor: str = "thread",
+        max_workers: Optional[int] = None,
+        cache_dir: Optional[Union[str, Path]] = None,
+        disk_cache_size: int = DEFAULT_DISK_CACHE_MAX_ENTRIES,
+        cache: Optional[ValidationCache] = None,
     ):
         """
         Initialize validator orchestrator.
@@ -35,20 +154,53 @@ class EmployeeValidationOrchestrator:
         Args:
             use_cache: Enable caching of validation results
             parallel_validation: Enable parallel execution of validators
+            executor: Batch executor type, "thread" or "process". The process
+                executor always fans out batches across worker processes.
+            max_workers: Number of batch workers (defaults to
+                MAX_PARALLEL_WORKERS for threads, CPU count for processes)
+            cache_dir: Directory for the persistent result cache keyed by
+                file content hash (disabled when None or use_cache is False)
+            disk_cache_size: Maximum number of persistent cache entries
+            cache: In-memory result cache to use instead of the shared one
+                from get_cache() (ignored when use_cache is False)
         """
         if enable_cache is not None:
             use_cache = enable_cache
+        if executor not in EXECUTOR_TYPES:
+            raise ValueError(
+                f"Invalid executor: {executor}. Must be one of: {sorted(EXECUTOR_TYPES)}"
+            )
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
         self.use_cache = use_cache
         self.parallel_validation = parallel_validation
+        self.executor = executor
+        self.max_workers = max_workers
         self.parser = SecureYAMLParser()
-        self._validator_factories: List[Callable[[], Any]] = [
-            RequiredFieldValidator,
-            EnumValidator,
-            TypeValidator,
-            FormatValidator,
-            RangeValidator,
+        # Validators are stateless, so one set serves every file and thread
+        self._validators: List[Any] = [
+            RequiredFieldValidator(),
+            EnumValidator(),
+            TypeValidator(),
+            FormatValidator(),
+            RangeValidator(),
         ]
-        self._cache = get_cache() if use_cache else None
+        # Single-pass equivalent of running _validators in order
+        self._compiled_validator = CompiledValidator()
+        self._parsers: Dict[str, SecureYAMLParser] = {}
+        self._executor: Optional[Executor] = None
+        self._executor_lock = threading.Lock()
+        self._cache: Optional[ValidationCache] = None
+        if use_cache:
+            self._cache = cache if cache is not None else get_cache()
+        self._disk_cache: Optional[DiskValidationCache] = None
+        if use_cache and cache_dir is not None:
+            # Imported here: sqlite3 and hashlib are only needed with a disk cache.
+            from . import disk_cache
+
+            self._disk_cache = disk_cache.DiskValidationCache(
+                cache_dir, max_entries=disk_cache_size
+            )
         self._metrics = get_metrics()
 
     def validate_file(
@@ -76,27 +228,77 @@ class EmployeeValidationOrchestrator:
                 if cached is not None:
                     self._metrics.record_validation_end(start_time, cached.is_valid)
                     return cached
+        disk_key = None
         try:
-            # Create a parser that explicitly allows the file's directory
-            file_dir = Path(filepath).resolve().parent
-            parser = SecureYAMLParser(allowed_directories=[str(file_dir)])
-            data, _ = parser.parse_file(filepath)
+            parser = self._get_parser(filepath)
+            raw = parser.read_file(filepath)
+            if self._disk_cache:
+                from .disk_cache import content_hash
+
+                disk_key = content_hash(raw)
+                cached = self._disk_cache.get(disk_key)
+                if cached is not None:
+                    if self._cache and cache_key:
+                        self._cache.set(None, cached, key=cache_key)
+                    self._metrics.record_validation_end(start_time, cached.is_valid)
+                    return cached
+            data, _ = parser.parse_bytes(raw, name=filepath)
         except YAMLErrorContext as e:
-            error = ValidationError(
-                field="file",
-                message=str(e),
-                line_number=e.line_number,
-                severity="error",
-            )
             self._metrics.record_validation_end(start_time, False)
-            return ValidationResult(is_valid=False, errors=[error], warnings=[])
+            return self._parse_error_result(e)
 
-        result = self.validate_data(data, run_parallel_validators=effective_parallel)
-        if self._cache and cache_key:
-            self._cache.set(None, result, key=cache_key)
+        result = self.validate_data(
+            data, run_parallel_validators=effective_parallel, source=raw
+        )
+        self._store_file_cache(result, cache_key, disk_key)
         self._metrics.record_validation_end(start_time, result.is_valid)
         return result
 
+    def load_file(
+        self, filepath: str
+    ) -> Tuple[Optional[Dict[str, Any]], ValidationResult]:
+        """Read, parse and validate a file once, keeping the parsed data.
+
+        For callers that need the contract itself, not just a verdict: the
+        file is read once, parsed once with the hardened parser and the
+        validators run on that tree. The file-level result caches are not
+        consulted, since a cached verdict cannot supply the data.
+
+        Args:
+            filepath: Path to YAML file
+
+        Returns:
+            Tuple of (parsed data or None if the file could not be read or
+            parsed, ValidationResult)
+        """
+        start_time = self._metrics.record_validation_start()
+        try:
+            parser = self._get_parser(filepath)
+            raw = parser.read_file(filepath)
+            data, _ = parser.parse_bytes(raw, name=filepath)
+        except YAMLErrorContext as e:
+            self._metrics.record_validation_end(start_time, False)
+            return None, self._parse_error_result(e)
+
+        result = self.validate_data(data, source=raw)
+        self._metrics.record_validation_end(start_time, result.is_valid)
+        return data, result
+
+    @staticmethod
+    def _parse_error_result(error: YAMLErrorContext) -> ValidationResult:
+        return ValidationResult(
+            is_valid=False,
+            errors=[
+                ValidationError(
+                    field="file",
+                    message=str(error),
+                    line_number=error.line_number,
+                    severity="error",
+                )
+            ],
+            warnings=[],
+        )
+
     def _get_file_cache_key(self, filepath: str) -> Optional[str]:
         try:
             resolved_path = Path(filepath).absolute()
@@ -105,26 +307,173 @@ class EmployeeValidationOrchestrator:
             return None
         return f"file:{resolved_path}:{stat_info.st_mtime_ns}:{stat_info.st_size}"
 
-    def _create_validators(self) -> List[Any]:
-        return [factory() for factory in self._validator_factories]
+    def _get_disk_cache_key(self, filepath: str) -> Optional[str]:
+        from .disk_cache import content_hash
+
+        try:
+            with open(filepath, "rb") as f:
+                return content_hash(f.read())
+        except OSError:
+            return None
+
+    def _lookup_file_cache(
+        self, filepath: str
+    ) -> Tuple[Optional[ValidationResult], Optional[str], Optional[str]]:
+        """Look a file up in the in-memory cache, then the disk cache.
+
+        Returns:
+            Tuple of (cached_result, memory_cache_key, disk_cache_key)
+        """
+        cache_key = None
+        if self._cache:
+            cache_key = self._get_file_cache_key(filepath)
+            if cache_key:
+                cached = self._cache.get(key=cache_key)
+                if cached is not None:
+                    return cached, cache_key, None
+
+        disk_key = None
+        if self._disk_cache:
+            disk_key = self._get_disk_cache_key(filepath)
+            if disk_key:
+                cached = self._disk_cache.get(disk_key)
+                if cached is not None:
+                    if self._cache and cache_key:
+                        self._cache.set(None, cached, key=cache_key)
+                    return cached, cache_key, disk_key
+
+        return None, cache_key, disk_key
+
+    def _store_file_cache(
+        self,
+        result: ValidationResult,
+        cache_key: Optional[str],
+        disk_key: Optional[str],
+    ) -> None:
+        if self._cache and cache_key:
+            self._cache.set(None, result, key=cache_key)
+        if self._disk_cache and disk_key:
+            self._disk_cache.set(disk_key, result)
+
+    def clear_cache(self) -> None:
+        """Clear this orchestrator's in-memory and persistent caches."""
+        if self._cache:
+            self._cache.clear()
+        if self._disk_cache:
+            self._disk_cache.clear()
+
+    def _get_parser(self, filepath: str) -> SecureYAMLParser:
+        """Return the parser that explicitly allows the file's directory."""
+        file_dir = str(Path(filepath).resolve().parent)
+        parser = self._parsers.get(file_dir)
+        if parser is None:
+            if len(self._parsers) >= PARSER_CACHE_SIZE:
+                self._parsers.clear()
+            parser = SecureYAMLParser(allowed_directories=[file_dir])
+            self._parsers[file_dir] = parser
+        return parser
+
+    def _get_executor(self) -> "Executor":
+        """Return the orchestrator's thread pool, creating it on first use.
+
+        Shared by batch validation and parallel validators. Batch tasks run
+        their validators sequentially, so work submitted to the pool never
+        waits on other work in the same pool.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=max(
+                        self.max_workers or MAX_PARALLEL_WORKERS,
+                        len(self._validators),
+                    ),
+                    thread_name_prefix="employee-md",
+                )
+            return self._executor
+
+    def close(self) -> None:
+        """Shut down the shared thread pool."""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+    def __enter__(self) -> "EmployeeValidationOrchestrator":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
 
     def validate_data(
-        self, data: Dict[str, Any], run_parallel_validators: Optional[bool] = None
+        self,
+        data: Dict[str, Any],
+        run_parallel_validators: Optional[bool] = None,
+        source: Optional[Union[str, bytes]] = None,
     ) -> ValidationResult:
         """Validate parsed employee.md data.
 
         Args:
             data: Parsed YAML data as dictionary
+            source: Optional raw text ``data`` was parsed from; when given it
+                is hashed for the cache key instead of walking ``data``
 
         Returns:
             ValidationResult with errors and warnings
         """
         # Check cache
+        cache_key = None
         if self._cache:
-            cached = self._cache.get(data)
+            if source is not None:
+                cache_key = self._cache.key_for_source(source)
+            else:
+                cache_key = self._cache.key_for_data(data)
+            cached = self._cache.get(key=cache_key)
             if cached is not None:
                 return cached
 
+        return self._validate_uncached(data, run_parallel_validators, cache_key)
+
+    def validate_content(self, content: Union[str, bytes]) -> ValidationResult:
+        """Validate raw employee.md content, e.g. a request body.
+
+        The result cache is keyed by a hash of ``content``, so content seen
+        before is answered without parsing it again.
+
+        Args:
+            content: YAML text, or UTF-8 encoded bytes
+
+        Returns:
+            ValidationResult with errors and warnings
+        """
+        start_time = self._metrics.record_validation_start()
+        cache_key = None
+        if self._cache:
+            cache_key = self._cache.key_for_source(content)
+            cached = self._cache.get(key=cache_key)
+            if cached is not None:
+                self._metrics.record_validation_end(start_time, cached.is_valid)
+                return cached
+        try:
+            if isinstance(content, bytes):
+                data, _ = self.parser.parse_bytes(content)
+            else:
+                data, _ = self.parser.parse_string(content)
+        except YAMLErrorContext as e:
+            self._metrics.record_validation_end(start_time, False)
+            return self._parse_error_result(e)
+
+        result = self._validate_uncached(data, None, cache_key)
+        self._metrics.record_validation_end(start_time, result.is_valid)
+        return result
+
+    def _validate_uncached(
+        self,
+        data: Dict[str, Any],
+        run_parallel_validators: Optional[bool],
+        cache_key: Optional[str],
+    ) -> ValidationResult:
         all_errors: List[ValidationError] = []
         all_warnings: List[ValidationError] = []
 
@@ -146,14 +495,14 @@ class EmployeeValidationOrchestrator:
 
         # Cache result
         if self._cache:
-            self._cache.set(data, final_result)
+            self._cache.set(None, final_result, key=cache_key)
 
         return final_result
 
     def _run_validators_sequential(
         self, data: Dict[str, Any]
     ) -> Tuple[List[ValidationError], List[ValidationError]]:
-        """Run all validators sequentially.
+        """Run all validators sequentially as one compiled pass.
 
         Args:
             data: Parsed YAML data
@@ -161,19 +510,13 @@ class EmployeeValidationOrchestrator:
         Returns:
             Tuple of (errors, warnings)
         """
-        all_errors: List[ValidationError] = []
-        all_warnings: List[ValidationError] = []
-
-        for validator in self._create_validators():
-            validator_start = time.perf_counter()
-            result = validator.validate(data)
-            self._metrics.record_validator_time(
-                validator.__class__.__name__, time.perf_counter() - validator_start
-            )
-            all_errors.extend(result.errors)
-            all_warnings.extend(result.warnings)
-
-        return all_errors, all_warnings
+        validator = self._compiled_validator
+        validator_start = time.perf_counter()
+        result = validator.validate(data)
+        self._metrics.record_validator_time(
+            validator.__class__.__name__, time.perf_counter() - validator_start
+        )
+        return result.errors, result.warnings
 
     def _run_validators_parallel(
         self, data: Dict[str, Any]
@@ -186,7 +529,7 @@ class EmployeeValidationOrchestrator:
         Returns:
             Tuple of (errors, warnings)
         """
-        from concurrent.futures import ThreadPoolExecutor, as_completed
+        from concurrent.futures import TimeoutError
 
         all_errors: List[ValidationError] = []
         all_warnings: List[ValidationError] = []
@@ -199,35 +542,34 @@ class EmployeeValidationOrchestrator:
             )
             return result
 
-        validators = self._create_validators()
-        with ThreadPoolExecutor(max_workers=len(validators)) as executor:
-            future_to_validator = {
-                executor.submit(run_validator, validator): validator
-                for validator in validators
-            }
+        executor = self._get_executor()
+        futures = [
+            (executor.submit(run_validator, validator), validator)
+            for validator in self._validators
+        ]
 
-            for future in as_completed(future_to_validator):
-                validator = future_to_validator[future]
-                try:
-                    result = future.result(timeout=DEFAULT_TIMEOUT)
-                    all_errors.extend(result.errors)
-                    all_warnings.extend(result.warnings)
-                except TimeoutError:
-                    all_errors.append(
-                        ValidationError(
-                            field="validation",
-                            message=f"Validator {validator.__class__.__name__} timed out after {DEFAULT_TIMEOUT}s",
-                            severity="error",
-                        )
+        # Collect in validator order so errors match the sequential path
+        for future, validator in futures:
+            try:
+                result = future.result(timeout=DEFAULT_TIMEOUT)
+                all_errors.extend(result.errors)
+                all_warnings.extend(result.warnings)
+            except TimeoutError:
+                all_errors.append(
+                    ValidationError(
+                        field="validation",
+                        message=f"Validator {validator.__class__.__name__} timed out after {DEFAULT_TIMEOUT}s",
+                        severity="error",
                     )
-                except Exception as e:
-                    all_errors.append(
-                        ValidationError(
-                            field="validation",
-                            message=f"Validator {validator.__class__.__name__} failed: {e}",
-                            severity="error",
-                        )
+                )
+            except Exception as e:
+                all_errors.append(
+                    ValidationError(
+                        field="validation",
+                        message=f"Validator {validator.__class__.__name__} failed: {e}",
+                        severity="error",
                     )
+                )
 
         return all_errors, all_warnings
 
@@ -240,50 +582,157 @@ class EmployeeValidationOrchestrator:
         Returns:
             Dictionary mapping filepath to ValidationResult
         """
-        results = {}
-
-        if self.parallel_validation and len(filepaths) > 1:
-            from concurrent.futures import ThreadPoolExecutor, as_completed
-
-            with ThreadPoolExecutor(
-                max_workers=min(len(filepaths), MAX_PARALLEL_WORKERS)
-            ) as executor:
-                future_to_filepath = {
-                    executor.submit(self.validate_file, filepath, False): filepath
-                    for filepath in filepaths
-                }
-
-                for future in as_completed(future_to_filepath):
-                    filepath = future_to_filepath[future]
-                    try:
-                        results[filepath] = future.result(timeout=DEFAULT_TIMEOUT)
-                    except TimeoutError:
-                        results[filepath] = ValidationResult(
-                            is_valid=False,
-                            errors=[
-                                ValidationError(
-                                    field="file",
-                                    message=f"Validation of {filepath} timed out after {DEFAULT_TIMEOUT}s",
-                                    severity="error",
-                                )
-                            ],
-                        )
-                    except Exception as e:
-                        results[filepath] = ValidationResult(
-                            is_valid=False,
-                            errors=[
-                                ValidationError(
-                                    field="file",
-                                    message=f"Failed to validate {filepath}: {e}",
-                                    severity="error",
-                                )
-                            ],
-                        )
+        return dict(self.iter_validate(filepaths, ordered=True))
+
+    def iter_validate(
+        self, filepaths: Iterable[str], ordered: bool = False
+    ) -> Iterator[Tuple[str, ValidationResult]]:
+        """Validate files, yielding each result as soon as it is ready.
+
+        Uses the same execution strategy as ``validate_batch`` without
+        holding every result: thread batches keep a bounded window of files
+        in flight, and process batches yield chunk by chunk.
+
+        Args:
+            filepaths: Paths to YAML files; duplicates are validated once
+            ordered: Yield in input order instead of completion order. For
+                the process executor, results that finish early are held
+                back until the files before them are done.
+
+        Yields:
+            Tuples of (filepath, ValidationResult)
+        """
+        paths = list(dict.fromkeys(filepaths))
+
+        if self.executor == "process" and len(paths) > 1:
+            indexed = self._iter_validate_processes(paths)
+            if ordered:
+                yield from _reorder(indexed)
+            else:
+                for _, filepath, result in indexed:
+                    yield filepath, result
+        elif self.parallel_validation and len(paths) > 1:
+            yield from self._iter_validate_threads(paths, ordered)
         else:
-            for filepath in filepaths:
-                results[filepath] = self.validate_file(filepath)
+            for filepath in paths:
+                yield filepath, self.validate_file(filepath)
+
+    def _iter_validate_threads(
+        self, filepaths: List[str], ordered: bool
+    ) -> Iterator[Tuple[str, ValidationResult]]:
+        """Validate files on the shared thread pool with a bounded window."""
+        from concurrent.futures import FIRST_COMPLETED, TimeoutError, wait
+
+        executor = self._get_executor()
+        window = (self.max_workers or MAX_PARALLEL_WORKERS) * STREAM_WINDOW_PER_WORKER
+        remaining = iter(filepaths)
+        # Insertion-ordered, so the first entry is the oldest submission
+        in_flight: Dict[Future, str] = {}
+
+        def submit_next() -> bool:
+            filepath = next(remaining, None)
+            if filepath is None:
+                return False
+            in_flight[executor.submit(self.validate_file, filepath, False)] = filepath
+            return True
+
+        while len(in_flight) < window and submit_next():
+            pass
+
+        while in_flight:
+            if ordered:
+                done: Iterable[Future] = [next(iter(in_flight))]
+            else:
+                done, _ = wait(list(in_flight), return_when=FIRST_COMPLETED)
+            for future in done:
+                filepath = in_flight.pop(future)
+                try:
+                    result = future.result(timeout=DEFAULT_TIMEOUT)
+                except TimeoutError:
+                    result = _failed_result(
+                        f"Validation of {filepath} timed out after {DEFAULT_TIMEOUT}s"
+                    )
+                except Exception as e:
+                    result = _failed_result(f"Failed to validate {filepath}: {e}")
+                submit_next()
+                yield filepath, result
+
+    def _iter_validate_processes(
+        self, filepaths: List[str]
+    ) -> Iterator[Tuple[int, str, ValidationResult]]:
+        """Validate files across a process pool.
+
+        Files are dispatched in chunks so each worker amortizes IPC over many
+        contracts; every worker keeps one warm orchestrator for its lifetime.
+        Cached results are served from this process before dispatching.
+
+        Args:
+            filepaths: List of unique paths to YAML files
+
+        Yields:
+            Tuples of (input index, filepath, ValidationResult) in completion
+            order
+        """
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+        from .validators import get_production_mode
+
+        cache_keys: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+        pending: List[Tuple[int, str]] = []
 
-        return results
+        for index, filepath in enumerate(filepaths):
+            cached, cache_key, disk_key = self._lookup_file_cache(filepath)
+            cache_keys[filepath] = (cache_key, disk_key)
+            if cached is not None:
+                start_time = self._metrics.record_validation_start()
+                self._metrics.record_validation_end(start_time, cached.is_valid)
+                yield index, filepath, cached
+                continue
+            pending.append((index, filepath))
+
+        if not pending:
+            return
+
+        workers = min(len(pending), self.max_workers or os.cpu_count() or 1)
+        chunk_size = max(1, -(-len(pending) // (workers * PROCESS_CHUNKS_PER_WORKER)))
+        chunks = [
+            pending[i : i + chunk_size] for i in range(0, len(pending), chunk_size)
+        ]
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_process_worker,
+            initargs=(get_production_mode(),),
+        ) as executor:
+            future_to_chunk = {
+                executor.submit(_validate_chunk, [fp for _, fp in chunk]): chunk
+                for chunk in chunks
+            }
+
+            for future in as_completed(future_to_chunk):
+                chunk = future_to_chunk[future]
+                try:
+                    records = future.result()
+                except Exception as e:
+                    for index, filepath in chunk:
+                        yield index, filepath, _failed_result(
+                            f"Failed to validate {filepath}: {e}"
+                        )
+                    continue
+
+                for (index, _), record in zip(chunk, records):
+                    filepath, is_valid, errors, warnings, duration = record
+                    result = ValidationResult(
+                        is_valid=is_valid,
+                        errors=[_record_to_error(r) for r in errors],
+                        warnings=[_record_to_error(r) for r in warnings],
+                    )
+                    # Worker metrics live in the child process; mirror them here.
+                    self._metrics.record_validation_end(time.time() - duration, is_valid)
+                    # Parse failures carry no errors from validators and
+                    # are not cached, matching validate_file.
+                    if not (errors and errors[0][0] == "file"):
+                        self._store_file_cache(result, *cache_keys[filepath])
+                    yield index, filepath, result
 
     def validate_files(self, filepaths: List[str]) -> Dict[str, ValidationResult]:
         return self.validate_batch(filepaths)
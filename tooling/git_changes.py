@@ -0,0 +1,115 @@
+"""Select contracts changed since a git revision.
+
+Used by ``employee-validate --changed-since REV`` so CI on a large
+repository validates only the contracts a change touched. The changed set
+comes from plain ``git`` (committed, staged and unstaged changes plus
+untracked files) and is matched against the CLI's file arguments without
+walking the tree.
+"""
+
+import fnmatch
+import os
+import subprocess
+from pathlib import Path
+from typing import Iterable, List, Optional, Set
+
+
+class GitChangesError(Exception):
+    """Raised when the changed-file set cannot be determined from git."""
+
+
+def _git(args: List[str], cwd: Optional[str]) -> str:
+    try:
+        completed = subprocess.run(
+            ["git", *args],
+            cwd=cwd,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+    except OSError as e:
+        raise GitChangesError(f"Cannot run git: {e}")
+    if completed.returncode != 0:
+        message = completed.stderr.strip() or f"git {args[0]} failed"
+        raise GitChangesError(message)
+    return completed.stdout
+
+
+def changed_files_since(rev: str, cwd: Optional[str] = None) -> Set[str]:
+    """Return absolute paths of files added or modified since ``rev``.
+
+    Compares the working tree with ``rev``, so uncommitted edits count as
+    changes; untracked (but not ignored) files are included. Deleted files
+    are not, since there is nothing left to validate.
+
+    Args:
+        rev: Any revision git understands (branch, tag, SHA, ``HEAD~3``)
+        cwd: Directory inside the repository (default: current directory)
+
+    Returns:
+        Set of absolute file paths
+
+    Raises:
+        GitChangesError: If git is missing, this is not a repository, or
+            ``rev`` is unknown
+    """
+    if rev.startswith("-"):
+        raise GitChangesError(f"Invalid revision: {rev}")
+    top = _git(["rev-parse", "--show-toplevel"], cwd).strip()
+    diff = _git(
+        ["diff", "--name-only", "-z", "--no-renames", "--diff-filter=AM", rev, "--"],
+        top,
+    )
+    untracked = _git(["ls-files", "-z", "--others", "--exclude-standard"], top)
+
+    changed = set()
+    for output in (diff, untracked):
+        for name in output.split("\0"):
+            if name:
+                changed.add(os.path.normpath(os.path.join(top, name)))
+    return changed
+
+
+def _real_path(path: str) -> str:
+    """Absolute path with symlinks resolved in the parent directories only."""
+    absolute = os.path.abspath(path)
+    return os.path.join(os.path.realpath(os.path.dirname(absolute)), os.path.basename(absolute))
+
+
+def select_changed(patterns: Iterable[str], changed: Set[str], suffix: str = ".md") -> List[str]:
+    """Match changed files against CLI file arguments.
+
+    Mirrors the CLI's expansion rules without touching the filesystem for
+    unchanged files: a file argument matches itself, a directory matches
+    ``suffix`` files anywhere below it, and any other argument is a glob
+    on the files directly inside its parent directory.
+
+    Args:
+        patterns: File, directory or glob arguments as given on the CLI
+        changed: Absolute paths from ``changed_files_since``
+        suffix: File suffix matched under directory arguments
+
+    Returns:
+        Matching changed files, sorted, as paths relative to the current
+        directory when they are below it
+    """
+    selected: Set[str] = set()
+    for pattern in patterns:
+        path = Path(pattern)
+        absolute = _real_path(pattern)
+        if path.is_dir():
+            prefix = os.path.realpath(absolute).rstrip(os.sep) + os.sep
+            selected.update(f for f in changed if f.startswith(prefix) and f.endswith(suffix))
+        elif path.exists():
+            if absolute in changed:
+                selected.add(absolute)
+        else:
+            parent = os.path.realpath(path.parent)
+            selected.update(
+                f
+                for f in changed
+                if os.path.dirname(f) == parent and fnmatch.fnmatch(os.path.basename(f), path.name)
+            )
+
+    cwd = os.path.realpath(os.getcwd()) + os.sep
+    return sorted(f[len(cwd) :] if f.startswith(cwd) else f for f in selected if os.path.isfile(f))
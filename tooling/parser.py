@@ -1,13 +1,26 @@
 """Secure YAML parser with resource limits and error context."""
 
+import io
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple, Type
 import yaml
 from yaml import YAMLError
+from yaml.composer import Composer
+from yaml.constructor import SafeConstructor
+from yaml.resolver import Resolver
 
 from .constants import MAX_YAML_DEPTH, MAX_FILE_SIZE
 
+try:
+    from yaml.cyaml import CParser  # type: ignore[attr-defined]
+
+    LIBYAML_AVAILABLE = True
+except ImportError:  # PyYAML built without libyaml
+    CParser = None  # type: ignore[misc, assignment]
+    LIBYAML_AVAILABLE = False
+
 
 class YAMLErrorContext(Exception):
     """Exception with YAML line number context."""
@@ -23,6 +36,77 @@ class DepthLimitExceeded(yaml.MarkedYAMLError):
     pass
 
 
+class _DepthLimitComposer(Composer):
+    """Composer that rejects mappings/sequences nested beyond ``max_depth``.
+
+    The check runs while the node tree is being built, so a hostile document
+    is rejected before it can exhaust the stack.
+    """
+
+    max_depth = MAX_YAML_DEPTH
+    current_depth = 0
+
+    def _enter_collection(self) -> None:
+        self.current_depth += 1
+        if self.current_depth > self.max_depth:
+            mark = self.peek_event().start_mark  # type: ignore[attr-defined]
+            raise DepthLimitExceeded(
+                problem=f"YAML nesting too deep: {self.current_depth} levels (max: {self.max_depth})",
+                problem_mark=mark,
+            )
+
+    def compose_mapping_node(self, anchor):
+        self._enter_collection()
+        try:
+            return super().compose_mapping_node(anchor)
+        finally:
+            self.current_depth -= 1
+
+    def compose_sequence_node(self, anchor):
+        self._enter_collection()
+        try:
+            return super().compose_sequence_node(anchor)
+        finally:
+            self.current_depth -= 1
+
+
+class DepthLimitLoader(_DepthLimitComposer, yaml.SafeLoader):
+    """Pure-Python safe loader with depth limiting."""
+
+
+if CParser is not None:
+
+    class CDepthLimitLoader(_DepthLimitComposer, CParser, SafeConstructor, Resolver):  # type: ignore[misc, valid-type]
+        """Safe loader that scans and parses with libyaml.
+
+        Composition stays in Python (``_DepthLimitComposer`` precedes
+        ``CParser`` in the MRO) so the depth limit is still enforced while
+        events stream out of the C parser.
+        """
+
+        def __init__(self, stream):
+            CParser.__init__(self, stream)
+            Composer.__init__(self)
+            SafeConstructor.__init__(self)
+            Resolver.__init__(self)
+
+else:
+    CDepthLimitLoader = None  # type: ignore[assignment, misc]
+
+
+@lru_cache(maxsize=1024)
+def _resolve_directory(directory: str) -> Optional[Path]:
+    """Resolve an allowed directory once per process.
+
+    Validating a tree builds a parser per directory; caching the resolution
+    avoids repeating the ``realpath`` syscalls for every file in it.
+    """
+    try:
+        return Path(directory).resolve()
+    except (ValueError, OSError):
+        return None
+
+
 class SecureYAMLParser:
     """YAML parser with security hardening."""
 
@@ -31,10 +115,19 @@ class SecureYAMLParser:
         max_depth: int = MAX_YAML_DEPTH,
         max_size: int = MAX_FILE_SIZE,
         allowed_directories: Optional[List[str]] = None,
+        use_libyaml: bool = True,
     ):
         self.max_depth = max_depth
         self.max_size = max_size
         self.allowed_directories = self._normalize_allowed_dirs(allowed_directories)
+        self.use_libyaml = use_libyaml and CDepthLimitLoader is not None
+
+    @property
+    def loader_class(self) -> Type[Any]:
+        """Loader used for parsing: libyaml-backed when available."""
+        if self.use_libyaml:
+            return CDepthLimitLoader
+        return DepthLimitLoader
 
     def parse_file(self, filepath: str) -> Tuple[Dict[str, Any], Optional[int]]:
         """Parse a YAML file with security checks.
@@ -48,6 +141,21 @@ class SecureYAMLParser:
         Raises:
             YAMLErrorContext: If parsing fails or security checks fail
         """
+        return self.parse_bytes(self.read_file(filepath), name=filepath)
+
+    def read_file(self, filepath: str) -> bytes:
+        """Read a YAML file's raw contents with security checks.
+
+        Args:
+            filepath: Path to YAML file
+
+        Returns:
+            Raw file contents
+
+        Raises:
+            YAMLErrorContext: If the file is unsafe, missing, too large or
+                unreadable
+        """
         # Security: Input path traversal check
         # Check raw input for traversal attempts before resolving
         if ".." in str(filepath).split(os.sep):
@@ -63,11 +171,12 @@ class SecureYAMLParser:
             )
 
         # Security: File existence check
-        if not resolved_path.exists():
+        try:
+            file_size = resolved_path.stat().st_size
+        except (FileNotFoundError, NotADirectoryError):
             raise YAMLErrorContext(f"File not found: {filepath}", line_number=None)
 
         # Security: File size limit
-        file_size = resolved_path.stat().st_size
         if file_size > self.max_size:
             raise YAMLErrorContext(
                 f"File too large: {file_size} bytes (max: {self.max_size})",
@@ -75,15 +184,39 @@ class SecureYAMLParser:
             )
 
         try:
-            with open(resolved_path, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+            with open(resolved_path, "rb") as f:
+                return f.read()
         except (IOError, OSError) as e:
             raise YAMLErrorContext(f"Error reading file: {e}", line_number=None)
-        except YAMLError as e:
-            line_number = self._extract_line_number(e)
-            raise YAMLErrorContext(f"YAML parsing error: {e}", line_number=line_number)
 
-        return self._validate_structure(data)
+    def parse_bytes(
+        self, content: bytes, name: Optional[str] = None
+    ) -> Tuple[Dict[str, Any], Optional[int]]:
+        """Parse UTF-8 encoded YAML content, e.g. from ``read_file``.
+
+        Args:
+            content: Raw YAML content
+            name: Path the content was read from, quoted in error marks
+
+        Returns:
+            Tuple of (parsed_data, error_line_number)
+
+        Raises:
+            YAMLErrorContext: If parsing fails or security checks fail
+        """
+        # Security: Content size limit
+        if len(content) > self.max_size:
+            raise YAMLErrorContext(
+                f"Content too large: {len(content)} bytes (max: {self.max_size})",
+                line_number=None,
+            )
+
+        try:
+            text = content.decode("utf-8")
+        except UnicodeDecodeError as e:
+            raise YAMLErrorContext(f"Error reading file: {e}", line_number=None)
+
+        return self._validate_structure(self._load(text, name))
 
     def parse_string(self, content: str) -> Tuple[Dict[str, Any], Optional[int]]:
         """Parse YAML content from string.
@@ -104,46 +237,20 @@ class SecureYAMLParser:
                 line_number=None,
             )
 
-        class DepthLimitLoader(yaml.SafeLoader):
-            def __init__(self, stream):
-                super().__init__(stream)
-                self.max_depth = self._outer.max_depth
-                self.current_depth = 0
-
-            def compose_mapping_node(self, anchor):
-                self.current_depth += 1
-                if self.current_depth > self.max_depth:
-                    mark = self.peek_event().start_mark
-                    raise DepthLimitExceeded(
-                        problem=f"YAML nesting too deep: {self.current_depth} levels (max: {self.max_depth})",
-                        problem_mark=mark,
-                    )
-                try:
-                    return super().compose_mapping_node(anchor)
-                finally:
-                    self.current_depth -= 1
-
-            def compose_sequence_node(self, anchor):
-                self.current_depth += 1
-                if self.current_depth > self.max_depth:
-                    mark = self.peek_event().start_mark
-                    raise DepthLimitExceeded(
-                        problem=f"YAML nesting too deep: {self.current_depth} levels (max: {self.max_depth})",
-                        problem_mark=mark,
-                    )
-                try:
-                    return super().compose_sequence_node(anchor)
-                finally:
-                    self.current_depth -= 1
-
-        # Attach outer self to loader class so the inner class can read max_depth.
-        # Use setattr to avoid mypy's strict attribute-existence check on a class
-        # defined inside this method.
-        setattr(DepthLimitLoader, "_outer", self)
-
+        return self._validate_structure(self._load(content))
+
+    def _load(self, content: str, name: Optional[str] = None) -> Any:
+        """Load YAML content with the depth-limited loader."""
+        stream: Any = content
+        if name is not None:
+            # Both loaders take the mark name from the stream's `name`, so
+            # errors read `in "<path>", line N` rather than "<unicode string>".
+            stream = io.StringIO(content)
+            stream.name = name
+        loader = self.loader_class(stream)
+        loader.max_depth = self.max_depth
         try:
-            # Use load with DepthLimitLoader to check depth during parsing
-            data = yaml.load(content, Loader=DepthLimitLoader)
+            return loader.get_single_data()
         except DepthLimitExceeded as e:
             line_number = self._extract_line_number(e)
             # Use e.problem as message
@@ -151,8 +258,8 @@ class SecureYAMLParser:
         except YAMLError as e:
             line_number = self._extract_line_number(e)
             raise YAMLErrorContext(f"YAML parsing error: {e}", line_number=line_number)
-
-        return self._validate_structure(data)
+        finally:
+            loader.dispose()
 
     def _validate_structure(self, data: Any) -> Tuple[Dict[str, Any], Optional[int]]:
         """Validate structure of parsed YAML data."""
@@ -173,11 +280,10 @@ class SecureYAMLParser:
 
         normalized = set()
         for directory in directories:
-            try:
-                abs_path = Path(directory).resolve()
+            # Key on the absolute path so a later chdir cannot hit a stale entry
+            abs_path = _resolve_directory(os.path.abspath(directory))
+            if abs_path is not None:
                 normalized.add(abs_path)
-            except (ValueError, OSError):
-                continue
         return normalized
 
     def _is_safe_path(self, path: Path) -> bool:
@@ -27,7 +27,6 @@ from pathlib import Path
 from typing import List
 
 import yaml
-from jsonschema import Draft7Validator
 
 # Resolve paths relative to this file so the script works from any cwd.
 _REPO_ROOT = Path(__file__).resolve().parent.parent
@@ -53,6 +52,9 @@ OFFICIAL_FILES: List[str] = [
 
 
 def main() -> int:
+    # jsonschema is slow to import and only needed when the check runs.
+    from jsonschema import Draft7Validator
+
     with _SCHEMA_PATH.open() as fh:
         schema = json.load(fh)
     validator = Draft7Validator(schema)
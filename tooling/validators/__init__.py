@@ -12,6 +12,7 @@ from .types import TypeValidator
 from .enums import EnumValidator
 from .formats import FormatValidator
 from .ranges import RangeValidator
+from .compiled import CompiledValidator, ValidationPlan, compile_plan
 
 __all__ = [
     "BaseValidator",
@@ -24,4 +25,7 @@ __all__ = [
     "EnumValidator",
     "FormatValidator",
     "RangeValidator",
+    "CompiledValidator",
+    "ValidationPlan",
+    "compile_plan",
 ]
@@ -88,13 +88,56 @@ class ValidationResult:
     def error_count(self) -> int:
         return len(self.errors)
 
+    def add_error(
+        self,
+        field: str,
+        message: str,
+        line_number: Optional[int] = None,
+        suggestion: Optional[str] = None,
+    ) -> None:
+        """Add an error and mark the result invalid."""
+        self.errors.append(
+            ValidationError(
+                field=field,
+                message=message,
+                severity="error",
+                line_number=line_number,
+                suggestion=suggestion,
+            )
+        )
+        self.is_valid = False
+
+    def add_warning(
+        self,
+        field: str,
+        message: str,
+        line_number: Optional[int] = None,
+        suggestion: Optional[str] = None,
+    ) -> None:
+        """Add a warning."""
+        self.warnings.append(
+            ValidationError(
+                field=field,
+                message=message,
+                severity="warning",
+                line_number=line_number,
+                suggestion=suggestion,
+            )
+        )
+
     @property
     def warning_count(self) -> int:
         return len(self.warnings)
 
 
 class BaseValidator(ABC):
-    """Abstract base class for all validators."""
+    """Abstract base class for all validators.
+
+    The built-in validators are stateless: ``validate`` collects into a fresh
+    ``ValidationResult`` and never touches ``self.errors``, so one instance
+    can be shared across files and threads. ``add_error``/``add_warning`` and
+    ``_create_result`` remain for validators that accumulate on the instance.
+    """
 
     def __init__(self):
         self.errors: List[ValidationError] = []
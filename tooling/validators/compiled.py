@@ -0,0 +1,442 @@
+"""Single-pass validation compiled from the rule tables in constants.py.
+
+``compile_plan`` flattens ``VALIDATION_RULES``, ``REQUIRED_FIELDS``,
+``RANGE_CONSTRAINTS`` and the enum/format checks into one ``SectionPlan``
+per top-level section, with dotted paths pre-split and messages and type
+names pre-rendered. ``CompiledValidator`` then visits each section of a
+document once instead of five validators each looking sections up again.
+
+Errors are reported exactly as running the Required, Enum, Type, Format and
+Range validators in that order would report them. Documents the plan does
+not model (a section that is not a mapping, or a value that makes a check
+raise) are handed to those validators unchanged.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, List, Mapping, Optional, Tuple
+
+from .base import BaseValidator, ValidationResult
+from .enums import EnumValidator
+from .formats import FormatValidator
+from .ranges import RangeValidator
+from .required import RequiredFieldValidator
+from .types import TypeValidator
+from ..constants import (
+    LEVEL_ENUM,
+    RANGE_CONSTRAINTS,
+    REQUIRED_FIELDS,
+    REQUIRED_SECTIONS,
+    SPEC_STATUS_ENUM,
+    STATUS_ENUM,
+    VALIDATION_RULES,
+)
+from ..utils import (
+    check_type,
+    is_placeholder,
+    validate_iso_date,
+    validate_url,
+    validate_wallet,
+)
+
+# Error buckets, in the order the individual validators run
+_REQUIRED, _ENUM, _TYPE, _FORMAT, _RANGE = range(5)
+
+# Enum checks in EnumValidator order: (section, field, allowed values)
+ENUM_CHECKS: Tuple[Tuple[str, str, FrozenSet[str]], ...] = (
+    ("role", "level", LEVEL_ENUM),
+    ("lifecycle", "status", STATUS_ENUM),
+    ("spec", "status", SPEC_STATUS_ENUM),
+)
+
+# Format checks in FormatValidator order: (section, path, kind, message).
+# Kinds: "wallet", "date" and "url" check a truthy value; "url_list" checks
+# every item of a present list; "wallet_map" checks every truthy value of a
+# mapping. Messages may use {value} and {key} for per-item errors.
+FORMAT_CHECKS: Tuple[Tuple[str, str, str, str], ...] = (
+    ("identity", "wallet", "wallet", "Invalid wallet address format"),
+    (
+        "identity",
+        "created_at",
+        "date",
+        "Invalid created_at format (must be ISO 8601)",
+    ),
+    (
+        "identity",
+        "updated_at",
+        "date",
+        "Invalid updated_at format (must be ISO 8601)",
+    ),
+    *(
+        (
+            "lifecycle",
+            date_field,
+            "date",
+            f"Invalid lifecycle.{date_field} format (must be ISO 8601)",
+        )
+        for date_field in ("start_date", "end_date", "probation_end", "next_review")
+    ),
+    ("knowledge_base", "documentation_urls", "url_list", "Invalid URL: {value}"),
+    ("spec", "schema", "url", "Invalid spec.schema format (must be URL)"),
+    ("spec", "homepage", "url", "Invalid spec.homepage format (must be URL)"),
+    (
+        "economy",
+        "wallets",
+        "wallet_map",
+        "Invalid wallet address format in economy.wallets.{key}",
+    ),
+    (
+        "protocols",
+        "x402.wallet_address",
+        "wallet",
+        "Invalid wallet address format in protocols.x402.wallet_address",
+    ),
+)
+
+_MISSING = object()
+
+
+@dataclass
+class SectionPlan:
+    """Precomputed checks for one top-level section.
+
+    Every check carries its rank within its validator so errors can be put
+    back in the order the individual validators produce them.
+    """
+
+    name: str
+    field_types: Optional[Mapping[str, Any]] = None
+    type_names: Dict[str, str] = field(default_factory=dict)
+    expects_list: bool = False
+    required: List[Tuple[int, str]] = field(default_factory=list)
+    enums: List[Tuple[int, str, FrozenSet[str], str, str]] = field(default_factory=list)
+    formats: List[Tuple[int, Tuple[str, ...], str, str, str]] = field(default_factory=list)
+    ranges: List[Tuple[int, Tuple[str, ...], str, float, float]] = field(default_factory=list)
+
+    @property
+    def needs_mapping(self) -> bool:
+        """Whether the section must be a dict for the plan to apply."""
+        return bool(self.required or self.enums or self.formats)
+
+
+@dataclass
+class ValidationPlan:
+    """Flat, precomputed form of the validation rules."""
+
+    sections: Dict[str, SectionPlan]
+    section_keys: Any
+    required_sections: FrozenSet[str]
+
+
+def _type_name(expected_type: Any) -> str:
+    if isinstance(expected_type, tuple):
+        return " | ".join(t.__name__ for t in expected_type)
+    return expected_type.__name__
+
+
+def compile_plan(
+    rules: Mapping[str, Any] = VALIDATION_RULES,
+    required_sections: FrozenSet[str] = REQUIRED_SECTIONS,
+    required_fields: Mapping[str, FrozenSet[str]] = REQUIRED_FIELDS,
+    range_constraints: Mapping[str, Tuple[float, float]] = RANGE_CONSTRAINTS,
+) -> ValidationPlan:
+    """Compile rule tables into a per-section validation plan.
+
+    Args:
+        rules: Section -> field -> expected type mapping
+        required_sections: Sections that must be present
+        required_fields: Section -> fields that must be present
+        range_constraints: Dotted path -> (min, max) for numeric fields
+
+    Returns:
+        ValidationPlan keyed by section name
+
+    Raises:
+        ValueError: If a check targets a section missing from ``rules``
+    """
+    sections = {name: SectionPlan(name=name) for name in rules}
+
+    def plan_for(name: str) -> SectionPlan:
+        if name not in sections:
+            raise ValueError(f"Validation rules have no section: '{name}'")
+        return sections[name]
+
+    for name, fields in rules.items():
+        plan = sections[name]
+        if isinstance(fields, list):
+            plan.expects_list = True
+        elif isinstance(fields, dict):
+            plan.field_types = fields
+            plan.type_names = {f: _type_name(t) for f, t in fields.items()}
+
+    for rank, (name, fields) in enumerate(required_fields.items()):
+        plan = plan_for(name)
+        for position, field_name in enumerate(fields):
+            plan.required.append((rank * 1000 + position, field_name))
+
+    for rank, (name, field_name, allowed) in enumerate(ENUM_CHECKS):
+        choices = sorted(allowed)
+        plan_for(name).enums.append(
+            (
+                rank,
+                field_name,
+                allowed,
+                f"Must be one of: {choices}",
+                f"Use one of: {', '.join(choices)}",
+            )
+        )
+
+    for rank, (name, path, kind, message) in enumerate(FORMAT_CHECKS):
+        plan_for(name).formats.append(
+            (rank, tuple(path.split(".")), f"{name}.{path}", kind, message)
+        )
+
+    for rank, (path, (min_val, max_val)) in enumerate(range_constraints.items()):
+        name, *rest = path.split(".")
+        plan_for(name).ranges.append((rank, tuple(rest), path, min_val, max_val))
+
+    return ValidationPlan(
+        sections=sections,
+        section_keys=rules.keys(),
+        required_sections=required_sections,
+    )
+
+
+def _lookup(data: Dict[str, Any], path: Tuple[str, ...]) -> Any:
+    """Follow ``path`` through nested dicts; ``_MISSING`` if absent."""
+    current: Any = data
+    for key in path[:-1]:
+        current = current.get(key)
+        if not isinstance(current, dict):
+            return _MISSING
+    return current.get(path[-1], _MISSING)
+
+
+class CompiledValidator(BaseValidator):
+    """Runs a compiled ``ValidationPlan`` in one pass over the document.
+
+    Produces the same errors, in the same order, as running
+    RequiredFieldValidator, EnumValidator, TypeValidator, FormatValidator
+    and RangeValidator one after another.
+    """
+
+    def __init__(self, plan: Optional[ValidationPlan] = None):
+        super().__init__()
+        self.plan = plan if plan is not None else compile_plan()
+        self._fallback: List[BaseValidator] = [
+            RequiredFieldValidator(),
+            EnumValidator(),
+            TypeValidator(),
+            FormatValidator(),
+            RangeValidator(),
+        ]
+
+    def validate(self, config: Dict[str, Any]) -> ValidationResult:
+        if isinstance(config, dict):
+            try:
+                errors = self._run_plan(config)
+            except Exception:
+                errors = None
+            if errors is not None:
+                result = ValidationResult(is_valid=True)
+                for _, _, _, field_path, message, suggestion in errors:
+                    result.add_error(field=field_path, message=message, suggestion=suggestion)
+                return result
+        return self._run_fallback(config)
+
+    def _run_fallback(self, config: Dict[str, Any]) -> ValidationResult:
+        result = ValidationResult(is_valid=True)
+        for validator in self._fallback:
+            partial = validator.validate(config)
+            result.errors.extend(partial.errors)
+            result.warnings.extend(partial.warnings)
+        result.is_valid = not result.errors
+        return result
+
+    def _run_plan(
+        self, config: Dict[str, Any]
+    ) -> Optional[List[Tuple[int, int, int, str, str, Optional[str]]]]:
+        """Collect ranked errors, or return None if the plan does not apply."""
+        plan = self.plan
+        errors: List[Tuple[int, int, int, str, str, Optional[str]]] = []
+
+        for rank, required in enumerate(plan.required_sections):
+            if required not in config:
+                errors.append(
+                    (
+                        _REQUIRED,
+                        -1,
+                        rank,
+                        required,
+                        f"Missing required section: '{required}'",
+                        None,
+                    )
+                )
+
+        # Type errors are found in document order and ranked afterwards in
+        # the (set) order TypeValidator visits sections and fields
+        type_errors: List[Tuple[str, Optional[str], str]] = []
+        sections = plan.sections
+        for name, data in config.items():
+            section = sections.get(name)
+            if section is None:
+                continue
+
+            if not isinstance(data, dict):
+                if section.needs_mapping:
+                    return None
+                if section.expects_list:
+                    if not isinstance(data, list):
+                        type_errors.append(
+                            (
+                                name,
+                                None,
+                                f"Invalid type for {name}: expected list, got {type(data).__name__}",
+                            )
+                        )
+                elif section.field_types is not None:
+                    type_errors.append(
+                        (
+                            name,
+                            None,
+                            f"Invalid type for {name}: expected dict, got {type(data).__name__}",
+                        )
+                    )
+                continue
+
+            for rank, field_name in section.required:
+                if field_name not in data:
+                    errors.append(
+                        (
+                            _REQUIRED,
+                            rank,
+                            0,
+                            f"{name}.{field_name}",
+                            f"Missing required field: '{name}.{field_name}'",
+                            None,
+                        )
+                    )
+
+            for rank, field_name, allowed, choices, suggestion in section.enums:
+                if field_name in data:
+                    value = data[field_name]
+                    if not is_placeholder(value) and value not in allowed:
+                        errors.append(
+                            (
+                                _ENUM,
+                                rank,
+                                0,
+                                f"{name}.{field_name}",
+                                f"Invalid {name}.{field_name}: {value}. {choices}",
+                                suggestion,
+                            )
+                        )
+
+            if section.expects_list:
+                type_errors.append(
+                    (name, None, f"Invalid type for {name}: expected list, got dict")
+                )
+            elif section.field_types is not None:
+                field_types = section.field_types
+                for field_name, value in data.items():
+                    expected_type = field_types.get(field_name)
+                    if expected_type is None:
+                        continue
+                    if value is not None and isinstance(value, expected_type):
+                        continue
+                    if check_type(value, expected_type):
+                        continue
+                    type_errors.append(
+                        (
+                            name,
+                            field_name,
+                            f"Invalid type for {name}.{field_name}: expected {section.type_names[field_name]}, got {type(value).__name__}",
+                        )
+                    )
+
+            for rank, path, field_path, kind, message in section.formats:
+                value = _lookup(data, path)
+                if value is _MISSING:
+                    continue
+                if kind == "url_list":
+                    for index, url in enumerate(value):
+                        if not validate_url(url):
+                            errors.append(
+                                (
+                                    _FORMAT,
+                                    rank,
+                                    index,
+                                    f"{field_path}[{index}]",
+                                    message.format(value=url),
+                                    None,
+                                )
+                            )
+                elif kind == "wallet_map":
+                    if not isinstance(value, dict):
+                        continue
+                    for index, (key, wallet) in enumerate(value.items()):
+                        if wallet and not validate_wallet(wallet):
+                            errors.append(
+                                (
+                                    _FORMAT,
+                                    rank,
+                                    index,
+                                    f"{field_path}.{key}",
+                                    message.format(key=key),
+                                    None,
+                                )
+                            )
+                elif value:
+                    if kind == "date":
+                        valid = validate_iso_date(value)
+                    elif kind == "url":
+                        valid = validate_url(value)
+                    else:
+                        valid = validate_wallet(value)
+                    if not valid:
+                        errors.append((_FORMAT, rank, 0, field_path, message, None))
+
+            for rank, path, field_path, min_val, max_val in section.ranges:
+                value = _lookup(data, path)
+                if value is _MISSING or value is None:
+                    continue
+                if not isinstance(value, (int, float)):
+                    continue
+                if not (min_val <= value <= max_val):
+                    errors.append(
+                        (
+                            _RANGE,
+                            rank,
+                            0,
+                            field_path,
+                            f"Invalid {field_path}: {value}. Must be between {min_val} and {max_val}",
+                            None,
+                        )
+                    )
+
+        if type_errors:
+            section_ranks = {
+                name: rank for rank, name in enumerate(config.keys() & plan.section_keys)
+            }
+            field_ranks: Dict[str, Dict[str, int]] = {}
+            for name, type_field, message in type_errors:
+                if type_field is None:
+                    errors.append((_TYPE, section_ranks[name], 0, name, message, None))
+                    continue
+                if name not in field_ranks:
+                    field_types = sections[name].field_types or {}
+                    field_ranks[name] = {
+                        f: rank for rank, f in enumerate(config[name].keys() & field_types.keys())
+                    }
+                errors.append(
+                    (
+                        _TYPE,
+                        section_ranks[name],
+                        field_ranks[name][type_field],
+                        f"{name}.{type_field}",
+                        message,
+                        None,
+                    )
+                )
+
+        errors.sort(key=lambda error: error[:3])
+        return errors
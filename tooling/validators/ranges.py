@@ -10,7 +10,7 @@ class RangeValidator(BaseValidator):
     """Validates numeric ranges."""
 
     def validate(self, config: Dict[str, Any]) -> ValidationResult:
-        self.reset()
+        result = ValidationResult(is_valid=True)
 
         for field_path, (min_val, max_val) in RANGE_CONSTRAINTS.items():
             value = get_nested_value(config, field_path)
@@ -22,9 +22,9 @@ class RangeValidator(BaseValidator):
                 continue
 
             if not (min_val <= value <= max_val):
-                self.add_error(
+                result.add_error(
                     field=field_path,
                     message=f"Invalid {field_path}: {value}. Must be between {min_val} and {max_val}",
                 )
 
-        return self._create_result()
+        return result
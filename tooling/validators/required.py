@@ -9,12 +9,12 @@ class RequiredFieldValidator(BaseValidator):
     """Validates that required fields are present."""
 
     def validate(self, config: Dict[str, Any]) -> ValidationResult:
-        self.reset()
+        result = ValidationResult(is_valid=True)
 
         # Check required sections
         for section in REQUIRED_SECTIONS:
             if section not in config:
-                self.add_error(
+                result.add_error(
                     field=section, message=f"Missing required section: '{section}'"
                 )
 
@@ -25,9 +25,9 @@ class RequiredFieldValidator(BaseValidator):
 
             for field in fields:
                 if field not in config[section]:
-                    self.add_error(
+                    result.add_error(
                         field=f"{section}.{field}",
                         message=f"Missing required field: '{section}.{field}'",
                     )
 
-        return self._create_result()
+        return result
@@ -10,7 +10,7 @@ class TypeValidator(BaseValidator):
     """Validates field types."""
 
     def validate(self, config: Dict[str, Any]) -> ValidationResult:
-        self.reset()
+        result = ValidationResult(is_valid=True)
 
         for section in config.keys() & VALIDATION_RULES.keys():
             fields = VALIDATION_RULES[section]
@@ -18,7 +18,7 @@ class TypeValidator(BaseValidator):
 
             if isinstance(fields, list):
                 if not isinstance(section_data, list):
-                    self.add_error(
+                    result.add_error(
                         field=section,
                         message=f"Invalid type for {section}: expected list, got {type(section_data).__name__}",
                     )
@@ -28,7 +28,7 @@ class TypeValidator(BaseValidator):
                 continue
 
             if not isinstance(section_data, dict):
-                self.add_error(
+                result.add_error(
                     field=section,
                     message=f"Invalid type for {section}: expected dict, got {type(section_data).__name__}",
                 )
@@ -40,12 +40,12 @@ class TypeValidator(BaseValidator):
 
                 if not check_type(value, expected_type):
                     type_name = self._get_type_name(expected_type)
-                    self.add_error(
+                    result.add_error(
                         field=f"{section}.{field}",
                         message=f"Invalid type for {section}.{field}: expected {type_name}, got {type(value).__name__}",
                     )
 
-        return self._create_result()
+        return result
 
     def _get_type_name(self, expected_type: Any) -> str:
         if isinstance(expected_type, tuple):
@@ -0,0 +1,232 @@
+"""Watch mode: keep validating contracts as they change.
+
+Changes are detected by polling a stat index (mtime and size per file), so
+watch mode needs nothing beyond the standard library and behaves the same on
+every platform and filesystem. Only added or modified files are
+re-validated, through one long-lived orchestrator whose caches stay warm,
+and each round reports how the pass/fail state of the tree changed.
+"""
+
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from .constants import WATCH_DEBOUNCE, WATCH_POLL_INTERVAL
+from .employee_validator import EmployeeValidationOrchestrator
+from .utils import Color
+from .validators import ValidationResult
+
+# (st_mtime_ns, st_size) per watched file
+StatIndex = Dict[str, Tuple[int, int]]
+
+
+def scan_stat_index(roots: Iterable[str], suffix: str = ".md") -> StatIndex:
+    """Stat every ``suffix`` file under ``roots``.
+
+    Hidden directories (``.git``, the persistent cache, ...) are skipped.
+    A root may also be a single file.
+
+    Args:
+        roots: Directories or files to index
+        suffix: File name suffix to include
+
+    Returns:
+        Mapping of file path to (mtime_ns, size)
+    """
+    index: StatIndex = {}
+    stack = []
+    for root in roots:
+        if os.path.isfile(root):
+            try:
+                st = os.stat(root)
+            except OSError:
+                continue
+            index[root] = (st.st_mtime_ns, st.st_size)
+        else:
+            stack.append(root)
+
+    while stack:
+        directory = stack.pop()
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir():
+                        if not entry.name.startswith("."):
+                            stack.append(entry.path)
+                    elif entry.name.endswith(suffix) and entry.is_file():
+                        st = entry.stat()
+                        index[entry.path] = (st.st_mtime_ns, st.st_size)
+                except OSError:
+                    continue
+    return index
+
+
+@dataclass
+class WatchReport:
+    """Outcome of one validation round in watch mode."""
+
+    results: Dict[str, ValidationResult] = field(default_factory=dict)
+    newly_failing: List[str] = field(default_factory=list)
+    newly_passing: List[str] = field(default_factory=list)
+    still_failing: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    failing_total: int = 0
+    file_total: int = 0
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.results or self.removed)
+
+
+class WatchSession:
+    """Incrementally re-validates a set of directories.
+
+    ``poll`` rescans the stat index and queues changed files; once no new
+    change has been seen for ``debounce`` seconds the queued files are
+    validated and a ``WatchReport`` is returned. Editors that write a file
+    in several steps therefore trigger one round, not several.
+    """
+
+    def __init__(
+        self,
+        roots: List[str],
+        orchestrator: EmployeeValidationOrchestrator,
+        debounce: float = WATCH_DEBOUNCE,
+        file_filter: Optional[Callable[[List[str]], List[str]]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize watch session.
+
+        Args:
+            roots: Directories (or files) to watch
+            orchestrator: Orchestrator reused for every round
+            debounce: Seconds without new changes before re-validating
+            file_filter: Optional filter applied to discovered files
+            clock: Monotonic time source
+        """
+        self.roots = roots
+        self.orchestrator = orchestrator
+        self.debounce = debounce
+        self.file_filter = file_filter
+        self.clock = clock
+        self._index: StatIndex = {}
+        self._status: Dict[str, bool] = {}
+        self._pending: Set[str] = set()
+        self._pending_removed: Set[str] = set()
+        self._last_change = 0.0
+
+    def _scan(self) -> StatIndex:
+        index = scan_stat_index(self.roots)
+        if self.file_filter is not None:
+            kept = set(self.file_filter(list(index)))
+            index = {path: stat for path, stat in index.items() if path in kept}
+        return index
+
+    def start(self) -> WatchReport:
+        """Index the watched tree and validate every file once."""
+        self._index = self._scan()
+        self._pending = set(self._index)
+        self._pending_removed = set()
+        return self._validate_pending()
+
+    def poll(self) -> Optional[WatchReport]:
+        """Rescan and, once changes have settled, re-validate them.
+
+        Returns:
+            A WatchReport if a round ran, otherwise None
+        """
+        index = self._scan()
+        changed = {path for path, stat in index.items() if self._index.get(path) != stat}
+        removed = self._index.keys() - index.keys()
+        self._index = index
+
+        if changed or removed:
+            self._pending |= changed
+            self._pending -= removed
+            self._pending_removed |= removed
+            self._last_change = self.clock()
+
+        if not (self._pending or self._pending_removed):
+            return None
+        if self.clock() - self._last_change < self.debounce:
+            return None
+        return self._validate_pending()
+
+    def _validate_pending(self) -> WatchReport:
+        report = WatchReport()
+
+        for path in sorted(self._pending_removed):
+            if self._status.pop(path, None) is not None:
+                report.removed.append(path)
+        self._pending_removed = set()
+
+        pending = sorted(self._pending)
+        self._pending = set()
+        for path, result in self.orchestrator.iter_validate(pending, ordered=True):
+            was_valid = self._status.get(path)
+            self._status[path] = result.is_valid
+            report.results[path] = result
+            if result.is_valid:
+                if was_valid is False:
+                    report.newly_passing.append(path)
+            elif was_valid is False:
+                report.still_failing.append(path)
+            else:
+                report.newly_failing.append(path)
+
+        report.file_total = len(self._status)
+        report.failing_total = sum(1 for valid in self._status.values() if not valid)
+        return report
+
+
+def format_watch_report(report: WatchReport) -> str:
+    """Format a watch round as the changes in pass/fail state."""
+    lines = [
+        f"[{time.strftime('%H:%M:%S')}] {len(report.results)} validated, "
+        f"{len(report.removed)} removed: "
+        f"{report.failing_total}/{report.file_total} failing"
+    ]
+
+    for path in report.newly_failing + report.still_failing:
+        result = report.results[path]
+        label = "newly failing" if path in report.newly_failing else "still failing"
+        lines.append(f"  {Color.style('✗', Color.RED)} {label}: {path}")
+        for error in result.errors:
+            lines.append(f"      {Color.style(error.field, Color.BOLD)}: {error.message}")
+    for path in report.newly_passing:
+        lines.append(f"  {Color.style('✓', Color.GREEN)} newly passing: {path}")
+    for path in report.removed:
+        lines.append(f"  - removed: {path}")
+
+    return "\n".join(lines)
+
+
+def run_watch(session: WatchSession, interval: float = WATCH_POLL_INTERVAL) -> int:
+    """Run a watch session until interrupted.
+
+    Args:
+        session: Watch session to drive
+        interval: Seconds between stat scans
+
+    Returns:
+        Exit code (always 0; watch mode ends on Ctrl-C)
+    """
+    roots = ", ".join(str(Path(root)) for root in session.roots)
+    print(format_watch_report(session.start()), flush=True)
+    print(f"Watching {roots} (Ctrl-C to stop)", flush=True)
+    try:
+        while True:
+            time.sleep(interval)
+            report = session.poll()
+            if report is not None and report.changed:
+                print(format_watch_report(report), flush=True)
+    except KeyboardInterrupt:
+        pass
+    return 0
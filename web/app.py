@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import json
 import os
 import re
 from pathlib import Path
-from typing import Any, Dict, List
+from threading import Lock
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import markdown as md
 import yaml
@@ -14,9 +16,18 @@ from pygments import highlight
 from pygments.formatters import HtmlFormatter
 from pygments.lexers import YamlLexer
 
-from tooling.constants import VERSION
+from tooling import (
+    EmployeeValidationOrchestrator,
+    ValidationCache,
+    ValidationError,
+    ValidationResult,
+)
+from tooling.cli import OutputFormatter
+from tooling.constants import MAX_FILE_SIZE, VERSION
 from runtime import Employee
 
+from . import http_cache
+from .render_cache import FileArtifact, RenderCache
 from .spec_doc import build_spec_sections, load_schema
 
 # Allow operators to override the GitHub URL when the canonical repo
@@ -49,6 +60,11 @@ INTEGRATION_PATH = ROOT / "INTEGRATION.md"
 
 app = Flask(__name__, template_folder="templates", static_folder="static")
 app.config["JSON_SORT_KEYS"] = False
+app.json.sort_keys = False  # type: ignore[attr-defined]  # Flask >= 2.3
+# Production serves ETags, 304s, compressed bodies and long-lived static
+# assets (see web/http_cache.py). Dev (`python -m web.app`, or
+# EMPLOYEE_MD_DEV_NO_CACHE=1) sends no-store instead.
+app.config["DEV_NO_CACHE"] = os.environ.get("EMPLOYEE_MD_DEV_NO_CACHE", "0") == "1"
 
 _yaml_lexer = YamlLexer()
 _html_formatter = HtmlFormatter(cssclass="codehilite", linenos=False, nowrap=False)
@@ -116,8 +132,29 @@ def _load_examples() -> List[Dict[str, Any]]:
     return items
 
 
-EXAMPLES: List[Dict[str, Any]] = _load_examples()
-EXAMPLES_BY_SLUG: Dict[str, Dict[str, Any]] = {e["slug"]: e for e in EXAMPLES}
+ExampleIndex = Tuple[List[Dict[str, Any]], Dict[str, Dict[str, Any]]]
+
+
+def _example_files() -> List[Path]:
+    return sorted(EXAMPLES_DIR.glob("*.md"))
+
+
+def _load_example_index() -> ExampleIndex:
+    items = _load_examples()
+    return items, {e["slug"]: e for e in items}
+
+
+# Source files are re-stat'ed per request and reloaded only when one
+# changes; everything derived from them (highlighted YAML, rendered pages)
+# lives in _render_cache, keyed to the artifact objects it was built from.
+_schema: FileArtifact[Dict[str, Any]] = FileArtifact(
+    lambda: [SCHEMA_PATH], lambda: load_schema(SCHEMA_PATH)
+)
+_examples: FileArtifact[ExampleIndex] = FileArtifact(_example_files, _load_example_index)
+_render_cache = RenderCache()
+
+# Snapshot taken at startup (used by scripts/build_static_site.py).
+EXAMPLES, EXAMPLES_BY_SLUG = _examples.get()
 
 
 _COMPARISON_ROW_RE = re.compile(
@@ -204,39 +241,100 @@ def _inject_globals() -> Dict[str, Any]:
     }
 
 
+# Endpoints whose URLs carry `?v=<content hash>` (see _versioned_urls).
+_VERSIONED_ENDPOINTS = ("static", "pygments_css")
+_NO_STORE_ENDPOINTS = ("healthz", "api_validate", "api_validate_batch")
+
+# filename -> ((mtime_ns, size), version)
+_static_versions: Dict[str, Tuple[Tuple[int, int], str]] = {}
+
+
+def _static_version(filename: str) -> Optional[str]:
+    """Short content hash of a static file, recomputed when it changes."""
+    path = Path(app.static_folder or "", filename)
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _static_versions.get(filename)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    version = http_cache.content_etag(path.read_bytes())[:12]
+    _static_versions[filename] = (key, version)
+    return version
+
+
+@app.url_defaults
+def _versioned_urls(endpoint: str, values: Dict[str, Any]) -> None:
+    """Append `?v=<content hash>` to asset URLs so they can be cached forever."""
+    if endpoint == "static" and "filename" in values:
+        version = _static_version(values["filename"])
+        if version:
+            values.setdefault("v", version)
+    elif endpoint == "pygments_css":
+        values.setdefault("v", _PYGMENTS_CSS_VERSION)
+
+
 @app.after_request
-def _disable_cache(resp):  # type: ignore[no-untyped-def]
-    """Hard-disable caching in dev so the Replit preview iframe always sees
-    the latest changes. This is intentionally permissive — production behind
-    Replit Deploy will be served by the same Flask app and is fine without
-    aggressive cache control."""
-    resp.headers["Cache-Control"] = "no-store, no-cache, must-revalidate, max-age=0"
-    resp.headers["Pragma"] = "no-cache"
-    resp.headers["Expires"] = "0"
-    return resp
+def _cache_headers(resp):  # type: ignore[no-untyped-def]
+    """Cache-Control (plus ETag / 304 / compression) for every response."""
+    if app.config["DEV_NO_CACHE"]:
+        # Hard-disable caching in dev so the Replit preview iframe always
+        # sees the latest changes.
+        resp.headers["Cache-Control"] = "no-store, no-cache, must-revalidate, max-age=0"
+        resp.headers["Pragma"] = "no-cache"
+        resp.headers["Expires"] = "0"
+        return resp
+    if request.endpoint in _NO_STORE_ENDPOINTS:
+        cache_control = http_cache.NO_STORE
+    elif request.endpoint in _VERSIONED_ENDPOINTS and request.args.get("v"):
+        cache_control = http_cache.STATIC_CACHE_CONTROL
+    else:
+        cache_control = http_cache.PAGE_CACHE_CONTROL
+    return http_cache.finalize(resp, request, cache_control)
+
+
+def _cached_page(inputs: Tuple[Any, ...], render: Callable[[], str]) -> str:
+    """`render()` for this URL, reused while `inputs` are the current artifacts.
+
+    The key includes the URL root because templates embed it (canonical
+    and Open Graph URLs).
+    """
+    return _render_cache.memo(("page", request.url_root, request.path), inputs, render)
+
+
+def _spec_sections(schema: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return _render_cache.memo("spec_sections", (schema,), lambda: build_spec_sections(schema))
 
 
 @app.route("/")
 def index() -> str:
-    schema = load_schema(SCHEMA_PATH)
-    return render_template(
-        "index.html",
-        comparison=_COMPARISON_ROWS,
-        example_count=len([e for e in EXAMPLES if not e["is_guide"]]),
-        section_count=len(schema.get("properties", {})),
-        test_count=288,
+    schema = _schema.get()
+    items, _ = _examples.get()
+    return _cached_page(
+        (schema, items),
+        lambda: render_template(
+            "index.html",
+            comparison=_COMPARISON_ROWS,
+            example_count=len([e for e in items if not e["is_guide"]]),
+            section_count=len(schema.get("properties", {})),
+            test_count=288,
+        ),
     )
 
 
 @app.route("/spec")
 def spec() -> str:
-    schema = load_schema(SCHEMA_PATH)
-    sections = build_spec_sections(schema)
-    return render_template(
-        "spec.html",
-        sections=sections,
-        spec_title=schema.get("title", "Employee.md Configuration"),
-        spec_version=schema.get("version", VERSION),
+    schema = _schema.get()
+    return _cached_page(
+        (schema,),
+        lambda: render_template(
+            "spec.html",
+            sections=_spec_sections(schema),
+            spec_title=schema.get("title", "Employee.md Configuration"),
+            spec_version=schema.get("version", VERSION),
+        ),
     )
 
 
@@ -256,30 +354,62 @@ def _yaml_preview(text: str, max_lines: int = 12) -> str:
     return highlight(snippet, _yaml_lexer, _html_formatter)
 
 
+def _example_previews(index: ExampleIndex) -> List[Dict[str, Any]]:
+    return _render_cache.memo(
+        "example_previews",
+        (index,),
+        lambda: [{**e, "preview": _yaml_preview(e["raw"])} for e in index[0] if not e["is_guide"]],
+    )
+
+
+def _example_highlighted(index: ExampleIndex, slug: str) -> str:
+    return _render_cache.memo(
+        ("example_highlighted", slug), (index,), lambda: _highlight_yaml(index[1][slug]["raw"])
+    )
+
+
 @app.route("/examples")
 def examples() -> str:
-    specs = [
-        {**e, "preview": _yaml_preview(e["raw"])}
-        for e in EXAMPLES
-        if not e["is_guide"]
-    ]
-    guides = [e for e in EXAMPLES if e["is_guide"]]
-    return render_template("examples.html", specs=specs, guides=guides)
+    index = _examples.get()
+    return _cached_page(
+        (index,),
+        lambda: render_template(
+            "examples.html",
+            specs=_example_previews(index),
+            guides=[e for e in index[0] if e["is_guide"]],
+        ),
+    )
 
 
 @app.route("/examples/<slug>")
 def example_detail(slug: str) -> str:
-    item = EXAMPLES_BY_SLUG.get(slug)
+    index = _examples.get()
+    item = index[1].get(slug)
     if not item:
         abort(404)
-    highlighted = _highlight_yaml(item["raw"])
-    return render_template(
-        "example_detail.html",
-        item=item,
-        highlighted=highlighted,
+    return _cached_page(
+        (index,),
+        lambda: render_template(
+            "example_detail.html",
+            item=item,
+            highlighted=_example_highlighted(index, slug),
+        ),
     )
 
 
+def _warm_render_cache() -> None:
+    """Build the derived artifacts up front so first requests don't pay for them."""
+    index = _examples.get()
+    _spec_sections(_schema.get())
+    _example_previews(index)
+    for slug, item in index[1].items():
+        if not item["is_guide"]:
+            _example_highlighted(index, slug)
+
+
+_warm_render_cache()
+
+
 @app.route("/why")
 def why() -> str:
     return render_template("why.html")
@@ -380,7 +510,7 @@ def sitemap_xml():  # type: ignore[no-untyped-def]
         ("/runtime", "0.7"),
         ("/docs", "0.7"),
     ]
-    for ex in EXAMPLES:
+    for ex in _examples.get()[0]:
         if ex.get("is_guide"):
             continue
         pages.append((f"/examples/{ex['slug']}", "0.6"))
@@ -400,17 +530,38 @@ def sitemap_xml():  # type: ignore[no-untyped-def]
     return body, 200, {"Content-Type": "application/xml; charset=utf-8"}
 
 
-@app.route("/runtime")
-def runtime_page() -> str:
-    """Showcase the runtime/ reference SDK with a live system-prompt demo."""
+# (mtime_ns, size) of the sample contract -> (yaml text, rendered prompt)
+_runtime_sample_cache: Dict[Tuple[int, int], Tuple[str, str]] = {}
+
+
+def _runtime_sample() -> Tuple[str, str]:
+    """Sample contract and its system prompt, re-rendered only when the file changes."""
     sample_path = EXAMPLES_DIR / "senior-dev.md"
-    sample_yaml = sample_path.read_text(encoding="utf-8") if sample_path.exists() else ""
+    try:
+        st = sample_path.stat()
+    except OSError:
+        return "", ""
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _runtime_sample_cache.get(key)
+    if cached is not None:
+        return cached
+
+    sample_yaml = sample_path.read_text(encoding="utf-8")
     sample_prompt = ""
     if sample_yaml:
         try:
             sample_prompt = Employee.from_yaml(sample_yaml).system_prompt()
         except Exception:  # noqa: BLE001 - defensive; demo only
             sample_prompt = ""
+    _runtime_sample_cache.clear()
+    _runtime_sample_cache[key] = (sample_yaml, sample_prompt)
+    return sample_yaml, sample_prompt
+
+
+@app.route("/runtime")
+def runtime_page() -> str:
+    """Showcase the runtime/ reference SDK with a live system-prompt demo."""
+    sample_yaml, sample_prompt = _runtime_sample()
     return render_template(
         "runtime.html",
         sample_yaml=sample_yaml,
@@ -423,15 +574,142 @@ def docs() -> str:
     return render_template("docs.html")
 
 
+# ---- validation API -----------------------------------------------------
+
+# Results are cached by content hash; size the cache for the distinct
+# contracts the API sees within the TTL.
+API_CACHE_SIZE = int(os.environ.get("EMPLOYEE_MD_API_CACHE_SIZE", "1024"))
+
+_orchestrator: Optional[EmployeeValidationOrchestrator] = None
+_orchestrator_lock = Lock()
+
+
+def _get_orchestrator() -> EmployeeValidationOrchestrator:
+    """One warm orchestrator for every API request (validators are stateless)."""
+    global _orchestrator
+    with _orchestrator_lock:
+        if _orchestrator is None:
+            # Its own cache: the process-wide one belongs to tooling.config
+            # and any embedding code.
+            _orchestrator = EmployeeValidationOrchestrator(
+                use_cache=True, cache=ValidationCache(max_size=API_CACHE_SIZE)
+            )
+        return _orchestrator
+
+
+def _validate_content(content: Any) -> ValidationResult:
+    """Validate one contract; a section of the wrong shape is an invalid result.
+
+    The validators raise on e.g. `role: 5` (as in `Employee._enforce_validation`);
+    report that for this contract instead of failing the request.
+    """
+    try:
+        return _get_orchestrator().validate_content(content)
+    except (TypeError, AttributeError, KeyError) as exc:
+        return ValidationResult(
+            is_valid=False,
+            errors=[
+                ValidationError(
+                    field="file",
+                    message=(
+                        "employee.md is structurally invalid: "
+                        f"{exc.__class__.__name__}: {exc}"
+                    ),
+                    severity="error",
+                )
+            ],
+        )
+
+
+def _api_error(message: str, status: int):  # type: ignore[no-untyped-def]
+    return jsonify({"error": message}), status
+
+
+def _read_body() -> Optional[bytes]:
+    """The raw request body, or None if it is larger than MAX_FILE_SIZE."""
+    if request.content_length is not None and request.content_length > MAX_FILE_SIZE:
+        return None
+    body = request.stream.read(MAX_FILE_SIZE + 1)
+    return None if len(body) > MAX_FILE_SIZE else body
+
+
+def _too_large():  # type: ignore[no-untyped-def]
+    return _api_error(f"Request body too large (max: {MAX_FILE_SIZE} bytes)", 413)
+
+
+@app.route("/api/validate", methods=["POST"])
+def api_validate():  # type: ignore[no-untyped-def]
+    """Validate one contract.
+
+    The body is the employee.md YAML itself, or a JSON object
+    `{"content": "...", "filename": "..."}`; `?filename=` labels a raw body.
+    Responds with the `--format json` object of the CLI.
+    """
+    body = _read_body()
+    if body is None:
+        return _too_large()
+    filename = request.args.get("filename")
+    content: Any = body
+    if request.is_json:
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            return _api_error("Request body is not valid JSON", 400)
+        if not isinstance(payload, dict) or not isinstance(payload.get("content"), str):
+            return _api_error('Expected a JSON object with a string "content"', 400)
+        content = payload["content"]
+        filename = payload.get("filename") or filename
+    result = _validate_content(content)
+    return jsonify(OutputFormatter.to_dict(result, filename))
+
+
+@app.route("/api/validate/batch", methods=["POST"])
+def api_validate_batch():  # type: ignore[no-untyped-def]
+    """Validate several contracts in one request.
+
+    The body is a JSON array whose items are YAML strings or
+    `{"content": "...", "filename": "..."}` objects. Responds with the
+    `--format json` array of the CLI, in request order.
+    """
+    body = _read_body()
+    if body is None:
+        return _too_large()
+    try:
+        payload = json.loads(body)
+    except ValueError:
+        return _api_error("Request body is not valid JSON", 400)
+    if not isinstance(payload, list):
+        return _api_error("Expected a JSON array of contracts", 400)
+
+    items: List[Tuple[str, Optional[str]]] = []
+    for index, item in enumerate(payload):
+        if isinstance(item, str):
+            items.append((item, None))
+        elif isinstance(item, dict) and isinstance(item.get("content"), str):
+            items.append((item["content"], item.get("filename")))
+        else:
+            return _api_error(f'Item {index}: expected a string or a "content" object', 400)
+
+    return jsonify(
+        [
+            OutputFormatter.to_dict(_validate_content(content), filename)
+            for content, filename in items
+        ]
+    )
+
+
 @app.route("/healthz")
 def healthz():  # type: ignore[no-untyped-def]
     return jsonify({"status": "ok", "version": VERSION})
 
 
+_PYGMENTS_CSS = _html_formatter.get_style_defs(".codehilite")
+_PYGMENTS_CSS_VERSION = http_cache.content_etag(_PYGMENTS_CSS.encode("utf-8"))[:12]
+
+
 @app.route("/pygments.css")
 def pygments_css():  # type: ignore[no-untyped-def]
-    css = _html_formatter.get_style_defs(".codehilite")
-    return css, 200, {"Content-Type": "text/css; charset=utf-8"}
+    return _PYGMENTS_CSS, 200, {"Content-Type": "text/css; charset=utf-8"}
 
 
 _FAVICON = (
@@ -454,4 +732,5 @@ def create_app() -> Flask:
 
 
 if __name__ == "__main__":
+    app.config["DEV_NO_CACHE"] = os.environ.get("EMPLOYEE_MD_DEV_NO_CACHE", "1") == "1"
     app.run(host="0.0.0.0", port=5000, debug=False)
@@ -0,0 +1,137 @@
+"""Production HTTP caching: content-hash ETags, 304s and compressed bodies.
+
+Every GET page on the site is derived from files in the repo, so a
+response body only changes when the deploy does. `finalize` turns such a
+response into one a CDN or browser can keep:
+
+  - a strong ETag from a hash of the body, and a 304 for a matching
+    `If-None-Match`, so revalidation costs a hash rather than a transfer;
+  - `Cache-Control` chosen by the caller (`STATIC_CACHE_CONTROL` for
+    URLs carrying a content hash, `PAGE_CACHE_CONTROL` otherwise);
+  - a gzip body (brotli when the optional `brotli` package is installed
+    and the client accepts it), compressed once per ETag and then served
+    from memory.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Optional, Tuple
+
+try:
+    import brotli  # type: ignore[import-not-found]
+except ImportError:  # optional: `pip install brotli`
+    brotli = None
+
+STATIC_MAX_AGE = 365 * 24 * 3600
+PAGE_MAX_AGE = 300
+
+# For URLs that change whenever their content does (`?v=<hash>`).
+STATIC_CACHE_CONTROL = f"public, max-age={STATIC_MAX_AGE}, immutable"
+# For everything else: short freshness, then revalidate with the ETag.
+PAGE_CACHE_CONTROL = f"public, max-age={PAGE_MAX_AGE}"
+NO_STORE = "no-store"
+
+# Bodies below this size gain less from compression than the header costs.
+MIN_COMPRESS_SIZE = 512
+COMPRESSIBLE_TYPES = (
+    "text/",
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+)
+# Compressed bodies kept in memory, keyed by (ETag, encoding).
+ENCODED_CACHE_SIZE = 256
+
+_encoded: "OrderedDict[Tuple[str, str], bytes]" = OrderedDict()
+_encoded_lock = Lock()
+
+
+def content_etag(body: bytes) -> str:
+    """Strong validator for `body` (hex digest, unquoted)."""
+    return hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+def choose_encoding(request: Any) -> Optional[str]:
+    """The best encoding `request` accepts: "br", "gzip" or None."""
+    accepted = request.accept_encodings
+    if brotli is not None and accepted["br"]:
+        return "br"
+    if accepted["gzip"]:
+        return "gzip"
+    return None
+
+
+def _compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body)
+    # mtime=0 keeps the output (and so the ETag) identical across workers.
+    return gzip.compress(body, compresslevel=9, mtime=0)
+
+
+def encode(body: bytes, encoding: str, etag: str) -> bytes:
+    """`body` compressed with `encoding`, computed once per `etag`."""
+    key = (etag, encoding)
+    with _encoded_lock:
+        cached = _encoded.get(key)
+        if cached is not None:
+            _encoded.move_to_end(key)
+            return cached
+    compressed = _compress(body, encoding)
+    with _encoded_lock:
+        _encoded[key] = compressed
+        while len(_encoded) > ENCODED_CACHE_SIZE:
+            _encoded.popitem(last=False)
+    return compressed
+
+
+def clear() -> None:
+    """Drop every cached compressed body."""
+    with _encoded_lock:
+        _encoded.clear()
+
+
+def _compressible(response: Any) -> bool:
+    mimetype = response.mimetype or ""
+    return (
+        "Content-Encoding" not in response.headers
+        and any(mimetype.startswith(prefix) for prefix in COMPRESSIBLE_TYPES)
+    )
+
+
+def finalize(response: Any, request: Any, cache_control: str) -> Any:
+    """Add caching headers to a 200 GET/HEAD `response` (others: no-store).
+
+    Args:
+        response: The Flask response about to be sent
+        request: The request it answers
+        cache_control: `Cache-Control` value for a cacheable response
+
+    Returns:
+        The response, turned into a 304 if the client's copy is current
+    """
+    if request.method not in ("GET", "HEAD") or response.status_code != 200:
+        response.headers["Cache-Control"] = NO_STORE
+        return response
+    response.headers["Cache-Control"] = cache_control
+    if cache_control == NO_STORE:
+        return response
+
+    # File responses stream by default; the site's files are small.
+    response.direct_passthrough = False
+    body = response.get_data()
+    etag = content_etag(body)
+    if _compressible(response):
+        response.vary.add("Accept-Encoding")
+        encoding = choose_encoding(request) if len(body) >= MIN_COMPRESS_SIZE else None
+        if encoding is not None:
+            # Each representation needs its own strong validator.
+            etag = f"{etag}-{encoding}"
+            response.set_data(encode(body, encoding, etag))
+            response.headers["Content-Encoding"] = encoding
+    response.set_etag(etag)
+    return response.make_conditional(request)
@@ -0,0 +1,133 @@
+"""Render cache for pages derived from repo files.
+
+The schema reference, the examples gallery and the example pages are pure
+functions of tooling/schema.json, examples/*.md and the templates. Two
+pieces keep that work off the request path:
+
+  - `FileArtifact` holds a value built from a set of files and rebuilds it
+    when any of their (mtime, size) changes (or a file appears or
+    disappears);
+  - `RenderCache.memo` keeps a value derived from such artifacts (section
+    tables, highlighted YAML, a rendered page) for as long as the exact
+    artifact objects it was built from are current.
+
+Because `memo` entries are validated by identity against their inputs, a
+rebuilt artifact invalidates everything derived from it without any
+bookkeeping.
+"""
+
+from __future__ import annotations
+
+import os
+from collections import OrderedDict
+from pathlib import Path
+from threading import Lock
+from typing import Any, Callable, Generic, Hashable, Iterable, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+RENDER_CACHE_SIZE = 256
+
+Signature = Tuple[Tuple[str, int, int], ...]
+
+
+def stat_signature(paths: Iterable[Path]) -> Signature:
+    """(path, mtime_ns, size) of each of `paths`; missing files count as (-1, -1)."""
+    signature = []
+    for path in paths:
+        try:
+            st = os.stat(path)
+            signature.append((str(path), st.st_mtime_ns, st.st_size))
+        except OSError:
+            signature.append((str(path), -1, -1))
+    return tuple(signature)
+
+
+class FileArtifact(Generic[T]):
+    """A value built from files, rebuilt when one of them changes."""
+
+    def __init__(self, inputs: Callable[[], Iterable[Path]], build: Callable[[], T]) -> None:
+        """
+        Initialize the artifact (built on first `get`).
+
+        Args:
+            inputs: Returns the files the value is built from; called on
+                every `get`, so it should be cheap (a glob is fine)
+            build: Builds the value from those files
+        """
+        self._inputs = inputs
+        self._build = build
+        self._lock = Lock()
+        self._signature: Optional[Signature] = None
+        self._value: Optional[T] = None
+
+    def get(self) -> T:
+        """The current value, rebuilt first if an input changed."""
+        signature = stat_signature(self._inputs())
+        if signature != self._signature:
+            with self._lock:
+                if signature != self._signature:
+                    self._value = self._build()
+                    self._signature = signature
+        return self._value  # type: ignore[return-value]
+
+    def invalidate(self) -> None:
+        """Force a rebuild on the next `get`."""
+        with self._lock:
+            self._signature = None
+            self._value = None
+
+
+class RenderCache:
+    """Bounded LRU of values derived from artifacts, keyed by name."""
+
+    def __init__(self, max_size: int = RENDER_CACHE_SIZE) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of values kept
+        """
+        self.max_size = max_size
+        self.enabled = True
+        self._entries: "OrderedDict[Hashable, Tuple[Tuple[Any, ...], Any]]" = OrderedDict()
+        self._lock = Lock()
+
+    def memo(self, key: Hashable, inputs: Tuple[Any, ...], build: Callable[[], T]) -> T:
+        """The value cached under `key`, if it was built from `inputs`.
+
+        Args:
+            key: Name of the value (e.g. the page URL)
+            inputs: Artifact values the value is derived from; compared by
+                identity, so pass what `FileArtifact.get` returned
+            build: Builds the value on a miss
+
+        Returns:
+            The cached or freshly built value
+        """
+        if not self.enabled:
+            return build()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and _same(entry[0], inputs):
+                self._entries.move_to_end(key)
+                return entry[1]  # type: ignore[no-any-return]
+        value = build()
+        with self._lock:
+            self._entries[key] = (inputs, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        """Drop every cached value."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _same(cached: Tuple[Any, ...], current: Tuple[Any, ...]) -> bool:
+    return len(cached) == len(current) and all(a is b for a, b in zip(cached, current))